@@ -0,0 +1,73 @@
+"""Benchmark of building a large graph edge by edge and in bulk.
+
+The same random layered graph is built twice: by calling succeed for
+each node, and by a single DagStream.add_edges call.
+
+Usage
+-----
+python benchmarks/bench_bulk_edges.py --n-nodes 125000 --fan-in 4 --shuffle
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import time
+
+from dagstream import DagStream
+
+
+def noop(*args: int) -> int:
+    return 0
+
+
+def build(edges: list[tuple[int, int]], n_nodes: int, bulk: bool) -> float:
+    stream = DagStream()
+    nodes = stream.emplace(*[noop for _ in range(n_nodes)])
+    start = time.perf_counter()
+    if bulk:
+        stream.add_edges((nodes[i], nodes[j], True) for i, j in edges)
+    else:
+        for from_index, to_index in edges:
+            nodes[to_index].succeed(nodes[from_index], pipe=True)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-nodes", type=int, default=125_000)
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--fan-in", type=int, default=4)
+    parser.add_argument(
+        "--shuffle",
+        action="store_true",
+        help="number nodes randomly, so that edges go against the order"
+        " in which nodes are emplaced",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    edges = [
+        (j, i)
+        for i in range(args.width, args.n_nodes)
+        for j in rng.sample(range(i - args.width, i), args.fan_in)
+    ]
+    if args.shuffle:
+        numbers = list(range(args.n_nodes))
+        rng.shuffle(numbers)
+        edges = [(numbers[i], numbers[j]) for i, j in edges]
+
+    # Graphs refer to themselves, so the previous one is collected
+    # before measuring the next one.
+    one_by_one = build(edges, args.n_nodes, bulk=False)
+    gc.collect()
+    bulk = build(edges, args.n_nodes, bulk=True)
+
+    print(f"nodes: {args.n_nodes}, edges: {len(edges)}")
+    print(f"succeed for each edge: {one_by_one:.2f} s")
+    print(f"add_edges:             {bulk:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark of scheduler overhead with and without a compiled plan.
+
+A layered dag of no-op functions is run by StreamExecutor, so that
+elapsed time is dominated by scheduling. Running node states is
+compared with running the ExecutionPlan built by construct(compile=True).
+
+Usage
+-----
+python benchmarks/bench_execution_plan.py --n-layers 500 --width 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from dagstream import DagStream
+from dagstream.executor import StreamExecutor
+
+
+def noop(*args: int) -> int:
+    return 0
+
+
+def build_stream(n_layers: int, width: int, fan_in: int) -> DagStream:
+    rng = random.Random(0)
+    stream = DagStream()
+    layers = [
+        stream.emplace(*[noop for _ in range(width)]) for _ in range(n_layers)
+    ]
+    for upper, lower in zip(layers[:-1], layers[1:]):
+        for node in lower:
+            node.succeed(*rng.sample(upper, fan_in), pipe=True)
+    return stream
+
+
+def measure(executor: StreamExecutor, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        executor.run()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-layers", type=int, default=500)
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--fan-in", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stream = build_stream(args.n_layers, args.width, args.fan_in)
+    n_nodes = args.n_layers * args.width
+
+    generic = measure(StreamExecutor(stream.construct()), args.repeat)
+
+    start = time.perf_counter()
+    functional_dag = stream.construct(compile=True)
+    compile_time = time.perf_counter() - start
+    compiled = measure(StreamExecutor(functional_dag), args.repeat)
+
+    print(f"nodes: {n_nodes}")
+    print(f"node states:   {generic / n_nodes * 1e6:.2f} us per node")
+    print(f"compiled plan: {compiled / n_nodes * 1e6:.2f} us per node")
+    print(f"construct(compile=True): {compile_time * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
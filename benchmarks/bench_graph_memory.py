@@ -0,0 +1,55 @@
+"""Benchmark of memory held by graph metadata.
+
+A layered dag is built from many nodes of the same function, and
+memory allocated while connecting them is measured by tracemalloc.
+Bytes per node and bytes per edge are printed.
+
+Usage
+-----
+python benchmarks/bench_graph_memory.py --n-nodes 100000 --fan-in 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tracemalloc
+
+from dagstream import DagStream
+
+
+def noop(*args: int) -> int:
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-nodes", type=int, default=100_000)
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--fan-in", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    functions = [noop for _ in range(args.n_nodes)]
+
+    tracemalloc.start()
+    stream = DagStream()
+    nodes = stream.emplace(*functions)
+    node_bytes, _ = tracemalloc.get_traced_memory()
+
+    for i in range(args.width, args.n_nodes):
+        lower = max(0, i - args.width)
+        predecessors = rng.sample(nodes[lower:i], args.fan_in)
+        nodes[i].succeed(*predecessors, pipe=True)
+    total_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n_edges = (args.n_nodes - args.width) * args.fan_in
+    edge_bytes = total_bytes - node_bytes
+    print(f"nodes: {args.n_nodes}, edges: {n_edges}")
+    print(f"bytes per node: {node_bytes / args.n_nodes:.1f}")
+    print(f"bytes per edge: {edge_bytes / n_edges:.1f}")
+
+
+if __name__ == "__main__":
+    main()
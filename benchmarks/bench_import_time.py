@@ -0,0 +1,77 @@
+"""Benchmark of start-up cost of importing dagstream.
+
+Each statement is timed in a new interpreter, which is run with
+`python -X importtime` to list imported modules. Modules which are
+slow to import, such as multiprocessing and asyncio, are reported when
+the statement imports them.
+
+Usage
+-----
+python benchmarks/bench_import_time.py --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+STATEMENTS = (
+    "import dagstream",
+    "from dagstream import DagStream",
+    "from dagstream import StreamExecutor",
+)
+HEAVY_MODULES = (
+    "asyncio",
+    "multiprocessing",
+    "sqlite3",
+    "tempfile",
+    "importlib.metadata",
+)
+
+
+def measure(statement: str) -> tuple[float, list[str]]:
+    """Import time in seconds and heavy modules imported by statement."""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            TIMER.format(statement=statement),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Name of module is the last column of output of -X importtime
+    modules = {
+        line.split("|")[-1].strip()
+        for line in completed.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    heavy = [module for module in HEAVY_MODULES if module in modules]
+    return float(completed.stdout), heavy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    for statement in STATEMENTS:
+        # The best of repeats excludes noise such as cold file caches
+        results = [measure(statement) for _ in range(args.repeat)]
+        best = min(elapsed for elapsed, _ in results)
+        heavy = ", ".join(results[0][1]) or "-"
+        print(f"{statement:<40} {best * 1e3:7.1f} ms  heavy: {heavy}")
+
+
+if __name__ == "__main__":
+    main()
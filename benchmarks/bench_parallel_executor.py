@@ -0,0 +1,62 @@
+"""Benchmark of parent cpu time in StreamParallelExecutor.
+
+The parent process only dispatches functions and collects results.
+While worker processes compute, it should not consume cpu time.
+
+Usage
+-----
+python benchmarks/bench_parallel_executor.py --n-nodes 8 --sleep 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from dagstream import DagStream
+from dagstream.executor import StreamParallelExecutor, StreamWorkerPool
+
+
+def sleep_node(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def build_stream(n_nodes: int) -> DagStream:
+    stream = DagStream()
+    nodes = stream.emplace(*[sleep_node for _ in range(n_nodes)])
+    # chain of nodes, so that completion latency accumulates
+    for prev_node, next_node in zip(nodes[:-1], nodes[1:], strict=True):
+        prev_node.precede(next_node)
+    return stream
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-nodes", type=int, default=8)
+    parser.add_argument("--n-process", type=int, default=2)
+    parser.add_argument("--sleep", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stream = build_stream(args.n_nodes)
+    ideal = args.n_nodes * args.sleep
+
+    with StreamWorkerPool(args.n_process) as pool:
+        for i in range(args.repeat):
+            executor = StreamParallelExecutor(stream.construct(), pool=pool)
+
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            executor.run(args.sleep)
+            cpu_time = time.process_time() - cpu_start
+            wall_time = time.perf_counter() - wall_start
+
+            print(
+                f"run {i}: wall {wall_time:.4f} s "
+                f"(overhead {wall_time - ideal:.4f} s), "
+                f"parent cpu {cpu_time:.4f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark of per-run overhead when a FunctionalDag is reused.
+
+A layered dag of no-op functions is run repeatedly. Constructing
+a new FunctionalDag for every run is compared with running the
+same FunctionalDag again, which only resets its state.
+
+Usage
+-----
+python benchmarks/bench_reuse_dag.py --n-layers 100 --width 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from dagstream import DagStream
+from dagstream.executor import StreamExecutor
+
+
+def noop(*args: int) -> int:
+    return 0
+
+
+def build_stream(n_layers: int, width: int, fan_in: int) -> DagStream:
+    rng = random.Random(0)
+    stream = DagStream()
+    layers = [
+        stream.emplace(*[noop for _ in range(width)]) for _ in range(n_layers)
+    ]
+    for upper, lower in zip(layers[:-1], layers[1:]):
+        for node in lower:
+            node.succeed(*rng.sample(upper, fan_in), pipe=True)
+    return stream
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-layers", type=int, default=100)
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--fan-in", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stream = build_stream(args.n_layers, args.width, args.fan_in)
+    n_nodes = args.n_layers * args.width
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        StreamExecutor(stream.construct()).run()
+    construct_each = (time.perf_counter() - start) / args.repeat
+
+    executor = StreamExecutor(stream.construct())
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        executor.run()
+    reuse = (time.perf_counter() - start) / args.repeat
+
+    functional_dag = stream.construct()
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        functional_dag.reset()
+    reset = (time.perf_counter() - start) / args.repeat
+
+    print(f"nodes: {n_nodes}")
+    print(f"construct and run: {construct_each * 1e3:.1f} ms per run")
+    print(f"reuse and run:     {reuse * 1e3:.1f} ms per run")
+    print(f"reset only:        {reset * 1e3:.1f} ms per run")
+
+
+if __name__ == "__main__":
+    main()
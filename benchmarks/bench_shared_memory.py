@@ -0,0 +1,71 @@
+"""Benchmark of SharedMemoryTransport in StreamParallelExecutor.
+
+A large numpy.ndarray flows through a chain of functions.
+Without transport, it is pickled and copied through pipes at every edge.
+
+Usage
+-----
+python benchmarks/bench_shared_memory.py --size-mb 512 --n-nodes 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from dagstream import DagStream
+from dagstream.executor import StreamParallelExecutor, StreamWorkerPool
+from dagstream.transports import SharedMemoryTransport
+
+
+def create(size_mb: int) -> np.ndarray:
+    return np.ones(size_mb * 1024 * 1024 // 8)
+
+
+def reduce_sum(array: np.ndarray) -> np.ndarray:
+    # small computation compared to the size of data
+    return array[:1024] + array.sum()
+
+
+def forward(array: np.ndarray) -> np.ndarray:
+    return array
+
+
+def build_stream(n_nodes: int) -> DagStream:
+    stream = DagStream()
+    first, *others, last = stream.emplace(
+        create, *[forward for _ in range(n_nodes)], reduce_sum
+    )
+    nodes = [first, *others, last]
+    for prev_node, next_node in zip(nodes[:-1], nodes[1:], strict=True):
+        prev_node.precede(next_node, pipe=True)
+    return stream
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=512)
+    parser.add_argument("--n-nodes", type=int, default=4)
+    parser.add_argument("--n-process", type=int, default=2)
+    args = parser.parse_args()
+
+    stream = build_stream(args.n_nodes)
+
+    with StreamWorkerPool(args.n_process) as pool:
+        for name, transport in [
+            ("pickle", None),
+            ("shared_memory", SharedMemoryTransport()),
+        ]:
+            executor = StreamParallelExecutor(
+                stream.construct(), pool=pool, transport=transport
+            )
+            start = time.perf_counter()
+            executor.run(first_args=(args.size_mb,))
+            elapsed = time.perf_counter() - start
+            print(f"{name}: {elapsed:.4f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark of repeated extraction of sub graphs.
+
+construct(mandatory_nodes=...) is called many times with random target
+sets against one layered master graph. The first round computes
+ancestors of targets, and later rounds reuse cached ancestors.
+
+Usage
+-----
+python benchmarks/bench_subgraph_extraction.py --n-layers 100 --width 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from dagstream import DagStream
+
+
+def noop(*args: int) -> int:
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-layers", type=int, default=100)
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--fan-in", type=int, default=2)
+    parser.add_argument("--n-targets", type=int, default=5)
+    parser.add_argument("--n-calls", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    stream = DagStream()
+    layers = [
+        stream.emplace(*[noop for _ in range(args.width)])
+        for _ in range(args.n_layers)
+    ]
+    for upper, lower in zip(layers[:-1], layers[1:], strict=True):
+        for node in lower:
+            node.succeed(*rng.sample(upper, args.fan_in), pipe=True)
+
+    nodes = [node for layer in layers for node in layer]
+    target_sets = [
+        set(rng.sample(nodes, args.n_targets)) for _ in range(args.n_calls)
+    ]
+
+    for label in ["first round", "second round"]:
+        start = time.perf_counter()
+        for targets in target_sets:
+            stream.construct(mandatory_nodes=targets)
+        elapsed = (time.perf_counter() - start) / args.n_calls
+        print(f"{label}: {elapsed * 1e3:.2f} ms per construct")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark of task transfer cost in StreamParallelExecutor.
+
+Many small functions which hold large bound data are run.
+The function table is sent to each worker once per run,
+so that the cost should not grow with the size of bound data per task.
+
+Usage
+-----
+python benchmarks/bench_task_pickling.py --n-nodes 1000 --payload-kb 256
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import time
+
+from dagstream import DagStream
+from dagstream.executor import StreamParallelExecutor, StreamWorkerPool
+
+
+def small_node(payload: bytes, *args: int) -> int:
+    return len(payload)
+
+
+def build_stream(n_nodes: int, payload_kb: int) -> DagStream:
+    # All nodes share one large object, like closures of a builder.
+    payload = bytes(payload_kb * 1024)
+    stream = DagStream()
+    stream.emplace(
+        *[functools.partial(small_node, payload) for _ in range(n_nodes)]
+    )
+    return stream
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-nodes", type=int, default=1000)
+    parser.add_argument("--payload-kb", type=int, default=256)
+    parser.add_argument("--n-process", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stream = build_stream(args.n_nodes, args.payload_kb)
+
+    with StreamWorkerPool(args.n_process) as pool:
+        for i in range(args.repeat):
+            executor = StreamParallelExecutor(stream.construct(), pool=pool)
+
+            start = time.perf_counter()
+            executor.run()
+            elapsed = time.perf_counter() - start
+            print(
+                f"run {i}: {elapsed:.4f} s, "
+                f"{elapsed / args.n_nodes * 1e6:.1f} us per node"
+            )
+
+
+if __name__ == "__main__":
+    main()
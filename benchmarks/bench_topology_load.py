@@ -0,0 +1,67 @@
+"""Benchmark of loading a saved topology against building it in Python.
+
+A random layered graph is built by emplace and succeed, saved by
+DagStream.save, and loaded by DagStream.load. Functions are imported
+lazily, so loading does not import modules of functions.
+
+Usage
+-----
+python benchmarks/bench_topology_load.py --n-nodes 100000 --fan-in 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from dagstream import DagStream
+
+
+def noop(*args: int) -> int:
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n-nodes", type=int, default=100_000)
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--fan-in", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    edges = [
+        (j, i)
+        for i in range(args.width, args.n_nodes)
+        for j in rng.sample(range(i - args.width, i), args.fan_in)
+    ]
+
+    start = time.perf_counter()
+    stream = DagStream()
+    nodes = stream.emplace(*[noop for _ in range(args.n_nodes)])
+    for from_index, to_index in edges:
+        nodes[to_index].succeed(nodes[from_index], pipe=True)
+    build = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "topology.json")
+        start = time.perf_counter()
+        stream.save(path)
+        save = time.perf_counter() - start
+        file_size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        _ = DagStream.load(path)
+        load = time.perf_counter() - start
+
+    print(f"nodes: {args.n_nodes}, edges: {len(edges)}")
+    print(f"file size: {file_size / 1e6:.1f} MB")
+    print(f"build in Python: {build:.2f} s")
+    print(f"save:            {save:.2f} s")
+    print(f"load:            {load:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,21 @@
-# flake8: noqa
-from dagstream.dagstream import DagStream
-from dagstream.executor import StreamExecutor
-from dagstream.version import __version__
+from typing import TYPE_CHECKING
+
+from dagstream.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from dagstream.dagstream import DagStream  # NOQA
+    from dagstream.executor import StreamExecutor  # NOQA
+    from dagstream.version import __version__  # NOQA
+
+# Executors pull in threads, asyncio and multiprocessing, and reading
+# the version pulls in importlib.metadata. They are imported on first
+# access, so that `import dagstream` is cheap in CLI tools and workers.
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DagStream": "dagstream.dagstream",
+        "StreamExecutor": "dagstream.executor",
+        "__version__": "dagstream.version",
+    },
+)
+__all__ = ["DagStream", "StreamExecutor", "__version__"]
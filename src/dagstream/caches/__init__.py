@@ -0,0 +1,13 @@
+from typing import TYPE_CHECKING
+
+from dagstream.utils.lazy_import import lazy_attributes
+
+from .fingerprint import make_cache_key  # NOQA
+from .interface import IResultCache  # NOQA
+from .memory_cache import MemoryCache  # NOQA
+
+if TYPE_CHECKING:
+    from .disk_cache import DiskCache  # NOQA
+
+# DiskCache imports sqlite3
+__getattr__, __dir__ = lazy_attributes(__name__, {"DiskCache": ".disk_cache"})
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any
+
+from .interface import IResultCache
+
+
+class DiskCache(IResultCache):
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_nbytes: int | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        """Cache results in files indexed by SQLite.
+
+        Results are pickled into files named by their keys, and sizes and
+        access times are recorded in an SQLite database in the directory.
+        Files are written to temporary files and renamed atomically,
+        so that the cache can be shared by worker processes
+        and by separate runs of programs.
+
+        Entries persist across runs, so that their keys must change
+        when results change. Keys cover bytecode, constants, closure
+        variables and default arguments of functions, and their inputs.
+        Changes of global variables and of helper functions which they
+        call are not detected, and entries must be removed by `clear`
+        in that case. Entries written by another Python version are not
+        reused, because bytecode and pickles differ.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike
+            Directory to store results. It is created if not exists.
+        max_nbytes : int | None, optional
+            The maximum number of bytes of cached files. Least recently
+             used results are removed when it is exceeded.
+             If None, unlimited. by default None
+        timeout : float, optional
+            Seconds to wait for other processes which lock the index.
+             by default 30.0
+
+        Raises
+        ------
+        ValueError
+            raise this error when max_nbytes is lower than 0
+        """
+        if max_nbytes is not None and max_nbytes <= 0:
+            raise ValueError(
+                f"max_nbytes must be larger than 0. Input: {max_nbytes}"
+            )
+        self._directory = pathlib.Path(directory)
+        self._max_nbytes = max_nbytes
+        self._timeout = timeout
+        self._setup()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Connections are never shared between processes.
+        return {
+            "_directory": self._directory,
+            "_max_nbytes": self._max_nbytes,
+            "_timeout": self._timeout,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._setup()
+
+    def _setup(self) -> None:
+        (self._directory / "objects").mkdir(parents=True, exist_ok=True)
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def directory(self) -> pathlib.Path:
+        return self._directory
+
+    @property
+    def hits(self) -> int:
+        """The number of hits in this process"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of misses in this process"""
+        return self._misses
+
+    @property
+    def n_entries(self) -> int:
+        with self._lock:
+            (count,) = (
+                self._connect()
+                .execute("SELECT COUNT(*) FROM entries")
+                .fetchone()
+            )
+        return count
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of cached files"""
+        with self._lock:
+            (total,) = (
+                self._connect()
+                .execute("SELECT COALESCE(SUM(nbytes), 0) FROM entries")
+                .fetchone()
+            )
+        return total
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # Not cached, removed by other processes or broken
+            self._misses += 1
+            return False, None
+
+        self._hits += 1
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO entries (key, nbytes, accessed) VALUES (?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET accessed = excluded.accessed",
+                (key, _get_size(path), time.time()),
+            )
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:  # noqa: ANN401
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Results which cannot be pickled are not cached.
+            return
+        if self._max_nbytes is not None and len(data) > self._max_nbytes:
+            return
+
+        path = self._get_path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            # Readers see either nothing or the whole file.
+            os.replace(temp_path, path)
+        except BaseException:
+            _remove(temp_path)
+            raise
+
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, nbytes, accessed)"
+                " VALUES (?, ?, ?)",
+                (key, len(data), time.time()),
+            )
+            self._evict(connection)
+
+    def clear(self) -> None:
+        with self._lock:
+            connection = self._connect()
+            keys = connection.execute("SELECT key FROM entries").fetchall()
+            connection.execute("DELETE FROM entries")
+        for (key,) in keys:
+            _remove(self._get_path(key))
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        if self._max_nbytes is None:
+            return
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            (total,) = connection.execute(
+                "SELECT COALESCE(SUM(nbytes), 0) FROM entries"
+            ).fetchone()
+            removed: list[str] = []
+            rows = connection.execute(
+                "SELECT key, nbytes FROM entries ORDER BY accessed"
+            ).fetchall()
+            for key, nbytes in rows:
+                if total <= self._max_nbytes:
+                    break
+                removed.append(key)
+                total -= nbytes
+            connection.executemany(
+                "DELETE FROM entries WHERE key = ?", [(k,) for k in removed]
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        for key in removed:
+            _remove(self._get_path(key))
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        connection = sqlite3.connect(
+            self._directory / "index.sqlite",
+            timeout=self._timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, nbytes INTEGER, accessed REAL)"
+        )
+        self._connection = connection
+        return connection
+
+    def _get_path(self, key: str) -> pathlib.Path:
+        return self._directory / "objects" / key[:2] / f"{key}.pkl"
+
+
+def _get_size(path: pathlib.Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _remove(path: str | os.PathLike) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import pickle
+from collections.abc import Callable
+from types import CellType, CodeType
+from typing import Any
+
+# Placeholder of closure variables which are not assigned yet
+_EMPTY_CELL = "<empty cell>"
+
+
+def make_cache_key(
+    user_function: Callable[..., Any],
+    received: list[Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str | None:
+    """Create a key of a result from a function and its inputs.
+
+    Inputs are pickled and hashed, so that equal inputs give
+    the same key in other processes and runs. A function is identified
+    by its name, bytecode, constants and names which it refers to, and
+    by values of its closure variables and default arguments. Changes
+    of global variables and of other functions which it calls are not
+    detected, so that cached results must be cleared when they change.
+
+    Parameters
+    ----------
+    user_function : Callable[..., Any]
+        function to run
+    received : list[Any]
+        arguments received from predecessors
+    args : tuple[Any, ...]
+        positional arguments passed to all functions
+    kwargs : dict[str, Any]
+        keyword arguments passed to all functions
+
+    Returns
+    -------
+    str | None
+        hex digest of inputs. None if inputs, closure variables or
+         default arguments cannot be pickled.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    try:
+        digest.update(_get_function_identity(user_function))
+        digest.update(
+            pickle.dumps(
+                (received, args, sorted(kwargs.items())),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        )
+    except Exception:
+        return None
+    return digest.hexdigest()
+
+
+def _get_function_identity(user_function: Callable[..., Any]) -> bytes:
+    code = getattr(user_function, "__code__", None)
+    if code is None:
+        # Callable objects are identified by their class and state.
+        return pickle.dumps(user_function, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Closures created by the same factory share their code,
+    #  so that values bound to them are part of the identity.
+    bound = pickle.dumps(
+        (
+            [
+                _get_cell_contents(cell)
+                for cell in getattr(user_function, "__closure__", None) or ()
+            ],
+            getattr(user_function, "__defaults__", None),
+            getattr(user_function, "__kwdefaults__", None),
+        ),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    # Redefined functions in interactive sessions have other bytecode.
+    return b"\0".join(
+        [
+            str(getattr(user_function, "__module__", "")).encode(),
+            str(getattr(user_function, "__qualname__", "")).encode(),
+            _get_code_identity(code).encode(),
+            bound,
+        ]
+    )
+
+
+def _get_code_identity(code: CodeType) -> str:
+    # Names of globals, attributes and methods are held by co_names,
+    #  and co_code refers to them only by indices.
+    return repr(
+        (
+            code.co_code,
+            code.co_names,
+            code.co_varnames,
+            code.co_cellvars,
+            code.co_freevars,
+            code.co_argcount,
+            code.co_posonlyargcount,
+            code.co_kwonlyargcount,
+            code.co_flags,
+            [_get_const_identity(const) for const in code.co_consts],
+        )
+    )
+
+
+def _get_const_identity(const: Any) -> str:  # noqa: ANN401
+    # repr of nested code objects, such as lambdas, contains addresses,
+    #  and repr of sets depends on the hash seed. Both differ in other
+    #  processes.
+    if isinstance(const, CodeType):
+        return _get_code_identity(const)
+    if isinstance(const, frozenset):
+        items = sorted(_get_const_identity(item) for item in const)
+        return f"frozenset({items!r})"
+    if isinstance(const, tuple):
+        items = [_get_const_identity(item) for item in const]
+        return f"tuple({items!r})"
+    return repr(const)
+
+
+def _get_cell_contents(cell: CellType) -> Any:  # noqa: ANN401
+    try:
+        return cell.cell_contents
+    except ValueError:
+        # The variable is not assigned yet.
+        return _EMPTY_CELL
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import abc
+from typing import Any
+
+
+class IResultCache(metaclass=abc.ABCMeta):
+    """Cache of results of functions keyed by fingerprints of inputs."""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Find a cached result.
+
+        Returns
+        -------
+        tuple[bool, Any]
+            True and cached result if found, otherwise False and None.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def put(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Store a result of a function."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all cached results."""
+        raise NotImplementedError()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import collections
+from typing import Any
+
+from dagstream.utils import estimate_nbytes
+
+from .interface import IResultCache
+
+
+class MemoryCache(IResultCache):
+    def __init__(
+        self, max_entries: int | None = 128, max_nbytes: int | None = None
+    ) -> None:
+        """Cache results in memory and evict least recently used ones.
+
+        Cached results are returned as they are, so that they
+        must not be modified by successors.
+
+        Parameters
+        ----------
+        max_entries : int | None, optional
+            The maximum number of cached results. If None, unlimited.
+             by default 128
+        max_nbytes : int | None, optional
+            The maximum number of bytes of cached results.
+             If None, unlimited. by default None
+
+        Raises
+        ------
+        ValueError
+            raise this error when limits are lower than 0
+        """
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError(
+                f"max_entries must be larger than 0. Input: {max_entries}"
+            )
+        if max_nbytes is not None and max_nbytes <= 0:
+            raise ValueError(
+                f"max_nbytes must be larger than 0. Input: {max_nbytes}"
+            )
+
+        self._max_entries = max_entries
+        self._max_nbytes = max_nbytes
+        # key -> (value, nbytes), the least recently used one is first
+        self._entries: collections.OrderedDict[str, tuple[Any, int]] = (
+            collections.OrderedDict()
+        )
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def n_entries(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of cached results"""
+        return self._nbytes
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        if key not in self._entries:
+            self._misses += 1
+            return False, None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return True, self._entries[key][0]
+
+    def put(self, key: str, value: Any) -> None:  # noqa: ANN401
+        nbytes = estimate_nbytes(value)
+        if self._max_nbytes is not None and nbytes > self._max_nbytes:
+            # It would evict all other results.
+            return
+
+        if key in self._entries:
+            self._nbytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, nbytes)
+        self._nbytes += nbytes
+        self._evict()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nbytes = 0
+
+    def _evict(self) -> None:
+        while (
+            self._max_entries is not None
+            and len(self._entries) > self._max_entries
+        ) or (self._max_nbytes is not None and self._nbytes > self._max_nbytes):
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= nbytes
@@ -0,0 +1 @@
+from .chunk_channel import ChunkChannel  # NOQA
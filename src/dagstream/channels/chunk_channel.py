@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import collections
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+from dagstream.utils.errors import DagStreamChannelError
+
+
+class ChunkChannel:
+    def __init__(self, maxsize: int = 8) -> None:
+        """Bounded buffer of chunks from one producer to one consumer.
+
+        A producer is blocked while the buffer is full, so that it is
+        throttled when the consumer falls behind. A consumer receives
+        this object as an argument and iterates it to get chunks.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            The number of chunks which can be buffered. by default 8
+
+        Raises
+        ------
+        ValueError
+            raise this error when maxsize is lower than 1
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be larger than 0. Input: {maxsize}")
+
+        self._maxsize = maxsize
+        self._buffer: collections.deque[Any] = collections.deque()
+        self._condition = threading.Condition()
+        self._is_closed = False
+        self._is_detached = False
+        self._error: BaseException | None = None
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def is_detached(self) -> bool:
+        return self._is_detached
+
+    def put(self, chunk: Any) -> bool:  # noqa: ANN401
+        """Add chunk. Wait while the buffer is full.
+
+        Returns
+        -------
+        bool
+            False if the consumer does not read chunks anymore.
+        """
+        with self._condition:
+            while len(self._buffer) >= self._maxsize:
+                if self._is_detached:
+                    break
+                self._condition.wait()
+
+            if self._is_detached:
+                return False
+            self._buffer.append(chunk)
+            self._condition.notify_all()
+            return True
+
+    def close(self) -> None:
+        """Notify the consumer that no more chunks are produced."""
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+
+    def fail(self, error: BaseException) -> None:
+        """Notify the consumer that the producer fails."""
+        with self._condition:
+            self._error = error
+            self._is_closed = True
+            self._condition.notify_all()
+
+    def detach(self) -> None:
+        """Notify the producer that chunks are not read anymore.
+
+        Buffered chunks are discarded.
+        """
+        with self._condition:
+            self._is_detached = True
+            self._buffer.clear()
+            self._condition.notify_all()
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            with self._condition:
+                while not self._buffer and not self._is_closed:
+                    self._condition.wait()
+
+                if self._buffer:
+                    chunk = self._buffer.popleft()
+                    self._condition.notify_all()
+                elif self._error is not None:
+                    raise DagStreamChannelError(
+                        "Producer of chunks failed."
+                    ) from self._error
+                else:
+                    return
+            yield chunk
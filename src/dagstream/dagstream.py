@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+import gc
+import os
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
 
 from dagstream import utils
 from dagstream.graph_components import (
+    AncestorIndex,
     FunctionalDag,
     IDrawableGraph,
     IDrawableNode,
     IFunctionalNode,
+    TopologicalOrder,
 )
+from dagstream.graph_components.dags import dump_topology, load_topology
 from dagstream.graph_components.nodes import FunctionalNode
-from dagstream.utils.errors import DagStreamCycleError
+from dagstream.stores import IResultStore
+from dagstream.utils import LazyFunction
 
 
 class DagStream(IDrawableGraph):
@@ -19,6 +26,10 @@ class DagStream(IDrawableGraph):
         # This counter aims to distinguish
         # between nodes which have the same function name
         self._SAME_NAME_COUNTER: dict[str, int] = {}
+        # Edges making cycles are rejected when they are added
+        self._order = TopologicalOrder(self._name2node)
+        # Ancestors are cached for repeated extraction of sub graphs
+        self._ancestors = AncestorIndex(self._name2node, self._order)
 
     def check_exists(self, node: str | IFunctionalNode) -> bool:
         if isinstance(node, IFunctionalNode):
@@ -35,9 +46,20 @@ class DagStream(IDrawableGraph):
     def get_functions(self) -> Iterable[IFunctionalNode]:
         return self._name2node.values()
 
-    def emplace(self, *functions: Callable) -> tuple[IFunctionalNode, ...]:
+    def emplace(
+        self,
+        *functions: Callable,
+        resources: dict[str, float] | None = None,
+    ) -> tuple[IFunctionalNode, ...]:
         """create a functional node corresponding to each function
 
+        Parameters
+        ----------
+        resources : dict[str, float] | None, optional
+            Amount of resources required to run each function,
+             such as {"cpu": 4, "mem_gb": 16}. Executors start a function
+             only when these resources are available. by default None
+
         Returns
         -------
         tuple[IFunctionalNode, ...]
@@ -47,28 +69,253 @@ class DagStream(IDrawableGraph):
         # To ensure orders
         _nodes: list[IFunctionalNode] = []
         for func in functions:
-            node_name = self._create_node_name(func)
-            node = FunctionalNode(func, mut_node_name=node_name)
+            node = self._add_node(func, self._create_node_name(func))
+            if resources is not None:
+                node.resources = resources
             _nodes.append(node)
-            self._name2node.update({node.mut_name: node})
 
         return tuple(_nodes)
 
+    @classmethod
+    def from_adjacency(
+        cls,
+        functions: Mapping[str, Callable],
+        adjacency: Mapping[str, Iterable[str]],
+        pipe: bool = False,
+    ) -> DagStream:
+        """create DagStream from functions and adjacency of them
+
+        Parameters
+        ----------
+        functions : Mapping[str, Callable]
+            Key is name of node, value is function of the node
+        adjacency : Mapping[str, Iterable[str]]
+            Key is name of node, value is names of its successors
+        pipe : bool, optional
+            If True, all edges are pipe edges. by default False
+
+        Returns
+        -------
+        DagStream
+            DagStream which has all nodes and edges
+
+        Raises
+        ------
+        ValueError
+            raise this error if adjacency has an unknown name
+        DagStreamCycleError
+            raise this error if edges make a cycle
+        """
+        stream = cls()
+        for name, func in functions.items():
+            stream._add_node(func, name)
+
+        stream.add_edges(
+            (from_node, to_node, pipe)
+            for from_node, to_nodes in adjacency.items()
+            for to_node in to_nodes
+        )
+        return stream
+
+    def add_edges(
+        self,
+        edges: Iterable[
+            tuple[str | IFunctionalNode, str | IFunctionalNode, bool]
+        ],
+    ) -> None:
+        """add many edges at once
+
+        Unlike calling precede for each edge, all edges are validated
+        at once, and edge structures of each node are updated once.
+        Validation costs time linear in the size of the whole graph,
+        so it is suitable to add many edges in a few calls.
+        Edges which already exist are ignored.
+
+        Parameters
+        ----------
+        edges : Iterable[tuple]
+            (predecessor, successor, pipe) for each edge. Nodes are
+             specified by node objects or names of nodes
+             in this DagStream.
+
+        Raises
+        ------
+        ValueError
+            raise this error if a node does not exist in this DagStream
+        DagStreamCycleError
+            raise this error if edges make a cycle.
+             No edge is added in that case.
+        """
+        # name of predecessor -> (name of successor -> pipe)
+        successors: dict[str, dict[str, bool]] = {}
+        for from_node, to_node, is_pipe in edges:
+            from_name = self._get_name(from_node)
+            to_name = self._get_name(to_node)
+            to_edges = successors.get(from_name)
+            if to_edges is None:
+                successors[from_name] = {to_name: is_pipe}
+            elif to_name not in to_edges:
+                to_edges[to_name] = is_pipe
+
+        self._order.add_edges(successors)
+
+        # Dicts of strings are not tracked by the garbage collector,
+        # so they are used instead of lists for many small groups.
+        predecessors: dict[str, dict[str, None]] = {}
+        for from_name, to_edges in successors.items():
+            self._name2node[from_name].extend_successors(to_edges.items())
+            for to_name in to_edges:
+                from_names = predecessors.get(to_name)
+                if from_names is None:
+                    predecessors[to_name] = {from_name: None}
+                else:
+                    from_names[from_name] = None
+
+        for to_name, from_names in predecessors.items():
+            self._name2node[to_name].extend_predecessors(from_names)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Save topology to a JSON file.
+
+        Names, display names, resources and edges of nodes are saved.
+        Functions are saved as import paths, such as
+        "package.module:name", so they must be defined at the top level
+        of modules.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            path of the file
+
+        Raises
+        ------
+        ValueError
+            raise this error if a function cannot be imported by its path
+        """
+        dump_topology(self._name2node.values(), path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> DagStream:
+        """Load DagStream saved by save.
+
+        Nodes and edges are restored without validation, because they
+        are saved in topological order. Functions are imported when
+        they are used first.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            path of the file
+
+        Returns
+        -------
+        DagStream
+            DagStream which has the same topology
+
+        Raises
+        ------
+        ValueError
+            raise this error if the file is not a topology file,
+             it is written in an unsupported version, names of nodes
+             are duplicated, or an edge does not follow the order
+             of nodes in the file
+        """
+        records, edges = load_topology(path)
+
+        # Many objects of the graph are created at once, and collecting
+        # garbage in the middle only scans them again and again.
+        is_gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return cls._build_from_records(records, edges)
+        finally:
+            if is_gc_enabled:
+                gc.enable()
+
+    @classmethod
+    def _build_from_records(
+        cls, records: list[dict[str, Any]], edges: list[int]
+    ) -> DagStream:
+        stream = cls()
+        nodes: list[IFunctionalNode] = []
+        for record in records:
+            node = stream._add_node(
+                LazyFunction(record["function"]), record["name"]
+            )
+            node.display_name = record["display_name"]
+            if "resources" in record:
+                node.resources = record["resources"]
+            nodes.append(node)
+
+        names = [node.mut_name for node in nodes]
+        successors: list[list[tuple[str, bool]]] = [[] for _ in nodes]
+        predecessors: list[list[str]] = [[] for _ in nodes]
+        values = iter(edges)
+        n_nodes = len(nodes)
+        for from_index, to_index, is_pipe in zip(
+            values, values, values, strict=True
+        ):
+            # Edges are not added to the order, so that they are checked
+            # to follow the order of records, which is topological.
+            is_valid = 0 <= from_index < to_index < n_nodes
+            if not is_valid or is_pipe not in (0, 1):
+                raise ValueError(
+                    "Invalid edge in topology file: "
+                    f"{[from_index, to_index, is_pipe]}"
+                )
+            successors[from_index].append((names[to_index], bool(is_pipe)))
+            predecessors[to_index].append(names[from_index])
+
+        for node, to_edges, from_names in zip(
+            nodes, successors, predecessors, strict=True
+        ):
+            node.extend_successors(to_edges)
+            node.extend_predecessors(from_names)
+        return stream
+
+    def _get_name(self, node: str | IFunctionalNode) -> str:
+        # Names held by nodes are returned, because they are interned.
+        if isinstance(node, str):
+            found = self._name2node.get(node)
+            if found is None:
+                raise ValueError(f"{node} does not exist in this DagStream.")
+            return found.mut_name
+
+        name = node.mut_name
+        if self._name2node.get(name) is not node:
+            raise ValueError(f"{name} does not exist in this DagStream.")
+        return name
+
+    def _add_node(self, func: Callable, node_name: str) -> IFunctionalNode:
+        if node_name in self._name2node:
+            raise ValueError(f"{node_name} already exists in this DagStream.")
+
+        node = FunctionalNode(func, mut_node_name=node_name, order=self._order)
+        self._name2node.update({node.mut_name: node})
+        self._order.add_node(node.mut_name)
+        return node
+
     def _create_node_name(self, user_function: Callable) -> str:
         function_name = utils.get_function_name(user_function)
         if function_name not in self._name2node:
             return function_name
 
         _counter = self._SAME_NAME_COUNTER.get(function_name, 0)
-        _counter += 1
-
-        node_name = f"{function_name}_{_counter}"
+        node_name = function_name
+        # Names with suffixes may be taken by loaded nodes
+        #  or by functions named like them.
+        while node_name in self._name2node:
+            _counter += 1
+            node_name = f"{function_name}_{_counter}"
 
         self._SAME_NAME_COUNTER[function_name] = _counter
         return node_name
 
     def construct(
-        self, mandatory_nodes: set[IFunctionalNode] | None = None
+        self,
+        mandatory_nodes: set[IFunctionalNode] | None = None,
+        store: IResultStore | None = None,
+        compile: bool = False,
     ) -> FunctionalDag:
         """create functional dag
 
@@ -81,80 +328,36 @@ class DagStream(IDrawableGraph):
             If fed, extract sub 'minimum' graph to include mandatory_nodes.
             If not fed, all functional nodes are included to graph.
               by default None
+        store : IResultStore | None, optional
+            If fed, results passed through pipe edges are put into it,
+             such as SpillStore to write large results to disk.
+             by default None
+        compile : bool, optional
+            If True, topology is compiled into an ExecutionPlan,
+             so that executors schedule nodes by integer indices.
+             by default False
 
         Returns
         -------
         FunctionalDag
             dag structure object composed of functional nodes
         """
-        self._detect_cycle()
-
+        # Cycles are rejected when edges are added, or here if edges
+        # are added without searches for large graphs.
+        self._order.validate()
         if mandatory_nodes is None:
             functions = self._name2node
         else:
             functions = self._extract_functions(mandatory_nodes)
 
-        return FunctionalDag(functions)
+        functional_dag = FunctionalDag(functions, store=store)
+        if compile:
+            functional_dag.compile()
+        return functional_dag
 
     def _extract_functions(
         self, mandatory_nodes: set[IFunctionalNode]
     ) -> dict[str, IFunctionalNode]:
-        visited: dict[str, IFunctionalNode] = {}
-
-        for node in mandatory_nodes:
-            self._extract_subdag(node, visited)
-        return visited
-
-    def _extract_subdag(
-        self,
-        mandatory_node: IFunctionalNode,
-        visited: dict[str, IFunctionalNode],
-    ):
-        if mandatory_node.mut_name in visited:
-            return
-
-        visited.update({mandatory_node.mut_name: mandatory_node})
-        predecessors: list[str] = list(mandatory_node.predecessors)
-
-        while len(predecessors) != 0:
-            node_name = predecessors.pop()
-            node = self._name2node[node_name]
-            if node.mut_name in visited:
-                continue
-            visited.update({node.mut_name: node})
-
-            for next_node in node.predecessors:
-                predecessors.append(next_node)
-
-        return None
-
-    def _detect_cycle(self):
-        finished: set[str] = set()
-        seen: set[str] = set()
-        for node in self._name2node.values():
-            if node.mut_name in finished:
-                continue
-            self._dfs_detect_cycle(node, finished, seen)
-        return None
-
-    def _dfs_detect_cycle(
-        self,
-        start: IFunctionalNode,
-        finished: set[str],
-        seen: set[str],
-    ) -> None:
-        for edge in start.successors:
-            node = self._name2node[edge.to_node]
-
-            if node.mut_name in finished:
-                continue
-
-            if (node.mut_name in seen) and (node.mut_name not in finished):
-                raise DagStreamCycleError(
-                    "Detect cycle in your definition of dag."
-                )
-
-            seen.add(node.mut_name)
-            self._dfs_detect_cycle(node, finished, seen)
-
-        finished.add(start.mut_name)
+        return self._ancestors.extract(
+            node.mut_name for node in mandatory_nodes
+        )
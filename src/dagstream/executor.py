@@ -1,20 +1,71 @@
 from __future__ import annotations
 
-import multiprocessing as multi
-from typing import Any
+import collections
+import functools
+import itertools
+import os
+import pickle
+import queue
+import threading
+import time
+import traceback
+from array import array
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, cast
 
-from dagstream.graph_components import FunctionalDag
+from dagstream.caches import IResultCache, make_cache_key
+from dagstream.channels import ChunkChannel
+from dagstream.graph_components import (
+    ExecutionPlan,
+    FunctionalDag,
+    IFunctionalNode,
+)
+from dagstream.schedulers import FifoScheduler, IScheduler, ResourceLimiter
+from dagstream.stores import load_lazy
+from dagstream.transports import ITransport
+from dagstream.utils import RunStats, estimate_nbytes
+from dagstream.utils.errors import DagStreamWorkerError
+
+if TYPE_CHECKING:
+    # asyncio and multiprocessing are imported by executors which use them,
+    # because they are slow to import and most runs need neither of them.
+    import asyncio
+    import multiprocessing as multi
+    from multiprocessing.connection import Connection
 
 
 class StreamExecutor:
-    def __init__(self, functional_dag: FunctionalDag) -> None:
+    def __init__(
+        self,
+        functional_dag: FunctionalDag,
+        scheduler: IScheduler | None = None,
+        cache: IResultCache | None = None,
+        track_memory: bool = False,
+    ) -> None:
         """Executor for FunctionalDag Object.
 
+        If functional_dag is compiled, FifoScheduler is used and
+        neither a cache nor a result store is set, nodes are
+        scheduled by the ExecutionPlan of functional_dag.
+
         Parameters
         ----------
         functional_dag : FunctionalDag
             FunctionalDag instance which is already
              constructed from DagStream Object
+        scheduler : IScheduler | None, optional
+            Policy to decide which ready node runs first.
+             If None, FifoScheduler is used. by default None
+        cache : IResultCache | None, optional
+            If fed, results are looked up by fingerprints of inputs
+             before running functions, and stored after running.
+             by default None
+        track_memory : bool, optional
+            If True, bytes of results held during a run are estimated
+             and recorded in stats. Estimation walks containers in
+             results, so that it slows down functions returning many
+             small objects. by default False
 
         Raises
         ------
@@ -28,6 +79,18 @@ class StreamExecutor:
                 "  beforehand."
             )
         self._dag = functional_dag
+        self._stats = RunStats()
+        self._scheduler = scheduler or FifoScheduler()
+        self._cache = cache
+        self._track_memory = track_memory
+
+    @property
+    def stats(self) -> RunStats:
+        """Statistics of the last run, such as peak_live_bytes.
+
+        Bytes of results are counted only when track_memory is True.
+        """
+        return self._stats
 
     def run(
         self,
@@ -46,16 +109,50 @@ class StreamExecutor:
             Key is name of function, value is returned objects
               from each function.
         """
+        plan = self._dag.plan
+        if (
+            plan is not None
+            and self._cache is None
+            and self._dag.store is None
+            and type(self._scheduler) is FifoScheduler
+        ):
+            return self._run_plan(
+                plan, args, kwargs, first_args, save_all_state
+            )
+
         results: dict[str, Any] = {}
+        self._stats = RunStats()
+        self._dag.reset()
+        self._scheduler.prepare(self._dag)
 
         while self._dag.is_active:
-            nodes = self._dag.get_ready()
+            nodes = self._scheduler.order(self._dag.get_ready())
             for node in nodes:
                 if node.n_predecessors == 0 and first_args is not None:
                     for arg in first_args:
                         node.receive_args(arg)
 
-                result = node.run(*args, **kwargs)
+                key, is_hit, result = _find_cached(
+                    self._cache, node, args, kwargs
+                )
+                if not is_hit:
+                    start = time.perf_counter()
+                    result = _share_chunks(
+                        self._dag, node, node.run(*args, **kwargs)
+                    )
+                    self._scheduler.record(
+                        node.mut_name, time.perf_counter() - start
+                    )
+                    if self._cache is not None and key is not None:
+                        self._cache.put(key, result)
+                if self._track_memory:
+                    _update_stats(
+                        self._stats,
+                        self._dag,
+                        node,
+                        result,
+                        self._dag.check_last(node) or save_all_state,
+                    )
                 self._dag.send(node.mut_name, result)
                 self._dag.done(node.mut_name)
 
@@ -64,12 +161,1127 @@ class StreamExecutor:
 
         return results
 
+    def _run_plan(
+        self,
+        plan: ExecutionPlan,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        first_args: tuple[Any] | None,
+        save_all_state: bool,
+    ) -> dict[str, Any]:
+        # Scheduling state is held in arrays indexed by node number.
+        # A single queue runs nodes in the same order as FifoScheduler.
+        results: dict[str, Any] = {}
+        stats = RunStats()
+        self._stats = stats
+
+        names = plan.names
+        functions = plan.functions
+        offsets = plan.offsets
+        targets = plan.targets
+        pipe_mask = plan.pipe_mask
+        pipe_offsets = plan.pipe_offsets
+        pipe_sources = plan.pipe_sources
+        is_last = plan.is_last
+        n_pipe_successors = plan.n_pipe_successors
+        track_memory = self._track_memory
+        n_waiting = array("q", n_pipe_successors)
+        n_remaining = array("q", plan.in_degrees)
+        received: list[list[Any] | None] = [None] * plan.n_nodes
+        held_nbytes = [0] * plan.n_nodes
+
+        if first_args is not None:
+            for index in plan.sources:
+                received[index] = list(first_args)
+
+        ready = collections.deque(plan.sources)
+        while ready:
+            index = ready.popleft()
+            inputs = received[index]
+            if inputs is None:
+                result = functions[index](*args, **kwargs)
+            else:
+                received[index] = None
+                result = functions[index](*inputs, *args, **kwargs)
+                del inputs
+            if n_pipe_successors[index] > 1 and isinstance(result, Generator):
+                # A generator can be iterated only once
+                result = list(result)
+
+            if save_all_state or is_last[index] == 1:
+                results[names[index]] = result
+                if track_memory:
+                    stats.add_nbytes(estimate_nbytes(result))
+            elif track_memory:
+                nbytes = estimate_nbytes(result)
+                stats.add_nbytes(nbytes)
+                if n_waiting[index] == 0:
+                    stats.remove_nbytes(nbytes)
+                else:
+                    held_nbytes[index] = nbytes
+
+            if track_memory:
+                start, end = pipe_offsets[index], pipe_offsets[index + 1]
+                for source in pipe_sources[start:end]:
+                    n_waiting[source] -= 1
+                    if n_waiting[source] == 0 and held_nbytes[source] != 0:
+                        stats.remove_nbytes(held_nbytes[source])
+                        held_nbytes[source] = 0
+
+            start, end = offsets[index], offsets[index + 1]
+            for target, is_pipe in zip(
+                targets[start:end], pipe_mask[start:end], strict=True
+            ):
+                if is_pipe:
+                    inputs = received[target]
+                    if inputs is None:
+                        received[target] = [result]
+                    else:
+                        inputs.append(result)
+                n_remaining[target] -= 1
+                if n_remaining[target] == 0:
+                    ready.append(target)
+
+        return results
+
+
+class StreamThreadExecutor:
+    """Thread Executor for FunctionalDag Object."""
+
+    def __init__(
+        self,
+        functional_dag: FunctionalDag,
+        n_threads: int | None = None,
+        scheduler: IScheduler | None = None,
+        capacities: dict[str, float] | None = None,
+        chunk_buffer_size: int = 8,
+        cache: IResultCache | None = None,
+        track_memory: bool = False,
+    ) -> None:
+        """Thread Executor for FunctionalDag Object.
+
+        Ready nodes are run on a thread pool. Successors of a node are
+        dispatched as soon as their last predecessor finishes.
+        It is suitable for I/O bound functions or functions
+        which release the GIL.
+
+        Generator functions are run as streaming nodes. Each yielded
+        chunk is put into a ChunkChannel for every successor connected
+        by a pipe edge, and these successors start as soon as the
+        generator starts. They receive the ChunkChannel as an argument
+        and iterate it to get chunks. A generator is blocked while
+        a buffer is full, so that it is throttled by slow consumers.
+        If a generator has no such successors, yielded chunks are
+        collected into a list.
+        Streaming nodes and their consumers run in their own threads
+        because they wait for each other, so they are not limited by
+        n_threads and capacities.
+
+        Parameters
+        ----------
+        functional_dag : FunctionalDag
+            FunctionalDag instance which is already constructed
+              from DagStream Object
+        n_threads : int | None, optional
+            The number of threads to run in parallel.
+             If None, default value of ThreadPoolExecutor is used.
+             by default None
+        scheduler : IScheduler | None, optional
+            Policy to decide which ready node starts first when
+             all threads are busy. If None, FifoScheduler is used.
+             by default None
+        capacities : dict[str, float] | None, optional
+            Capacities of resources, such as {"cpu": 16, "mem_gb": 64}.
+             A node starts only when resources declared in
+             its `resources` are available. by default None
+        chunk_buffer_size : int, optional
+            The number of chunks which can be buffered on each pipe
+             edge from a generator function. by default 8
+        cache : IResultCache | None, optional
+            If fed, results are looked up by fingerprints of inputs
+             before running functions, and stored after running.
+             by default None
+        track_memory : bool, optional
+            If True, bytes of results held during a run are estimated
+             and recorded in stats. Estimation walks containers in
+             results, so that it slows down functions returning many
+             small objects. by default False
+
+        Raises
+        ------
+        ValueError
+            raise this error when n_threads or chunk_buffer_size
+             is lower than 0
+        """
+        if not isinstance(functional_dag, FunctionalDag):
+            raise ValueError(
+                "functional_dag is not a instance of FunctionalDag. "
+                "Maybe, you forget to call 'your_dagstream.construct()'"
+                " beforehand."
+            )
+
+        self._dag = functional_dag
+        self._stats = RunStats()
+        self._n_threads = n_threads
+        if self._n_threads is not None and self._n_threads <= 0:
+            raise ValueError(
+                f"n_threads must be larger than 0. Input: {n_threads}"
+            )
+        self._scheduler = scheduler or FifoScheduler()
+        self._capacities = capacities
+        if chunk_buffer_size <= 0:
+            raise ValueError(
+                "chunk_buffer_size must be larger than 0. "
+                f"Input: {chunk_buffer_size}"
+            )
+        self._chunk_buffer_size = chunk_buffer_size
+        self._cache = cache
+        self._track_memory = track_memory
+
+    @property
+    def stats(self) -> RunStats:
+        """Statistics of the last run, such as peak_live_bytes.
+
+        Bytes of results are counted only when track_memory is True.
+        """
+        return self._stats
+
+    def run(
+        self,
+        *args: Any,  # noqa: ANN401
+        first_args: tuple[Any] | None = None,
+        save_all_state: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Run functions in a thread pool.
+
+        Input parameters are passed to all functions.
+        If a function raises an exception, no more functions are
+        dispatched and the exception is raised again in the caller.
+
+        Returns
+        -------
+        dict[str, Any]
+            Key is name of function, value is returned objects
+              from each function.
+        """
+        results: dict[str, Any] = {}
+        self._stats = RunStats()
+        # Completion callbacks are invoked in worker threads.
+        # They only notify the finished node, and the state of
+        # functional dag is updated in this thread.
+        done_queue: queue.SimpleQueue[tuple[IFunctionalNode, Future]] = (
+            queue.SimpleQueue()
+        )
+        pending: list[IFunctionalNode] = []
+        start_times: dict[str, float] = {}
+        cache_keys: dict[str, str] = {}
+        # Names of running nodes which do not use threads in the pool
+        streaming: set[str] = set()
+        # Names of nodes finished by cache, whose times are not recorded
+        cache_hits: set[str] = set()
+        channels: list[ChunkChannel] = []
+        self._dag.reset()
+        self._scheduler.prepare(self._dag)
+        limiter = ResourceLimiter(self._capacities)
+        limiter.validate(self._dag.get_functions())
+
+        # Same as default value of ThreadPoolExecutor
+        n_slots = self._n_threads or min(32, (os.cpu_count() or 1) + 4)
+
+        with ThreadPoolExecutor(max_workers=n_slots) as pool:
+            # Ready nodes are kept here until a thread is available,
+            # so that the scheduler can choose which one starts first.
+            while self._dag.is_active:
+                candidates = [*pending, *self._dag.get_ready()]
+                pending = []
+                # Starting a generator makes its consumers ready at once.
+                while len(candidates) > 0:
+                    for node in self._scheduler.order(candidates):
+                        is_streaming = node.is_generator or _has_channel(node)
+                        n_pooled = len(start_times) - len(streaming)
+                        if not is_streaming and (
+                            n_pooled >= n_slots or not limiter.acquire(node)
+                        ):
+                            pending.append(node)
+                            continue
+
+                        if node.n_predecessors == 0 and first_args is not None:
+                            for arg in first_args:
+                                node.receive_args(arg)
+
+                        key, is_hit, cached = _find_cached(
+                            self._cache, node, args, kwargs
+                        )
+                        future: Future
+                        if is_hit:
+                            # Finish at once without running the function.
+                            cache_hits.add(node.mut_name)
+                            future = Future()
+                            future.set_result(cached)
+                        elif is_streaming:
+                            streaming.add(node.mut_name)
+                            future = self._start_streaming(
+                                node, channels, *args, **kwargs
+                            )
+                        else:
+                            future = pool.submit(node.run, *args, **kwargs)
+                        if key is not None and not is_hit:
+                            cache_keys[node.mut_name] = key
+
+                        start_times[node.mut_name] = time.perf_counter()
+                        future.add_done_callback(
+                            functools.partial(_notify_done, done_queue, node)
+                        )
+                    candidates = list(self._dag.get_ready())
+
+                if len(start_times) == 0:
+                    # No node is running and no node is ready.
+                    break
+
+                _done_node, _future = done_queue.get()
+                if _done_node.mut_name in streaming:
+                    streaming.remove(_done_node.mut_name)
+                else:
+                    limiter.release(_done_node)
+                _elapsed = time.perf_counter() - start_times.pop(
+                    _done_node.mut_name
+                )
+                if _done_node.mut_name in cache_hits:
+                    cache_hits.remove(_done_node.mut_name)
+                else:
+                    self._scheduler.record(_done_node.mut_name, _elapsed)
+                _error = _future.exception()
+                if _error is not None:
+                    # Unblock generators and consumers waiting each other
+                    for channel in channels:
+                        channel.detach()
+                        channel.fail(_error)
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    raise _error
+                _result = _future.result()
+                if (
+                    self._cache is not None
+                    and _done_node.mut_name in cache_keys
+                ):
+                    self._cache.put(
+                        cache_keys.pop(_done_node.mut_name), _result
+                    )
+
+                for arg in _done_node.get_received_args():
+                    if isinstance(arg, ChunkChannel):
+                        # Stop the producer if chunks are left unread.
+                        arg.detach()
+
+                if self._track_memory:
+                    _update_stats(
+                        self._stats,
+                        self._dag,
+                        _done_node,
+                        _result,
+                        self._dag.check_last(_done_node) or save_all_state,
+                    )
+                # Successors reading chunks are skipped by send
+                self._dag.send(_done_node.mut_name, _result)
+                self._dag.done(_done_node.mut_name)
+
+                if self._dag.check_last(_done_node) or save_all_state:
+                    results.update({_done_node.mut_name: _result})
+
+        return results
+
+    def _start_streaming(
+        self,
+        node: IFunctionalNode,
+        channels: list[ChunkChannel],
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Future:
+        future: Future = Future()
+        function: Callable[..., Any] = node.run
+        if node.is_generator:
+            node_channels = []
+            consumers = self._dag.open_stream(node.mut_name)
+            for consumer in consumers:
+                channel = ChunkChannel(self._chunk_buffer_size)
+                consumer.receive_args(channel)
+                node_channels.append(channel)
+            channels.extend(node_channels)
+            # The other pipe successors receive chunks as a list
+            is_collected = len(consumers) < len(
+                self._dag.get_pipe_successors(node.mut_name)
+            )
+            function = functools.partial(
+                _produce, node, node_channels, is_collected
+            )
+
+        thread = threading.Thread(
+            target=_run_future,
+            args=(future, function, args, kwargs),
+            daemon=True,
+        )
+        thread.start()
+        return future
+
+
+class AsyncStreamExecutor:
+    """Asyncio Executor for FunctionalDag Object."""
+
+    def __init__(
+        self,
+        functional_dag: FunctionalDag,
+        capacities: dict[str, float] | None = None,
+        cache: IResultCache | None = None,
+        track_memory: bool = False,
+    ) -> None:
+        """Asyncio Executor for FunctionalDag Object.
+
+        Every ready node is scheduled as a task on the running event loop.
+        Coroutine functions registered by DagStream.emplace are awaited,
+        so many I/O bound functions can run concurrently.
+        Please note that ordinary functions are called directly
+        in the event loop and block it while running.
+
+        Parameters
+        ----------
+        functional_dag : FunctionalDag
+            FunctionalDag instance which is already constructed
+              from DagStream Object
+        capacities : dict[str, float] | None, optional
+            Capacities of resources, such as {"cpu": 16, "mem_gb": 64}.
+             A node starts only when resources declared in
+             its `resources` are available. by default None
+        cache : IResultCache | None, optional
+            If fed, results are looked up by fingerprints of inputs
+             before running functions, and stored after running.
+             by default None
+        track_memory : bool, optional
+            If True, bytes of results held during a run are estimated
+             and recorded in stats. Estimation walks containers in
+             results, so that it slows down functions returning many
+             small objects. by default False
+
+        Raises
+        ------
+        ValueError
+            raise this error when functional_dag is not constructed
+        """
+        if not isinstance(functional_dag, FunctionalDag):
+            raise ValueError(
+                "functional_dag is not a instance of FunctionalDag. "
+                "Maybe, you forget to call 'your_dagstream.construct()'"
+                " beforehand."
+            )
+        self._dag = functional_dag
+        self._stats = RunStats()
+        self._capacities = capacities
+        self._cache = cache
+        self._track_memory = track_memory
+
+    @property
+    def stats(self) -> RunStats:
+        """Statistics of the last run, such as peak_live_bytes.
+
+        Bytes of results are counted only when track_memory is True.
+        """
+        return self._stats
+
+    def run(
+        self,
+        *args: Any,  # noqa: ANN401
+        first_args: tuple[Any] | None = None,
+        save_all_state: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Run functions in a new event loop.
+
+        This is a shortcut of asyncio.run(executor.run_async(...)).
+
+        Returns
+        -------
+        dict[str, Any]
+            Key is name of function, value is returned objects
+              from each function.
+        """
+        import asyncio
+
+        return asyncio.run(
+            self.run_async(
+                *args,
+                first_args=first_args,
+                save_all_state=save_all_state,
+                **kwargs,
+            )
+        )
+
+    async def run_async(
+        self,
+        *args: Any,  # noqa: ANN401
+        first_args: tuple[Any] | None = None,
+        save_all_state: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Run functions concurrently on the running event loop.
+
+        Input parameters are passed to all functions.
+        If a function raises an exception, the other running tasks
+        are cancelled and the exception is raised again.
+
+        Returns
+        -------
+        dict[str, Any]
+            Key is name of function, value is returned objects
+              from each function.
+        """
+        import asyncio
+
+        results: dict[str, Any] = {}
+        self._stats = RunStats()
+        running: dict[asyncio.Future, IFunctionalNode] = {}
+        # Ready nodes waiting for resources held by running nodes
+        pending: list[IFunctionalNode] = []
+        cache_keys: dict[str, str] = {}
+        self._dag.reset()
+        limiter = ResourceLimiter(self._capacities)
+        limiter.validate(self._dag.get_functions())
+
+        try:
+            while self._dag.is_active:
+                candidates = [*pending, *self._dag.get_ready()]
+                pending = []
+                for node in candidates:
+                    if not limiter.acquire(node):
+                        pending.append(node)
+                        continue
+
+                    if node.n_predecessors == 0 and first_args is not None:
+                        for arg in first_args:
+                            node.receive_args(arg)
+
+                    key, is_hit, cached = _find_cached(
+                        self._cache, node, args, kwargs
+                    )
+                    task: asyncio.Future
+                    if is_hit:
+                        task = asyncio.get_running_loop().create_future()
+                        task.set_result(cached)
+                    else:
+                        task = asyncio.create_task(
+                            node.run_async(*args, **kwargs)
+                        )
+                        if key is not None:
+                            cache_keys[node.mut_name] = key
+                    running[task] = node
+
+                if len(running) == 0:
+                    # No node is running and no node is ready.
+                    break
+
+                finished, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    _done_node = running.pop(task)
+                    limiter.release(_done_node)
+                    _result = _share_chunks(
+                        self._dag, _done_node, task.result()
+                    )
+                    if (
+                        self._cache is not None
+                        and _done_node.mut_name in cache_keys
+                    ):
+                        self._cache.put(
+                            cache_keys.pop(_done_node.mut_name), _result
+                        )
+
+                    if self._track_memory:
+                        _update_stats(
+                            self._stats,
+                            self._dag,
+                            _done_node,
+                            _result,
+                            self._dag.check_last(_done_node) or save_all_state,
+                        )
+                    self._dag.send(_done_node.mut_name, _result)
+                    self._dag.done(_done_node.mut_name)
+
+                    if self._dag.check_last(_done_node) or save_all_state:
+                        results.update({_done_node.mut_name: _result})
+        finally:
+            for task in running:
+                task.cancel()
+            if len(running) != 0:
+                await asyncio.wait(running)
+
+        return results
+
+
+class StreamPipelineExecutor:
+    """Pipeline Executor for FunctionalDag Object."""
+
+    def __init__(
+        self,
+        functional_dag: FunctionalDag,
+        n_threads: int | None = None,
+        max_in_flight: int = 4,
+        capacities: dict[str, float] | None = None,
+    ) -> None:
+        """Pipeline Executor for FunctionalDag Object.
+
+        Many inputs flow through the same FunctionalDag concurrently.
+        While an input is processed by later nodes, the next input
+        can be processed by earlier nodes. Functions run on a thread pool.
+
+        Parameters
+        ----------
+        functional_dag : FunctionalDag
+            FunctionalDag instance which is already constructed
+              from DagStream Object
+        n_threads : int | None, optional
+            The number of threads to run in parallel.
+             If None, default value of ThreadPoolExecutor is used.
+             by default None
+        max_in_flight : int, optional
+            The maximum number of inputs processed at the same time,
+             including finished ones waiting to be yielded in order.
+             by default 4
+        capacities : dict[str, float] | None, optional
+            Capacities of resources, such as {"cpu": 16, "mem_gb": 64}.
+             A node starts only when resources declared in
+             its `resources` are available. They are shared by
+             all inputs in flight. by default None
+
+        Raises
+        ------
+        ValueError
+            raise this error when n_threads or max_in_flight
+             is lower than 0
+        """
+        if not isinstance(functional_dag, FunctionalDag):
+            raise ValueError(
+                "functional_dag is not a instance of FunctionalDag. "
+                "Maybe, you forget to call 'your_dagstream.construct()'"
+                " beforehand."
+            )
+        if n_threads is not None and n_threads <= 0:
+            raise ValueError(
+                f"n_threads must be larger than 0. Input: {n_threads}"
+            )
+        if max_in_flight <= 0:
+            raise ValueError(
+                f"max_in_flight must be larger than 0. Input: {max_in_flight}"
+            )
+
+        self._dag = functional_dag
+        self._n_threads = n_threads
+        self._max_in_flight = max_in_flight
+        self._capacities = capacities
+
+    def run_iter(
+        self,
+        inputs: Iterable[Any],
+        *args: Any,  # noqa: ANN401
+        ordered: bool = True,
+        save_all_state: bool = False,
+        **kwargs,
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Run functions for each input and yield results.
+
+        Each input is passed to functions which have no predecessors
+        as the first argument. Other parameters are passed to all functions.
+
+        Parameters
+        ----------
+        inputs : Iterable[Any]
+            Inputs to flow through the dag. It is consumed lazily.
+        ordered : bool, optional
+            If True, results are yielded in the order of inputs.
+             If False, results are yielded as soon as they are finished.
+             by default True
+
+        Yields
+        ------
+        tuple[int, dict[str, Any]]
+            Index of input and results of the input.
+            Key is name of function, value is returned objects
+              from each function.
+        """
+        items = iter(inputs)
+        is_exhausted = False
+        n_started = 0
+        next_index = 0
+        in_flight: dict[int, _PipelineItem] = {}
+        finished: dict[int, dict[str, Any]] = {}
+        done_queue: queue.SimpleQueue[tuple[int, IFunctionalNode, Future]] = (
+            queue.SimpleQueue()
+        )
+        limiter = ResourceLimiter(self._capacities)
+        limiter.validate(self._dag.get_functions())
+
+        with ThreadPoolExecutor(max_workers=self._n_threads) as pool:
+            while True:
+                # Start new inputs while the window has room.
+                while (
+                    not is_exhausted
+                    and len(in_flight) + len(finished) < self._max_in_flight
+                ):
+                    try:
+                        item = next(items)
+                    except StopIteration:
+                        is_exhausted = True
+                        break
+
+                    in_flight[n_started] = _PipelineItem(self._dag.clone())
+                    in_flight[n_started].start(item)
+                    in_flight[n_started].dispatch(
+                        pool, limiter, done_queue, n_started, args, kwargs
+                    )
+                    n_started += 1
+
+                if len(in_flight) == 0:
+                    break
+
+                _index, _done_node, _future = done_queue.get()
+                _error = _future.exception()
+                if _error is not None:
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    raise _error
+
+                limiter.release(_done_node)
+                state = in_flight[_index]
+                state.finish(_done_node, _future.result(), save_all_state)
+                # Released resources may let nodes of other inputs start,
+                # and earlier inputs are given them first.
+                for index, other in in_flight.items():
+                    other.dispatch(
+                        pool, limiter, done_queue, index, args, kwargs
+                    )
+                if not state.is_finished:
+                    continue
+
+                del in_flight[_index]
+                if not ordered:
+                    yield _index, state.results
+                    continue
+
+                finished[_index] = state.results
+                while next_index in finished:
+                    yield next_index, finished.pop(next_index)
+                    next_index += 1
+
+
+class _PipelineItem:
+    """State of execution for one input of StreamPipelineExecutor."""
+
+    def __init__(self, functional_dag: FunctionalDag) -> None:
+        self.dag = functional_dag
+        self.results: dict[str, Any] = {}
+        self.n_running = 0
+        # Ready nodes waiting for resources held by running nodes
+        self.pending: list[IFunctionalNode] = []
+
+    @property
+    def is_finished(self) -> bool:
+        return self.n_running == 0 and len(self.pending) == 0
+
+    def start(self, item: Any) -> None:  # noqa: ANN401
+        for node in self.dag.get_functions():
+            if node.n_predecessors == 0:
+                node.receive_args(item)
+
+    def dispatch(
+        self,
+        pool: ThreadPoolExecutor,
+        limiter: ResourceLimiter,
+        done_queue: queue.SimpleQueue[tuple[int, IFunctionalNode, Future]],
+        index: int,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        candidates = [*self.pending, *self.dag.get_ready()]
+        self.pending = []
+        for node in candidates:
+            if not limiter.acquire(node):
+                self.pending.append(node)
+                continue
+
+            future = pool.submit(node.run, *args, **kwargs)
+            future.add_done_callback(
+                functools.partial(_notify_item_done, done_queue, index, node)
+            )
+            self.n_running += 1
+
+    def finish(
+        self,
+        node: IFunctionalNode,
+        result: Any,  # noqa: ANN401
+        save_all_state: bool,
+    ) -> None:
+        self.n_running -= 1
+        self.dag.send(node.mut_name, result)
+        self.dag.done(node.mut_name)
+        if self.dag.check_last(node) or save_all_state:
+            self.results.update({node.mut_name: result})
+
+
+class StreamIncrementalExecutor:
+    """Incremental Executor for FunctionalDag Object."""
+
+    def __init__(
+        self,
+        functional_dag: FunctionalDag,
+        scheduler: IScheduler | None = None,
+    ) -> None:
+        """Incremental Executor for FunctionalDag Object.
+
+        Results of all functions are kept after each run. In the next
+        run, only functions invalidated by `invalidate` and their
+        descendants are run again, and kept results are reused
+        for the others. The first run executes all functions.
+
+        Please note that changes of input parameters are not detected.
+        Invalidate nodes which use the changed parameters.
+        Generator functions are always run again.
+
+        Parameters
+        ----------
+        functional_dag : FunctionalDag
+            FunctionalDag instance which is already constructed
+              from DagStream Object
+        scheduler : IScheduler | None, optional
+            Policy to decide which ready node runs first.
+             If None, FifoScheduler is used. by default None
+
+        Raises
+        ------
+        ValueError
+            raise this error when functional_dag is not constructed
+        """
+        if not isinstance(functional_dag, FunctionalDag):
+            raise ValueError(
+                "functional_dag is not a instance of FunctionalDag. "
+                "Maybe, you forget to call 'your_dagstream.construct()'"
+                " beforehand."
+            )
+        self._dag = functional_dag
+        self._scheduler = scheduler or FifoScheduler()
+        self._kept: dict[str, Any] = {}
+        self._dirty: set[str] = set()
+
+    @property
+    def dirty_nodes(self) -> set[str]:
+        """Names of nodes whose results are not reused in the next run"""
+        kept = set(self._kept) - self._dirty
+        return {
+            node.mut_name
+            for node in self._dag.get_functions()
+            if node.mut_name not in kept or node.is_generator
+        }
+
+    def invalidate(self, *nodes: IFunctionalNode | str) -> set[str]:
+        """Mark nodes and all of their descendants as dirty.
+
+        Parameters
+        ----------
+        *nodes : IFunctionalNode | str
+            nodes whose inputs are changed
+
+        Returns
+        -------
+        set[str]
+            names of nodes which are run again in the next run
+
+        Raises
+        ------
+        ValueError
+            raise this error when a node does not exist in functional dag
+        """
+        names: list[str] = []
+        for node in nodes:
+            name = node if isinstance(node, str) else node.mut_name
+            if not self._dag.check_exists(name):
+                raise ValueError(f"{name} does not exist in functional dag.")
+            names.append(name)
+
+        self._dirty |= self._dag.get_descendants(*names)
+        return self.dirty_nodes
+
+    def run(
+        self,
+        *args: Any,  # noqa: ANN401
+        first_args: tuple[Any] | None = None,
+        save_all_state: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Run dirty functions sequencially and reuse the other results.
+
+        Returns
+        -------
+        dict[str, Any]
+            Key is name of function, value is returned objects
+              from each function.
+        """
+        dirty = self.dirty_nodes
+        results: dict[str, Any] = {}
+        self._dag.reset()
+        self._scheduler.prepare(self._dag)
+
+        while self._dag.is_active:
+            nodes = self._scheduler.order(self._dag.get_ready())
+            for node in nodes:
+                if node.mut_name in dirty:
+                    if node.n_predecessors == 0 and first_args is not None:
+                        for arg in first_args:
+                            node.receive_args(arg)
+
+                    start = time.perf_counter()
+                    result = _share_chunks(
+                        self._dag, node, node.run(*args, **kwargs)
+                    )
+                    self._scheduler.record(
+                        node.mut_name, time.perf_counter() - start
+                    )
+                    self._kept[node.mut_name] = result
+                else:
+                    result = self._kept[node.mut_name]
+
+                self._dag.send(node.mut_name, result)
+                self._dag.done(node.mut_name)
+
+                if self._dag.check_last(node) or save_all_state:
+                    results.update({node.mut_name: result})
+
+        self._dirty.clear()
+        return results
+
+
+class StreamWorkerPool:
+    """Pool of worker processes for StreamParallelExecutor."""
+
+    def __init__(self, n_process: int = 1) -> None:
+        """Pool of worker processes for StreamParallelExecutor.
+
+        Worker processes are started once on first use and serve
+        many runs of StreamParallelExecutor, even if they are created
+        from different FunctionalDag objects.
+        Runs sharing one pool must not be executed at the same time.
+        Call close() or use this object as a context manager
+         to stop worker processes. Worker processes are also stopped
+         when this object is garbage collected or the interpreter
+         exits, so that an unclosed pool does not block shutdown.
+
+        Parameters
+        ----------
+        n_process : int, optional
+            The number of worker processes, by default 1
+
+        Raises
+        ------
+        ValueError
+            raise this error when n_process is lower than 0
+        """
+        self._n_processes = n_process
+        if self._n_processes <= 0:
+            raise ValueError(
+                f"n_processes must be larger than 0. Input: {n_process}"
+            )
+
+        self._task_queue: multi.Queue | None = None
+        self._done_queue: multi.Queue | None = None
+        # Each worker has its own queue to receive contexts of runs
+        self._context_queues: list[multi.Queue] = []
+        self._processes: list[multi.Process] = []
+        self._finalizer: Callable[[], Any] | None = None
+        self._run_counter = itertools.count()
+        # Interval in seconds to check liveness of worker processes
+        self._liveness_interval: float = 1.0
+
+    def __enter__(self) -> StreamWorkerPool:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def n_processes(self) -> int:
+        return self._n_processes
+
+    @property
+    def is_alive(self) -> bool:
+        """Check whether worker processes are started or not
+
+        Returns
+        -------
+        bool
+            True if worker processes are started and not closed yet.
+        """
+        return len(self._processes) != 0
+
+    def start(self) -> None:
+        """Start worker processes. Nothing happens if already started."""
+        if self.is_alive:
+            return
+
+        import multiprocessing as multi
+        from multiprocessing.util import Finalize
+
+        self._task_queue = multi.Queue()
+        self._done_queue = multi.Queue()
+        for _ in range(self._n_processes):
+            context_queue: multi.Queue = multi.Queue()
+            process = multi.Process(
+                target=_worker,
+                args=(self._task_queue, self._done_queue, context_queue),
+            )
+            process.start()
+            self._context_queues.append(context_queue)
+            self._processes.append(process)
+
+        # Non-daemon workers are joined at exit, and they wait for tasks
+        # forever unless STOP is sent beforehand. Finalizers of queues
+        # have exitpriority 10, so that STOP is sent before them.
+        self._finalizer = Finalize(
+            self,
+            _stop_workers,
+            args=(self._task_queue, list(self._processes)),
+            exitpriority=15,
+        )
+
+    def close(self) -> None:
+        """Stop worker processes and wait for them to exit."""
+        if not self.is_alive:
+            return
+
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+
+        self._processes.clear()
+        self.task_queue.close()
+        self.done_queue.close()
+        for context_queue in self._context_queues:
+            context_queue.close()
+        self._context_queues.clear()
+        self._task_queue = None
+        self._done_queue = None
+
+    def load(
+        self,
+        functions: tuple[Callable, ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        transport: ITransport | None = None,
+        cache: IResultCache | None = None,
+    ) -> int:
+        """Send a context of a new run to all workers.
+
+        The function table and common arguments are pickled only once
+        per worker. After that, each task carries only
+        an index of the function table and piped inputs.
+
+        Parameters
+        ----------
+        functions : tuple[Callable, ...]
+            function table of the run
+        args : tuple[Any, ...]
+            positional arguments passed to all functions
+        kwargs : dict[str, Any]
+            keyword arguments passed to all functions
+        transport : ITransport | None, optional
+            transport of piped inputs and results, by default None
+        cache : IResultCache | None, optional
+            cache looked up by workers before running functions,
+             by default None
+
+        Returns
+        -------
+        int
+            identifier of the run
+        """
+        self.start()
+        run_id = next(self._run_counter)
+        for context_queue in self._context_queues:
+            context_queue.put(
+                (run_id, functions, args, kwargs, transport, cache)
+            )
+        return run_id
+
+    def submit(self, run_id: int, node_id: int, received: list[Any]) -> None:
+        """Submit a task to workers.
+
+        Parameters
+        ----------
+        run_id : int
+            identifier of the run returned by load()
+        node_id : int
+            index of the function table
+        received : list[Any]
+            piped inputs of the function
+        """
+        self.task_queue.put((run_id, node_id, received))
+
+    def get_done(self) -> tuple[int, int, Any]:
+        """Wait for a finished task and return it.
+
+        This method blocks without consuming cpu time until a task
+        finishes. Liveness of worker processes is checked periodically
+        while waiting.
+
+        Returns
+        -------
+        tuple[int, int, Any]
+            identifier of the run, index of the function table
+             and result of the function
+
+        Raises
+        ------
+        DagStreamWorkerError
+            raise this error when a worker process exits unexpectedly
+        """
+        while True:
+            try:
+                run_id, node_id, payload = self.done_queue.get(
+                    timeout=self._liveness_interval
+                )
+            except queue.Empty:
+                pass
+            else:
+                return run_id, node_id, pickle.loads(payload)
+
+            for process in self._processes:
+                if not process.is_alive():
+                    raise DagStreamWorkerError(
+                        f"Worker process (pid={process.pid}) exits "
+                        f"unexpectedly. exit code: {process.exitcode}"
+                    )
+
+    @property
+    def task_queue(self) -> multi.Queue:
+        if self._task_queue is None:
+            raise ValueError("Worker pool is not started.")
+        return self._task_queue
+
+    @property
+    def done_queue(self) -> multi.Queue:
+        if self._done_queue is None:
+            raise ValueError("Worker pool is not started.")
+        return self._done_queue
+
 
 class StreamParallelExecutor:
     """Parallel Executor for FunctionalDag Object."""
 
     def __init__(
-        self, functional_dag: FunctionalDag, n_process: int = 1
+        self,
+        functional_dag: FunctionalDag,
+        n_process: int = 1,
+        pool: StreamWorkerPool | None = None,
+        transport: ITransport | None = None,
+        scheduler: IScheduler | None = None,
+        capacities: dict[str, float] | None = None,
+        cache: IResultCache | None = None,
+        track_memory: bool = False,
     ) -> None:
         """THIS IS EXPERIMENTAL FEATURE. Parallel Executor
           for FunctionalDag Object.
@@ -80,7 +1292,34 @@ class StreamParallelExecutor:
             FunctionalDag instance which is already constructed
               from DagStream Object
         n_processes : int, optional
-            The number of processes to run in parallel, by default 1
+            The number of processes to run in parallel, by default 1.
+             Ignored when pool is fed.
+        pool : StreamWorkerPool | None, optional
+            If fed, worker processes in the pool are reused and
+             they are not stopped when run() finishes.
+            If not fed, worker processes are started and stopped
+             in every run(). by default None
+        transport : ITransport | None, optional
+            If fed, piped inputs and results are transferred by it.
+             For example, SharedMemoryTransport passes numpy.ndarray
+             through shared memory blocks. by default None
+        scheduler : IScheduler | None, optional
+            Policy to decide which ready node starts first when
+             all processes are busy. If None, FifoScheduler is used.
+             by default None
+        capacities : dict[str, float] | None, optional
+            Capacities of resources, such as {"cpu": 16, "mem_gb": 64}.
+             A node starts only when resources declared in
+             its `resources` are available. by default None
+        cache : IResultCache | None, optional
+            If fed, workers look up results by fingerprints of inputs
+             before running functions. It should be shared between
+             processes, such as DiskCache. by default None
+        track_memory : bool, optional
+            If True, bytes of results held during a run are estimated
+             and recorded in stats. Estimation walks containers in
+             results, so that it slows down functions returning many
+             small objects. by default False
 
         Raises
         ------
@@ -95,11 +1334,26 @@ class StreamParallelExecutor:
             )
 
         self._dag = functional_dag
+        self._stats = RunStats()
         self._n_processes = n_process
         if self._n_processes <= 0:
             raise ValueError(
                 f"n_processes must be larger than 0. Input: {n_process}"
             )
+        self._pool = pool
+        self._transport = transport
+        self._scheduler = scheduler or FifoScheduler()
+        self._capacities = capacities
+        self._cache = cache
+        self._track_memory = track_memory
+
+    @property
+    def stats(self) -> RunStats:
+        """Statistics of the last run, such as peak_live_bytes.
+
+        Bytes of results are counted only when track_memory is True.
+        """
+        return self._stats
 
     def run(
         self,
@@ -112,6 +1366,9 @@ class StreamParallelExecutor:
 
         Parameters are passed to all functions.
         Please note that parameters are not shared between multiple processes.
+        If a function raises an exception, no more functions are
+        dispatched and the exception is raised again after running
+        functions finish.
 
         Returns
         -------
@@ -119,51 +1376,590 @@ class StreamParallelExecutor:
             Key is name of function, value is returned objects
               from each function.
         """
-        task_queue: multi.Queue = multi.Queue()
-        done_queue: multi.Queue = multi.Queue()
-        all_processes: list[multi.Process] = []
+        if self._pool is not None:
+            self._pool.start()
+            return self._run(
+                self._pool,
+                *args,
+                first_args=first_args,
+                save_all_state=save_all_state,
+                **kwargs,
+            )
+
+        with StreamWorkerPool(self._n_processes) as pool:
+            return self._run(
+                pool,
+                *args,
+                first_args=first_args,
+                save_all_state=save_all_state,
+                **kwargs,
+            )
+
+    def _run(
+        self,
+        pool: StreamWorkerPool,
+        *args: Any,  # noqa: ANN401
+        first_args: tuple[Any] | None = None,
+        save_all_state: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        all_nodes = tuple(self._dag.get_functions())
+        name2id = {node.mut_name: i for i, node in enumerate(all_nodes)}
+        transport = self._transport
+        run_id = pool.load(
+            tuple(node.get_user_function() for node in all_nodes),
+            args,
+            kwargs,
+            transport,
+            self._cache,
+        )
+        n_running = 0
+        error: _RemoteError | None = None
+        # Ready nodes are kept here until a process is available,
+        # so that the scheduler can choose which one starts first.
+        pending: list[IFunctionalNode] = []
+        start_times: dict[int, float] = {}
+        self._dag.reset()
+        self._scheduler.prepare(self._dag)
+        limiter = ResourceLimiter(self._capacities)
+        limiter.validate(all_nodes)
 
         results: dict[str, Any] = {}
+        self._stats = RunStats()
 
-        while self._dag.is_active:
-            nodes = self._dag.get_ready()
+        try:
+            while self._dag.is_active:
+                waiting: list[IFunctionalNode] = []
+                for node in self._scheduler.order(
+                    [*pending, *self._dag.get_ready()]
+                ):
+                    if n_running >= pool.n_processes or not limiter.acquire(
+                        node
+                    ):
+                        waiting.append(node)
+                        continue
+
+                    if node.n_predecessors == 0 and first_args is not None:
+                        for arg in first_args:
+                            node.receive_args(arg)
+
+                    node_id = name2id[node.mut_name]
+                    start_times[node_id] = time.perf_counter()
+                    pool.submit(run_id, node_id, node.get_received_args())
+                    n_running += 1
+                pending = waiting
+
+                if n_running == 0:
+                    # No node is running and no node is ready.
+                    break
+
+                # Block until one of running functions finishes.
+                _run_id, _node_id, _result = pool.get_done()
+                if _run_id != run_id:
+                    # result of an aborted run
+                    if transport is not None:
+                        transport.register(_result, 0)
+                    continue
+                n_running -= 1
+
+                if isinstance(_result, _RemoteError):
+                    error = _result
+                    break
+
+                _done_node = all_nodes[_node_id]
+                limiter.release(_done_node)
+                self._scheduler.record(
+                    _done_node.mut_name,
+                    time.perf_counter() - start_times.pop(_node_id),
+                )
+                if self._track_memory:
+                    _update_stats(
+                        self._stats,
+                        self._dag,
+                        _done_node,
+                        _result,
+                        self._dag.check_last(_done_node) or save_all_state,
+                    )
+                if self._dag.check_last(_done_node) or save_all_state:
+                    results.update(
+                        {
+                            _done_node.mut_name: _result
+                            if transport is None
+                            else transport.materialize(_result)
+                        }
+                    )
+
+                if transport is not None:
+                    for value in _done_node.get_received_args():
+                        transport.release(value)
+                    # Blocks without consumers are unlinked here.
+                    transport.register(
+                        _result,
+                        len(self._dag.get_pipe_successors(_done_node.mut_name)),
+                    )
+
+                self._dag.send(_done_node.mut_name, _result)
+                self._dag.done(_done_node.mut_name)
+
+            if error is not None:
+                # Wait for running tasks so that the pool can be reused.
+                while n_running > 0:
+                    _run_id, _, _result = pool.get_done()
+                    if transport is not None:
+                        transport.register(_result, 0)
+                    if _run_id == run_id:
+                        n_running -= 1
+                error.reraise()
+        finally:
+            if transport is not None:
+                transport.release_all()
+
+        return results
+
+
+class StreamDistributedExecutor:
+    """Distributed Executor for FunctionalDag Object."""
+
+    def __init__(
+        self,
+        functional_dag: FunctionalDag,
+        addresses: list[tuple[str, int]],
+        authkey: bytes,
+        scheduler: IScheduler | None = None,
+        capacities: dict[str, float] | None = None,
+        track_memory: bool = False,
+    ) -> None:
+        """THIS IS EXPERIMENTAL FEATURE. Distributed Executor
+          for FunctionalDag Object.
+
+        Ready nodes are sent to worker daemons over TCP.
+        Start worker daemons beforehand by
+        `python -m dagstream.worker_daemon`.
+        Functions are sent by pickle, so that they must be importable
+        on the hosts of worker daemons.
+
+        Parameters
+        ----------
+        functional_dag : FunctionalDag
+            FunctionalDag instance which is already constructed
+              from DagStream Object
+        addresses : list[tuple[str, int]]
+            pairs of host and port of worker daemons.
+             Each worker daemon runs one function at a time.
+        authkey : bytes
+            key to authenticate with worker daemons
+        scheduler : IScheduler | None, optional
+            Policy to decide which ready node starts first when
+             all workers are busy. If None, FifoScheduler is used.
+             by default None
+        capacities : dict[str, float] | None, optional
+            Capacities of resources, such as {"cpu": 16, "mem_gb": 64}.
+             A node starts only when resources declared in
+             its `resources` are available. by default None
+        track_memory : bool, optional
+            If True, bytes of results held during a run are estimated
+             and recorded in stats. Estimation walks containers in
+             results, so that it slows down functions returning many
+             small objects. by default False
+
+        Raises
+        ------
+        ValueError
+            raise this error when no addresses are fed
+        """
+        if not isinstance(functional_dag, FunctionalDag):
+            raise ValueError(
+                "functional_dag is not a instance of FunctionalDag. "
+                "Maybe, you forget to call 'your_dagstream.construct()'"
+                " beforehand."
+            )
+        if len(addresses) == 0:
+            raise ValueError("At least one address of worker is required.")
+
+        self._dag = functional_dag
+        self._stats = RunStats()
+        self._addresses = list(addresses)
+        self._authkey = authkey
+        self._scheduler = scheduler or FifoScheduler()
+        self._capacities = capacities
+        self._track_memory = track_memory
+
+    @property
+    def stats(self) -> RunStats:
+        """Statistics of the last run, such as peak_live_bytes.
+
+        Bytes of results are counted only when track_memory is True.
+        """
+        return self._stats
+
+    def run(
+        self,
+        *args: Any,  # noqa: ANN401
+        first_args: tuple[Any] | None = None,
+        save_all_state: bool = False,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Run functions on worker daemons.
+
+        Parameters are passed to all functions.
+        If a function raises an exception, no more functions are
+        dispatched and the exception is raised again after running
+        functions finish.
+
+        Returns
+        -------
+        dict[str, Any]
+            Key is name of function, value is returned objects
+              from each function.
+
+        Raises
+        ------
+        DagStreamWorkerError
+            raise this error when connection to a worker is lost
+        """
+        all_nodes = tuple(self._dag.get_functions())
+        name2id = {node.mut_name: i for i, node in enumerate(all_nodes)}
+        functions = tuple(node.get_user_function() for node in all_nodes)
+        run_id = 0
+
+        from multiprocessing.connection import Client
+
+        # Daemons unpickle the payload apart from the message, so that
+        # they can report functions which cannot be imported on them.
+        payload = pickle.dumps(
+            (functions, args, kwargs), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        connections: list[Connection] = []
+        try:
+            for address in self._addresses:
+                conn = Client(address, authkey=self._authkey)
+                connections.append(conn)
+                conn.send(("load", run_id, payload))
+
+            return self._run(
+                connections,
+                run_id,
+                all_nodes,
+                name2id,
+                first_args=first_args,
+                save_all_state=save_all_state,
+            )
+        finally:
+            for conn in connections:
+                try:
+                    conn.send(("close",))
+                except OSError:
+                    pass
+                conn.close()
+
+    def _run(
+        self,
+        connections: list[Connection],
+        run_id: int,
+        all_nodes: tuple[IFunctionalNode, ...],
+        name2id: dict[str, int],
+        first_args: tuple[Any] | None = None,
+        save_all_state: bool = False,
+    ) -> dict[str, Any]:
+        from multiprocessing.connection import wait as connection_wait
+
+        idle: list[Connection] = list(connections)
+        busy: dict[Connection, IFunctionalNode] = {}
+        error: _RemoteError | None = None
+        pending: list[IFunctionalNode] = []
+        start_times: dict[str, float] = {}
+        self._dag.reset()
+        self._scheduler.prepare(self._dag)
+        limiter = ResourceLimiter(self._capacities)
+        limiter.validate(all_nodes)
+
+        results: dict[str, Any] = {}
+        self._stats = RunStats()
+
+        while self._dag.is_active and error is None:
+            waiting: list[IFunctionalNode] = []
+            for node in self._scheduler.order(
+                [*pending, *self._dag.get_ready()]
+            ):
+                if len(idle) == 0 or not limiter.acquire(node):
+                    waiting.append(node)
+                    continue
 
-            for node in nodes:
                 if node.n_predecessors == 0 and first_args is not None:
                     for arg in first_args:
                         node.receive_args(arg)
 
-                task_queue.put((node, args, kwargs))
-
-            # Start worker processes
-            n_left_process = self._n_processes - len(all_processes)
-            for _ in range(n_left_process):
-                process = multi.Process(
-                    target=_worker, args=(task_queue, done_queue)
+                conn = idle.pop()
+                start_times[node.mut_name] = time.perf_counter()
+                conn.send(
+                    (
+                        "task",
+                        run_id,
+                        name2id[node.mut_name],
+                        node.get_received_args(),
+                    )
                 )
-                process.start()
-                all_processes.append(process)
+                busy[conn] = node
+            pending = waiting
+
+            if len(busy) == 0:
+                # No node is running and no node is ready.
+                break
 
-            while not done_queue.empty():
-                _done_node, _result = done_queue.get()
+            # Block until one of workers returns a result.
+            ready = cast("list[Connection]", connection_wait(list(busy)))
+            for conn in ready:
+                _, _, _, _result = self._receive(conn)
+                _done_node = busy.pop(conn)
+                idle.append(conn)
 
-                # NOTE: When using multiprocessing, id(IFunctionalNode)
-                # after running is not the same as one before running.
+                if isinstance(_result, _RemoteError):
+                    error = _result
+                    continue
 
+                limiter.release(_done_node)
+                self._scheduler.record(
+                    _done_node.mut_name,
+                    time.perf_counter() - start_times.pop(_done_node.mut_name),
+                )
+                if self._track_memory:
+                    _update_stats(
+                        self._stats,
+                        self._dag,
+                        _done_node,
+                        _result,
+                        self._dag.check_last(_done_node) or save_all_state,
+                    )
                 self._dag.send(_done_node.mut_name, _result)
                 self._dag.done(_done_node.mut_name)
 
                 if self._dag.check_last(_done_node) or save_all_state:
                     results.update({_done_node.mut_name: _result})
 
-            if not self._dag.is_active:
-                for _ in range(self._n_processes):
-                    task_queue.put("STOP")
+        if error is not None:
+            # Wait for running tasks so that workers can be reused.
+            for conn in busy:
+                self._receive(conn)
+            error.reraise()
 
         return results
 
+    def _receive(self, conn: Connection) -> tuple[str, int, int, Any]:
+        try:
+            return conn.recv()
+        except (EOFError, OSError) as ex:
+            raise DagStreamWorkerError(
+                "Connection to a worker daemon is lost."
+            ) from ex
+
+
+class _RemoteTraceback(Exception):
+    def __init__(self, tb: str) -> None:
+        self.tb = tb
+
+    def __str__(self) -> str:
+        return self.tb
+
+
+class _RemoteError:
+    """Exception raised in a worker process and sent to the parent."""
+
+    def __init__(self, exc: BaseException) -> None:
+        self._tb = "".join(
+            traceback.format_exception(type(exc), exc, exc.__traceback__)
+        )
+        try:
+            pickle.dumps(exc)
+        except Exception:
+            exc = RuntimeError(repr(exc))
+        self._exc = exc
+
+    def reraise(self) -> None:
+        raise self._exc from _RemoteTraceback(self._tb)
+
+
+def _notify_done(
+    done_queue: queue.SimpleQueue[tuple[IFunctionalNode, Future]],
+    node: IFunctionalNode,
+    future: Future,
+) -> None:
+    done_queue.put((node, future))
+
+
+def _share_chunks(
+    functional_dag: FunctionalDag,
+    node: IFunctionalNode,
+    result: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    # A generator can be iterated only once, so that it is expanded
+    #  into a list when several successors receive it.
+    if isinstance(result, Generator) and (
+        len(functional_dag.get_pipe_successors(node.mut_name)) > 1
+    ):
+        return list(result)
+    return result
+
+
+def _update_stats(
+    stats: RunStats,
+    functional_dag: FunctionalDag,
+    node: IFunctionalNode,
+    result: Any,  # noqa: ANN401
+    keep: bool,
+) -> None:
+    consumers = functional_dag.get_pipe_successors(node.mut_name)
+    stats.add(
+        node.mut_name,
+        result,
+        [consumer.mut_name for consumer in consumers],
+        keep=keep,
+    )
+    # Arguments of node are released by FunctionalDag.done
+    stats.release(node.mut_name, node.predecessors)
+
+
+def _find_cached(
+    cache: IResultCache | None,
+    node: IFunctionalNode,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> tuple[str | None, bool, Any]:
+    # Chunks of generators are not cached.
+    if cache is None or node.is_generator:
+        return None, False, None
+
+    key = make_cache_key(
+        node.get_user_function(), node.get_received_args(), args, kwargs
+    )
+    if key is None:
+        return None, False, None
+
+    is_hit, value = cache.get(key)
+    return key, is_hit, value
+
+
+def _has_channel(node: IFunctionalNode) -> bool:
+    return any(
+        isinstance(arg, ChunkChannel) for arg in node.get_received_args()
+    )
+
+
+def _produce(
+    node: IFunctionalNode,
+    channels: list[ChunkChannel],
+    is_collected: bool,
+    *args: Any,  # noqa: ANN401
+    **kwargs: Any,  # noqa: ANN401
+) -> list[Any] | None:
+    chunks = node.run(*args, **kwargs)
+    if len(channels) == 0:
+        return list(chunks)
+
+    collected: list[Any] = []
+    active = channels
+    try:
+        for chunk in chunks:
+            if is_collected:
+                collected.append(chunk)
+            active = [channel for channel in active if channel.put(chunk)]
+            if len(active) == 0 and not is_collected:
+                # No consumer reads chunks anymore.
+                break
+    except BaseException as ex:
+        for channel in channels:
+            channel.fail(ex)
+        raise
+    finally:
+        chunks.close()
+
+    for channel in channels:
+        channel.close()
+    return collected if is_collected else None
+
+
+def _run_future(
+    future: Future,
+    function: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> None:
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = function(*args, **kwargs)
+    except BaseException as ex:
+        future.set_exception(ex)
+    else:
+        future.set_result(result)
+
+
+def _notify_item_done(
+    done_queue: queue.SimpleQueue[tuple[int, IFunctionalNode, Future]],
+    index: int,
+    node: IFunctionalNode,
+    future: Future,
+) -> None:
+    done_queue.put((index, node, future))
+
+
+def _stop_workers(
+    task_queue: multi.Queue, processes: list[multi.Process]
+) -> None:
+    for _ in processes:
+        task_queue.put("STOP")
+    for process in processes:
+        process.join()
+
+
+def _worker(
+    input_queue: multi.Queue,
+    done_queue: multi.Queue,
+    context_queue: multi.Queue,
+):
+    # context of the current run:
+    # (run_id, functions, args, kwargs, transport, cache)
+    context: tuple | None = None
+
+    for run_id, node_id, received in iter(input_queue.get, "STOP"):
+        # Contexts of runs in which this worker had no task are skipped.
+        while context is None or context[0] != run_id:
+            context = context_queue.get()
+
+        _, functions, args, kwargs, transport, cache = context
+        try:
+            if transport is not None:
+                received = [transport.decode(v) for v in received]
+            received = load_lazy(received)
+
+            key = None
+            is_hit = False
+            if cache is not None:
+                key = make_cache_key(functions[node_id], received, args, kwargs)
+            if key is not None:
+                is_hit, result = cache.get(key)
+            if not is_hit:
+                result = functions[node_id](*received, *args, **kwargs)
+                if key is not None:
+                    cache.put(key, result)
+
+            if transport is not None:
+                result = transport.encode(result)
+        except Exception as ex:
+            result = _RemoteError(ex)
+
+        # Queue pickles items in a feeder thread, which only prints
+        # errors, so that a result which cannot be pickled is turned
+        # into an error here not to leave the parent waiting forever.
+        try:
+            payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as ex:
+            payload = pickle.dumps(
+                _RemoteError(ex), protocol=pickle.HIGHEST_PROTOCOL
+            )
+        del result
 
-def _worker(input_queue: multi.Queue, done_queue: multi.Queue):
-    for func, args, kwargs in iter(input_queue.get, "STOP"):
-        result = func.run(*args, **kwargs)
-        done_queue.put((func, result))
+        if transport is not None:
+            # Drop views of shared resources before closing them.
+            del received
+            transport.close()
+        done_queue.put((run_id, node_id, payload))
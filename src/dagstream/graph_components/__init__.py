@@ -3,8 +3,12 @@ from dagstream.graph_components._interface import (
     IDrawableNode,
     IFunctionalNode,
     INodeState,
+    ITopologicalOrder,
 )
 from dagstream.graph_components.dags import (  # NOQA
+    AncestorIndex,
+    ExecutionPlan,
     FunctionalDag,
     IDrawableGraph,
+    TopologicalOrder,
 )
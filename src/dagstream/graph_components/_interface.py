@@ -6,6 +6,8 @@ from typing import Any
 
 
 class IDrawableNode(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def display_name(self) -> str: ...
@@ -24,6 +26,8 @@ class IDrawableNode(metaclass=abc.ABCMeta):
 
 
 class IFunctionalNode(IDrawableNode, metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def display_name(self) -> str: ...
@@ -36,6 +40,18 @@ class IFunctionalNode(IDrawableNode, metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def mut_name(self) -> str: ...
 
+    @property
+    @abc.abstractmethod
+    def resources(self) -> dict[str, float]: ...
+
+    @resources.setter
+    @abc.abstractmethod
+    def resources(self, value: dict[str, float]) -> None: ...
+
+    @property
+    @abc.abstractmethod
+    def is_generator(self) -> bool: ...
+
     @property
     @abc.abstractmethod
     def predecessors(self) -> set[str]: ...
@@ -58,6 +74,21 @@ class IFunctionalNode(IDrawableNode, metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def succeed(self, *nodes: IFunctionalNode, pipe: bool = False) -> None: ...
 
+    @abc.abstractmethod
+    def extend_successors(self, edges: Iterable[tuple[str, bool]]) -> None:
+        """Add edges to successors without notifying them.
+
+        It is for bulk construction, in which the caller validates
+        all edges at once and adds predecessors of the other side
+        by extend_predecessors.
+        """
+        ...
+
+    @abc.abstractmethod
+    def extend_predecessors(self, node_names: Iterable[str]) -> None:
+        """Add names of predecessors without notifying them."""
+        ...
+
     @abc.abstractmethod
     def prepare(self) -> INodeState: ...
 
@@ -67,14 +98,22 @@ class IFunctionalNode(IDrawableNode, metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def get_received_args(self) -> list[Any]: ...
 
+    @abc.abstractmethod
+    def release_args(self) -> None: ...
+
     @abc.abstractmethod
     def get_user_function(self) -> Any: ...  # noqa: ANN401
 
     @abc.abstractmethod
     def run(self, *args: Any, **kwargs: Any) -> Any: ...  # noqa: ANN401
 
+    @abc.abstractmethod
+    async def run_async(self, *args: Any, **kwargs: Any) -> Any: ...  # noqa: ANN401
+
 
 class INodeState(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def n_predecessors(self) -> int:
@@ -96,6 +135,8 @@ class INodeState(metaclass=abc.ABCMeta):
 
 
 class IDagEdge(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def is_pipe(self) -> bool: ...
@@ -103,3 +144,18 @@ class IDagEdge(metaclass=abc.ABCMeta):
     @property
     @abc.abstractmethod
     def to_node(self) -> str: ...
+
+
+class ITopologicalOrder(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def add_edge(self, from_node: str, to_node: str) -> None:
+        """Update order before an edge is added.
+
+        Raises
+        ------
+        DagStreamCycleError
+            raise this error if the edge makes a cycle
+        """
+        ...
@@ -1,2 +1,6 @@
+from .ancestor_index import AncestorIndex  # NOQA
+from .execution_plan import ExecutionPlan  # NOQA
 from .functional_dag import FunctionalDag  # NOQA
 from .interface import IDrawableGraph  # NOQA
+from .topological_order import TopologicalOrder  # NOQA
+from .topology_file import dump_topology, load_topology  # NOQA
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from dagstream.graph_components._interface import IFunctionalNode
+
+from .topological_order import TopologicalOrder
+
+
+class AncestorIndex:
+    def __init__(
+        self,
+        name2node: dict[str, IFunctionalNode],
+        order: TopologicalOrder,
+    ) -> None:
+        """Cached sets of ancestors to extract sub graphs repeatedly.
+
+        Nodes are numbered in the order they are added, and the set of
+        a node and all of its ancestors is held as bits of an int.
+        A sub graph is extracted by OR of these bits, so a node whose
+        ancestors are already computed is not walked again.
+        All cached sets are dropped when the version of order changes,
+        that is, when nodes or edges are added.
+
+        Parameters
+        ----------
+        name2node : dict[str, IFunctionalNode]
+            Key is name of node, value is node. It is referred to
+             look up edges, so nodes added later are also visible.
+        order : TopologicalOrder
+            order of the same nodes, which tells changes of the graph
+        """
+        self._name2node = name2node
+        self._order = order
+        self._names: list[str] = []
+        self._name2index: dict[str, int] = {}
+        self._closures: dict[str, int] = {}
+        self._version = -1
+
+    @property
+    def n_cached(self) -> int:
+        """The number of nodes whose ancestors are cached"""
+        return len(self._closures)
+
+    def extract(self, node_names: Iterable[str]) -> dict[str, IFunctionalNode]:
+        """Extract nodes and all of their ancestors.
+
+        Parameters
+        ----------
+        node_names : Iterable[str]
+            names of nodes which must be included
+
+        Returns
+        -------
+        dict[str, IFunctionalNode]
+            Key is name of node, value is node.
+             Nodes are sorted in the order they were added.
+        """
+        self._refresh()
+
+        bits = 0
+        for name in node_names:
+            bits |= self._get_closure(name)
+
+        # Indices of set bits are found by scanning a binary string
+        digits = format(bits, "b")[::-1]
+        names = self._names
+        name2node = self._name2node
+        extracted: dict[str, IFunctionalNode] = {}
+        index = digits.find("1")
+        while index != -1:
+            name = names[index]
+            extracted[name] = name2node[name]
+            index = digits.find("1", index + 1)
+        return extracted
+
+    def _refresh(self) -> None:
+        if self._version == self._order.version:
+            return
+
+        self._closures.clear()
+        # Nodes are never removed, so new ones are appended
+        for name in list(self._name2node)[len(self._names) :]:
+            self._name2index[name] = len(self._names)
+            self._names.append(name)
+        self._version = self._order.version
+
+    def _get_closure(self, node_name: str) -> int:
+        closure = self._closures.get(node_name)
+        if closure is not None:
+            return closure
+
+        # Walk ancestors, and stop at ones which are already cached
+        closures = self._closures
+        name2index = self._name2index
+        name2node = self._name2node
+        flags = bytearray(len(self._names) // 8 + 1)
+        closure = 0
+        visited = {node_name}
+        stack = [node_name]
+        while len(stack) != 0:
+            name = stack.pop()
+            cached = closures.get(name)
+            if cached is not None:
+                closure |= cached
+                continue
+
+            index = name2index[name]
+            flags[index >> 3] |= 1 << (index & 7)
+            for from_node in name2node[name].predecessors:
+                if from_node not in visited:
+                    visited.add(from_node)
+                    stack.append(from_node)
+
+        closure |= int.from_bytes(flags, "little")
+        self._closures[node_name] = closure
+        return closure
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable
+from typing import Any
+
+from dagstream.graph_components._interface import IFunctionalNode
+
+
+class ExecutionPlan:
+    def __init__(self, name2nodes: dict[str, IFunctionalNode]) -> None:
+        """Compiled topology of a functional dag.
+
+        Nodes are numbered from 0 to N-1, and edges are stored in
+        compressed sparse row (CSR) arrays, so that executors can
+        update scheduling state by integer indices.
+
+        - Successors of node i are targets[offsets[i]:offsets[i + 1]],
+          and pipe_mask has 1 for pipe edges at the same positions.
+        - Predecessors connected by pipe edges to node i are
+          pipe_sources[pipe_offsets[i]:pipe_offsets[i + 1]].
+
+        Edges to nodes outside of name2nodes are ignored.
+
+        Parameters
+        ----------
+        name2nodes : dict[str, IFunctionalNode]
+            Key is name of node, value is node
+        """
+        self._nodes: tuple[IFunctionalNode, ...] = tuple(name2nodes.values())
+        self._names: tuple[str, ...] = tuple(name2nodes.keys())
+        self._name2index: dict[str, int] = {
+            name: i for i, name in enumerate(self._names)
+        }
+        self._functions: tuple[Callable[..., Any], ...] = tuple(
+            node.get_user_function() for node in self._nodes
+        )
+
+        n_nodes = len(self._nodes)
+        self._offsets = array("q", [0])
+        self._targets = array("q")
+        self._pipe_mask = array("b")
+        self._in_degrees = array("q", bytes(8 * n_nodes))
+        pipe_sources: list[list[int]] = [[] for _ in range(n_nodes)]
+
+        for i, node in enumerate(self._nodes):
+            for edge in node.successors:
+                target = self._name2index.get(edge.to_node)
+                if target is None:
+                    continue
+                self._targets.append(target)
+                self._pipe_mask.append(1 if edge.is_pipe else 0)
+                self._in_degrees[target] += 1
+                if edge.is_pipe:
+                    pipe_sources[target].append(i)
+            self._offsets.append(len(self._targets))
+
+        self._pipe_offsets = array("q", [0])
+        self._pipe_sources = array("q")
+        for sources in pipe_sources:
+            self._pipe_sources.extend(sources)
+            self._pipe_offsets.append(len(self._pipe_sources))
+
+        self._n_pipe_successors = array(
+            "q",
+            [
+                sum(self._pipe_mask[self._offsets[i] : self._offsets[i + 1]])
+                for i in range(n_nodes)
+            ],
+        )
+        self._is_last = array(
+            "b",
+            [
+                1 if self._offsets[i] == self._offsets[i + 1] else 0
+                for i in range(n_nodes)
+            ],
+        )
+        # Nodes without predecessors, including ones outside of this dag
+        self._sources = array(
+            "q",
+            [
+                i
+                for i, node in enumerate(self._nodes)
+                if node.n_predecessors == 0
+            ],
+        )
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def nodes(self) -> tuple[IFunctionalNode, ...]:
+        return self._nodes
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return self._names
+
+    @property
+    def functions(self) -> tuple[Callable[..., Any], ...]:
+        """User functions of nodes"""
+        return self._functions
+
+    @property
+    def offsets(self) -> array:
+        return self._offsets
+
+    @property
+    def targets(self) -> array:
+        return self._targets
+
+    @property
+    def pipe_mask(self) -> array:
+        return self._pipe_mask
+
+    @property
+    def in_degrees(self) -> array:
+        return self._in_degrees
+
+    @property
+    def pipe_offsets(self) -> array:
+        return self._pipe_offsets
+
+    @property
+    def pipe_sources(self) -> array:
+        return self._pipe_sources
+
+    @property
+    def n_pipe_successors(self) -> array:
+        return self._n_pipe_successors
+
+    @property
+    def is_last(self) -> array:
+        return self._is_last
+
+    @property
+    def sources(self) -> array:
+        return self._sources
+
+    def get_index(self, name: str) -> int:
+        return self._name2index[name]
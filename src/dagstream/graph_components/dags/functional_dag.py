@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import os
 from collections.abc import Iterable
 from typing import Any
 
@@ -8,36 +10,156 @@ from dagstream.graph_components._interface import (
     IFunctionalNode,
     INodeState,
 )
+from dagstream.stores import IResultStore
 
+from .execution_plan import ExecutionPlan
 from .interface import IDrawableGraph
+from .topology_file import dump_topology
 
 
 class FunctionalDag(IDrawableGraph):
-    def __init__(self, name2nodes: dict[str, IFunctionalNode]) -> None:
+    def __init__(
+        self,
+        name2nodes: dict[str, IFunctionalNode],
+        store: IResultStore | None = None,
+    ) -> None:
         self._name2nodes = name2nodes
-        self._n_finished: int = 0
+        self._store = store
         self._n_functions: int = len(self._name2nodes)
 
-        self._name2state: dict[str, INodeState] = {
-            node.mut_name: node.prepare() for node in name2nodes.values()
+        # Topology is fixed after construction and shared by all runs.
+        self._source_nodes: tuple[IFunctionalNode, ...] = tuple(
+            node for node in name2nodes.values() if node.n_predecessors == 0
+        )
+        # name of node -> (name of successor, is pipe) in this dag
+        self._successors: dict[str, tuple[tuple[str, bool], ...]] = {
+            name: tuple(
+                (edge.to_node, edge.is_pipe)
+                for edge in node.successors
+                if edge.to_node in name2nodes
+            )
+            for name, node in name2nodes.items()
         }
-        self._ready_nodes: list[IFunctionalNode] = [
-            node
-            for node in name2nodes.values()
-            if self._name2state[node.mut_name].is_ready
-        ]
-
         self._last_node_names: set[str] = {
-            node.mut_name
-            for node in name2nodes.values()
-            if self._is_last_node(node)
+            name
+            for name, successors in self._successors.items()
+            if len(successors) == 0
+        }
+        self._pipe_successors: dict[str, tuple[IFunctionalNode, ...]] = {
+            name: tuple(
+                name2nodes[to_node]
+                for to_node, is_pipe in successors
+                if is_pipe
+            )
+            for name, successors in self._successors.items()
         }
 
-    def _is_last_node(self, node: IFunctionalNode) -> bool:
-        n_successors = sum(
-            [1 for edge in node.successors if edge.to_node in self._name2nodes]
-        )
-        return n_successors == 0
+        # name of node -> pipe successors which can read its chunks
+        #  while it is running. Computed when the node streams first.
+        self._stream_consumers: dict[str, tuple[IFunctionalNode, ...]] = {}
+
+        self._name2state: dict[str, INodeState] = {}
+        self._ready_nodes: list[IFunctionalNode] = []
+        self._n_finished: int = 0
+        # name of streaming node -> names of successors reading chunks
+        self._streamed: dict[str, set[str]] = {}
+        # name of node -> key of its result in store
+        self._stored_keys: dict[str, str] = {}
+        self._plan: ExecutionPlan | None = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset state of execution, so that the dag can run again.
+
+        Executors call this at the start of every run. Arguments
+        received by nodes are dropped, but the topology computed at
+        construction is reused.
+        """
+        self._name2state = {
+            name: node.prepare() for name, node in self._name2nodes.items()
+        }
+        self._ready_nodes = list(self._source_nodes)
+        self._n_finished = 0
+        self._streamed = {}
+        self._stored_keys = {}
+
+    def clone(self) -> FunctionalDag:
+        """Create a FunctionalDag which has the same structure
+        and its own state of execution.
+
+        Nodes are shallow-copied, so that arguments received by nodes
+        in one FunctionalDag are not shared with others. Topology and
+        the compiled plan hold no state of execution, so that they are
+        shared with the clone instead of being computed again.
+
+        Returns
+        -------
+        FunctionalDag
+            dag structure object which is ready to run
+        """
+        name2nodes = {
+            name: copy.copy(node) for name, node in self._name2nodes.items()
+        }
+
+        def _replace(
+            nodes: tuple[IFunctionalNode, ...],
+        ) -> tuple[IFunctionalNode, ...]:
+            return tuple(name2nodes[node.mut_name] for node in nodes)
+
+        cloned = FunctionalDag.__new__(FunctionalDag)
+        cloned._name2nodes = name2nodes
+        cloned._store = self._store
+        cloned._n_functions = self._n_functions
+        cloned._successors = self._successors
+        cloned._last_node_names = self._last_node_names
+        cloned._plan = self._plan
+        # Tables holding nodes refer to the copied nodes.
+        cloned._source_nodes = _replace(self._source_nodes)
+        cloned._pipe_successors = {
+            name: _replace(nodes)
+            for name, nodes in self._pipe_successors.items()
+        }
+        cloned._stream_consumers = {
+            name: _replace(nodes)
+            for name, nodes in self._stream_consumers.items()
+        }
+        cloned.reset()
+        return cloned
+
+    def compile(self) -> ExecutionPlan:
+        """Compile topology into an ExecutionPlan.
+
+        Executors which support compiled plans schedule nodes by
+        integer indices and arrays instead of node states.
+        The plan is computed once and reused by later runs.
+
+        Returns
+        -------
+        ExecutionPlan
+            compiled topology of this functional dag
+        """
+        if self._plan is None:
+            self._plan = ExecutionPlan(self._name2nodes)
+        return self._plan
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Save topology of this functional dag to a JSON file.
+
+        It can be loaded by DagStream.load. Functions are saved as
+        import paths, so they must be defined at the top level of
+        modules.
+
+        Parameters
+        ----------
+        path : str | os.PathLike[str]
+            path of the file
+        """
+        dump_topology(self._name2nodes.values(), path)
+
+    @property
+    def plan(self) -> ExecutionPlan | None:
+        """Compiled plan. None if compile has not been called."""
+        return self._plan
 
     @property
     def is_active(self) -> bool:
@@ -82,27 +204,161 @@ class FunctionalDag(IDrawableGraph):
     def get_drawable_nodes(self) -> Iterable[IDrawableNode]:
         return self._name2nodes.values()
 
+    def get_functions(self) -> Iterable[IFunctionalNode]:
+        return self._name2nodes.values()
+
+    def get_descendants(self, *node_names: str) -> set[str]:
+        """Get names of nodes which depend on the nodes directly
+        or transitively.
+
+        Parameters
+        ----------
+        *node_names : str
+            names of nodes to start from
+
+        Returns
+        -------
+        set[str]
+            names of the nodes and all of their successors
+              in this functional dag
+        """
+        visited: set[str] = set()
+        stack = [name for name in node_names if self.check_exists(name)]
+        while len(stack) != 0:
+            name = stack.pop()
+            if name in visited:
+                continue
+            visited.add(name)
+
+            for edge in self._name2nodes[name].successors:
+                if self.check_exists(edge.to_node):
+                    stack.append(edge.to_node)
+        return visited
+
     def get_ready(self) -> tuple[IFunctionalNode, ...]:
         result = tuple(self._ready_nodes)
         self._ready_nodes.clear()
         return result
 
+    def get_pipe_successors(
+        self, node_name: str
+    ) -> tuple[IFunctionalNode, ...]:
+        """Get successors which receive the result of node.
+
+        Parameters
+        ----------
+        node_name : str
+            name of node
+
+        Returns
+        -------
+        tuple[IFunctionalNode, ...]
+            successors connected by pipe edges in this functional dag
+        """
+        return self._pipe_successors[node_name]
+
+    @property
+    def store(self) -> IResultStore | None:
+        return self._store
+
     def send(self, node_name: str, result: Any) -> None:  # noqa: ANN401
-        node = self._name2nodes[node_name]
+        """Pass result of node to successors connected by pipe edges.
 
-        for edge in node.successors:
-            if not edge.is_pipe:
-                continue
+        If a result store is set, successors receive the object
+        returned from the store instead of result. Successors which
+        read chunks of the node by `open_stream` receive nothing.
 
-            if not self.check_exists(edge.to_node):
-                continue
+        Parameters
+        ----------
+        node_name : str
+            name of node which returns result
+        result : Any
+            returned object from node
+        """
+        consumers = self.get_pipe_successors(node_name)
+        streamed = self._streamed.get(node_name)
+        if streamed is not None:
+            consumers = tuple(
+                node for node in consumers if node.mut_name not in streamed
+            )
+        if self._store is not None and len(consumers) > 0:
+            key, result = self._store.put(result, len(consumers))
+            self._stored_keys[node_name] = key
 
-            next_node = self._name2nodes[edge.to_node]
+        for next_node in consumers:
             next_node.receive_args(result)
 
+    def open_stream(self, node_name: str) -> tuple[IFunctionalNode, ...]:
+        """Release successors connected by pipe edges before the node
+        finishes, so that they can consume chunks while it is running.
+
+        A pipe successor is not released if one of its other
+        predecessors depends on the node, because it cannot start
+        until the node finishes, and the node would wait for it to read
+        chunks forever. Such successors and successors connected by
+        non-pipe edges wait until the node is registered as finished
+        by `done`, and receive the result passed to `send`.
+
+        Parameters
+        ----------
+        node_name : str
+            name of node which starts to yield chunks
+
+        Returns
+        -------
+        tuple[IFunctionalNode, ...]
+            successors which receive chunks from the node
+        """
+        consumers = self._stream_consumers.get(node_name)
+        if consumers is None:
+            consumers = self._find_stream_consumers(node_name)
+            self._stream_consumers[node_name] = consumers
+
+        self._streamed[node_name] = {
+            consumer.mut_name for consumer in consumers
+        }
+        for consumer in consumers:
+            self._forward(consumer.mut_name)
+        return consumers
+
+    def _find_stream_consumers(
+        self, node_name: str
+    ) -> tuple[IFunctionalNode, ...]:
+        descendants = self.get_descendants(node_name)
+        return tuple(
+            consumer
+            for consumer in self.get_pipe_successors(node_name)
+            if not any(
+                name != node_name and name in descendants
+                for name in consumer.predecessors
+            )
+        )
+
+    def _release_stored(
+        self, store: IResultStore, consumer: IFunctionalNode
+    ) -> None:
+        for name in consumer.predecessors:
+            if name not in self._stored_keys:
+                continue
+            if consumer.mut_name in self._streamed.get(name, ()):
+                # It read chunks instead of the stored result
+                continue
+
+            for edge in self._name2nodes[name].successors:
+                if edge.to_node == consumer.mut_name and edge.is_pipe:
+                    store.release(self._stored_keys[name])
+
+    def _forward(self, node_name: str) -> None:
+        self._name2state[node_name].forward()
+        if self._name2state[node_name].is_ready:
+            self._ready_nodes.append(self._name2nodes[node_name])
+
     def done(self, *node_names: str) -> None:
         """Register nodes as finished and update state
 
+        Arguments received by finished nodes are released, so that
+        results of predecessors are freed once all consumers have run.
+
         Parameters
         ----------
         *finished_nodes : IFunctionalNode
@@ -112,10 +368,13 @@ class FunctionalDag(IDrawableGraph):
         for name in node_names:
             self._n_finished += 1
             finished_node = self._name2nodes[name]
-            for edge in finished_node.successors:
-                if not self.check_exists(edge.to_node):
+            finished_node.release_args()
+            if self._store is not None:
+                self._release_stored(self._store, finished_node)
+            # Successors reading chunks are already forwarded
+            streamed = self._streamed.get(name, ())
+            for to_node, _ in self._successors[name]:
+                if to_node in streamed:
                     continue
 
-                self._name2state[edge.to_node].forward()
-                if self._name2state[edge.to_node].is_ready:
-                    self._ready_nodes.append(self._name2nodes[edge.to_node])
+                self._forward(to_node)
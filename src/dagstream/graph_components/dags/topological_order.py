@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import collections
+from collections.abc import Iterable, Mapping
+
+from dagstream.graph_components._interface import (
+    IFunctionalNode,
+    ITopologicalOrder,
+)
+from dagstream.utils.errors import DagStreamCycleError
+
+# Searches are always allowed to visit this number of nodes in total,
+# so that cycles in small graphs are found when edges are added.
+_MIN_SEARCH_BUDGET = 4096
+
+
+class TopologicalOrder(ITopologicalOrder):
+    def __init__(self, name2node: dict[str, IFunctionalNode]) -> None:
+        """Topological order of nodes kept up to date while edges
+        are added.
+
+        Every node has a position, and a node precedes its successors.
+        An edge which keeps this order is accepted immediately.
+        Otherwise, only nodes between the two positions are searched
+        and reordered, according to the algorithm by Pearce and Kelly.
+        So, a cycle is found when the edge which makes it is added.
+
+        Searches may visit many nodes for each edge when edges are
+        added against the order. Once the nodes visited by searches
+        outnumber nodes and edges of the graph, later edges are
+        accepted without searches, and the whole graph is sorted once
+        by `validate`. Then, a cycle is found by `validate`, which is
+        called by DagStream.construct.
+
+        Parameters
+        ----------
+        name2node : dict[str, IFunctionalNode]
+            Key is name of node, value is node. It is referred to
+             look up edges, so nodes added later are also visible.
+        """
+        self._name2node = name2node
+        self._positions: dict[str, int] = {}
+        self._next_position = 0
+        self._version = 0
+        # True if edges are added without updating positions
+        self._is_dirty = False
+        self._n_edges = 0
+        # The number of nodes visited by searches since the last sort
+        self._n_visited = 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    @property
+    def version(self) -> int:
+        """Counter increased whenever a node or an edge is added.
+
+        It is used to invalidate data computed from the graph.
+        """
+        return self._version
+
+    def add_node(self, name: str) -> None:
+        """Put a node without edges at the end of the order."""
+        if name in self._positions:
+            return
+        self._positions[name] = self._next_position
+        self._next_position += 1
+        self._version += 1
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if edges are added after positions are updated last."""
+        return self._is_dirty
+
+    def get_position(self, name: str) -> int:
+        """Position of node. Predecessors have smaller positions."""
+        self.validate()
+        return self._positions[name]
+
+    def get_order(self) -> list[str]:
+        """Names of nodes sorted in topological order."""
+        self.validate()
+        return self._get_current_order()
+
+    def validate(self) -> None:
+        """Sort the whole graph if edges are added without searches.
+
+        Raises
+        ------
+        DagStreamCycleError
+            raise this error if edges make a cycle
+        """
+        if self._is_dirty:
+            self._sort({})
+
+    def _get_current_order(self) -> list[str]:
+        return sorted(self._positions, key=self._positions.__getitem__)
+
+    def add_edge(self, from_node: str, to_node: str) -> None:
+        """Update order before an edge is added.
+
+        Edges from or to nodes which are not in this order are ignored.
+
+        Parameters
+        ----------
+        from_node : str
+            name of predecessor
+        to_node : str
+            name of successor
+
+        Raises
+        ------
+        DagStreamCycleError
+            raise this error if the edge makes a cycle
+        """
+        upper = self._positions.get(from_node)
+        lower = self._positions.get(to_node)
+        if upper is None or lower is None:
+            return
+        if from_node == to_node:
+            raise _cycle_error([from_node, to_node])
+
+        self._version += 1
+        self._n_edges += 1
+        if self._is_dirty or upper < lower:
+            return
+
+        forward = self._search_forward(to_node, from_node, upper)
+        backward = self._search_backward(from_node, lower)
+        self._reorder(backward, forward)
+
+        self._n_visited += len(forward) + len(backward)
+        budget = len(self._positions) + self._n_edges
+        if self._n_visited > max(budget, _MIN_SEARCH_BUDGET):
+            # Sorting the whole graph once is cheaper from now on
+            self._is_dirty = True
+
+    def add_edges(self, successors: Mapping[str, Iterable[str]]) -> None:
+        """Update order before many edges are added at once.
+
+        If all new edges follow the current order, nothing is moved.
+        Otherwise, the whole graph with the new edges is sorted once
+        by Kahn's algorithm, which costs time linear in the size of
+        the graph regardless of the number of new edges. Edges from or to nodes
+        which are not in this order are ignored.
+
+        Parameters
+        ----------
+        successors : Mapping[str, Iterable[str]]
+            Key is name of predecessor, value is names of successors
+             connected by the new edges
+
+        Raises
+        ------
+        DagStreamCycleError
+            raise this error if the edges make a cycle.
+             Order is not changed in that case.
+        """
+        positions = self._positions
+        self._version += 1
+        # If all new edges follow the current order, it is kept.
+        if not self._is_dirty and all(
+            positions[from_node] < positions[to_node]
+            for from_node, to_nodes in successors.items()
+            if from_node in positions
+            for to_node in to_nodes
+            if to_node in positions
+        ):
+            return
+
+        self._sort(successors)
+
+    def _sort(self, successors: Mapping[str, Iterable[str]]) -> None:
+        # Sort nodes with existing edges and new edges by Kahn's algorithm
+        positions = self._positions
+        # Nodes keep their current order as far as possible
+        names = self._get_current_order()
+        adjacency: dict[str, list[str]] = {}
+        in_degrees = dict.fromkeys(names, 0)
+        for name in names:
+            to_nodes = [
+                edge.to_node for edge in self._name2node[name].successors
+            ]
+            to_nodes.extend(successors.get(name, ()))
+            to_nodes = [to_node for to_node in to_nodes if to_node in positions]
+            adjacency[name] = to_nodes
+            for to_node in to_nodes:
+                in_degrees[to_node] += 1
+
+        ready = collections.deque(
+            name for name in names if in_degrees[name] == 0
+        )
+        sorted_names: list[str] = []
+        while len(ready) != 0:
+            name = ready.popleft()
+            sorted_names.append(name)
+            for to_node in adjacency[name]:
+                in_degrees[to_node] -= 1
+                if in_degrees[to_node] == 0:
+                    ready.append(to_node)
+
+        if len(sorted_names) < len(names):
+            raise _cycle_error(_find_cycle(adjacency, in_degrees))
+
+        self._positions = {name: i for i, name in enumerate(sorted_names)}
+        self._next_position = len(sorted_names)
+        self._is_dirty = False
+        self._n_edges = sum(len(to_nodes) for to_nodes in adjacency.values())
+        self._n_visited = 0
+
+    def _search_forward(self, start: str, target: str, upper: int) -> list[str]:
+        # Nodes reachable from start and placed before target
+        parents: dict[str, str | None] = {start: None}
+        stack = [start]
+        while len(stack) != 0:
+            name = stack.pop()
+            for edge in self._name2node[name].successors:
+                to_node = edge.to_node
+                if to_node == target:
+                    raise _cycle_error(
+                        [target, *_trace_path(parents, name), target]
+                    )
+
+                position = self._positions.get(to_node)
+                if position is None or position > upper:
+                    continue
+                if to_node in parents:
+                    continue
+                parents[to_node] = name
+                stack.append(to_node)
+        return list(parents)
+
+    def _search_backward(self, start: str, lower: int) -> list[str]:
+        # Nodes which reach start and are placed after lower
+        visited = {start}
+        stack = [start]
+        while len(stack) != 0:
+            name = stack.pop()
+            for from_node in self._name2node[name].predecessors:
+                position = self._positions.get(from_node)
+                if position is None or position < lower:
+                    continue
+                if from_node in visited:
+                    continue
+                visited.add(from_node)
+                stack.append(from_node)
+        return list(visited)
+
+    def _reorder(self, backward: list[str], forward: list[str]) -> None:
+        # Positions held by both groups are reused. Ancestors of
+        # the new predecessor are moved before descendants of
+        # the new successor, keeping relative orders in each group.
+        positions = self._positions
+        backward.sort(key=positions.__getitem__)
+        forward.sort(key=positions.__getitem__)
+        pool = sorted(positions[name] for name in backward + forward)
+        for name, position in zip(backward + forward, pool, strict=True):
+            positions[name] = position
+
+
+def _find_cycle(
+    adjacency: dict[str, list[str]], in_degrees: dict[str, int]
+) -> list[str]:
+    # Every node left by Kahn's algorithm has a predecessor which is
+    # also left, so following them reaches a node seen before.
+    predecessors: dict[str, list[str]] = {
+        name: [] for name, degree in in_degrees.items() if degree > 0
+    }
+    for name in predecessors:
+        for to_node in adjacency[name]:
+            if to_node in predecessors:
+                predecessors[to_node].append(name)
+
+    name = next(iter(predecessors))
+    trace: dict[str, int] = {}
+    path: list[str] = []
+    while name not in trace:
+        trace[name] = len(path)
+        path.append(name)
+        name = predecessors[name][0]
+
+    cycle = path[trace[name] :][::-1]
+    return [*cycle, cycle[0]]
+
+
+def _trace_path(parents: dict[str, str | None], last: str) -> list[str]:
+    path: list[str] = []
+    name: str | None = last
+    while name is not None:
+        path.append(name)
+        name = parents[name]
+    return path[::-1]
+
+
+def _cycle_error(cycle: list[str]) -> DagStreamCycleError:
+    return DagStreamCycleError(
+        "Detect cycle in your definition of dag: " + " -> ".join(cycle),
+        cycle=cycle,
+    )
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import collections
+import json
+import os
+from collections.abc import Iterable
+from typing import Any
+
+from dagstream.graph_components._interface import IFunctionalNode
+from dagstream.utils import get_import_path
+
+TOPOLOGY_FORMAT = "dagstream.topology"
+TOPOLOGY_VERSION = 1
+
+
+def dump_topology(
+    nodes: Iterable[IFunctionalNode], path: str | os.PathLike[str]
+) -> None:
+    """Write topology of nodes to a versioned JSON file.
+
+    Nodes are written in topological order, so that a reader can add
+    them without checking cycles. Functions are written as import
+    paths. Edges to nodes which are not included are dropped.
+
+    Parameters
+    ----------
+    nodes : Iterable[IFunctionalNode]
+        nodes to write
+    path : str | os.PathLike[str]
+        path of the file
+
+    Raises
+    ------
+    ValueError
+        raise this error if a function cannot be imported by its path
+    """
+    name2node = {node.mut_name: node for node in nodes}
+    names = _sort_topologically(name2node)
+    name2index = {name: i for i, name in enumerate(names)}
+
+    records: list[dict[str, Any]] = []
+    # (predecessor, successor, pipe) of each edge are flattened,
+    # so that reading does not create a list for each edge.
+    edges: list[int] = []
+    for i, name in enumerate(names):
+        node = name2node[name]
+        record: dict[str, Any] = {
+            "name": name,
+            "display_name": node.display_name,
+            "function": get_import_path(node.get_user_function()),
+        }
+        if len(node.resources) != 0:
+            record["resources"] = node.resources
+        records.append(record)
+
+        for edge in node.successors:
+            if edge.to_node in name2index:
+                edges.extend((i, name2index[edge.to_node], int(edge.is_pipe)))
+
+    content = {
+        "format": TOPOLOGY_FORMAT,
+        "version": TOPOLOGY_VERSION,
+        "nodes": records,
+        "edges": edges,
+    }
+    # json.dumps is faster than json.dump, which writes small chunks.
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(content, separators=(",", ":")))
+
+
+def load_topology(
+    path: str | os.PathLike[str],
+) -> tuple[list[dict[str, Any]], list[int]]:
+    """Read topology written by dump_topology.
+
+    Parameters
+    ----------
+    path : str | os.PathLike[str]
+        path of the file
+
+    Returns
+    -------
+    tuple[list[dict[str, Any]], list[int]]
+        Records of nodes in topological order, and edges as
+         a flat list repeating index of predecessor,
+         index of successor and 1 if pipe else 0
+
+    Raises
+    ------
+    ValueError
+        raise this error if the file is not a topology file or
+         it is written in an unsupported version
+    """
+    with open(path, encoding="utf-8") as f:
+        content = json.load(f)
+
+    if not isinstance(content, dict) or content.get("format") != (
+        TOPOLOGY_FORMAT
+    ):
+        raise ValueError(f"{path} is not a topology file of dagstream.")
+    if content.get("version") != TOPOLOGY_VERSION:
+        raise ValueError(
+            f"Unsupported version of topology file: {content.get('version')}. "
+            f"Supported version: {TOPOLOGY_VERSION}"
+        )
+    return content["nodes"], content["edges"]
+
+
+def _sort_topologically(name2node: dict[str, IFunctionalNode]) -> list[str]:
+    in_degrees = dict.fromkeys(name2node, 0)
+    for node in name2node.values():
+        for edge in node.successors:
+            if edge.to_node in in_degrees:
+                in_degrees[edge.to_node] += 1
+
+    ready = collections.deque(
+        name for name, degree in in_degrees.items() if degree == 0
+    )
+    names: list[str] = []
+    while len(ready) != 0:
+        name = ready.popleft()
+        names.append(name)
+        for edge in name2node[name].successors:
+            if edge.to_node not in in_degrees:
+                continue
+            in_degrees[edge.to_node] -= 1
+            if in_degrees[edge.to_node] == 0:
+                ready.append(edge.to_node)
+    return names
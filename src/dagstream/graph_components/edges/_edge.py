@@ -1,10 +1,15 @@
+import sys
+
 from dagstream.graph_components._interface import IDagEdge
 
 
 class DagEdge(IDagEdge):
+    # Graphs may have millions of edges, so edges have no __dict__.
+    __slots__ = ("_from", "_to", "_pipe")
+
     def __init__(self, from_node: str, to_node: str, pipe: bool) -> None:
-        self._from = from_node
-        self._to = to_node
+        self._from = sys.intern(from_node)
+        self._to = sys.intern(to_node)
         self._pipe = pipe
 
     @property
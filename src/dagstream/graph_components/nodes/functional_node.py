@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import inspect
+import sys
 from collections.abc import Callable, Iterable
 from typing import Any
 
@@ -8,9 +10,11 @@ from dagstream.graph_components._interface import (
     IDagEdge,
     IDrawableNode,
     IFunctionalNode,
+    ITopologicalOrder,
 )
 from dagstream.graph_components.edges import DagEdge
 from dagstream.graph_components.nodes.node_state import ReadyNodeState
+from dagstream.stores import load_lazy
 
 # NOTE: If FunctionalNode has reference to other nodes,
 # one node has almost all information of DAG.
@@ -19,20 +23,38 @@ from dagstream.graph_components.nodes.node_state import ReadyNodeState
 
 
 class FunctionalNode(IFunctionalNode, IDrawableNode):
+    # Nodes have no __dict__ to reduce memory of large graphs.
+    # Names are interned, so that edges share them with nodes.
+    __slots__ = (
+        "_user_function",
+        "_from",
+        "_to_edges",
+        "_mut_name",
+        "_display_name",
+        "_resources",
+        "_order",
+        "__received",
+    )
+
     def __init__(
         self,
         user_function: Callable[[Any], Any],
         *,
         mut_node_name: str | None = None,
+        order: ITopologicalOrder | None = None,
     ) -> None:
         self._user_function = user_function
+        # If fed, order is updated before an edge is added,
+        # so that an edge making a cycle is rejected immediately.
+        self._order = order
         self._from: set[str] = set()
         self._to_edges: dict[str, IDagEdge] = {}
 
         if mut_node_name is None:
             mut_node_name = utils.get_function_name(user_function)
-        self._mut_name = mut_node_name
-        self._display_name = utils.get_function_name(user_function)
+        self._mut_name = sys.intern(mut_node_name)
+        self._display_name = sys.intern(utils.get_function_name(user_function))
+        self._resources: dict[str, float] = {}
 
         self.__received: list[Any] = []
 
@@ -48,12 +70,35 @@ class FunctionalNode(IFunctionalNode, IDrawableNode):
 
     @display_name.setter
     def display_name(self, value: str):
-        self._display_name = value
+        self._display_name = sys.intern(value)
 
     @property
     def mut_name(self) -> str:
         return self._mut_name
 
+    @property
+    def resources(self) -> dict[str, float]:
+        """Amount of resources required to run, such as {"cpu": 4}"""
+        return self._resources
+
+    @resources.setter
+    def resources(self, value: dict[str, float]):
+        for key, amount in value.items():
+            if amount < 0:
+                raise ValueError(
+                    f"Amount of resource must not be negative. "
+                    f"Input: {key}={amount}"
+                )
+        self._resources = dict(value)
+
+    @property
+    def is_generator(self) -> bool:
+        """True if user function yields chunks instead of returning"""
+        function = self._user_function
+        if isinstance(function, utils.LazyFunction):
+            function = function.resolve()
+        return inspect.isgeneratorfunction(function)
+
     @property
     def n_predecessors(self) -> int:
         return len(self._from)
@@ -83,10 +128,16 @@ class FunctionalNode(IFunctionalNode, IDrawableNode):
     def get_received_args(self) -> list[Any]:
         return self.__received
 
+    def release_args(self) -> None:
+        """Drop references to received arguments after running."""
+        self.__received = []
+
     def precede(self, *nodes: IFunctionalNode, pipe: bool = False) -> None:
         for node in nodes:
             if node.mut_name in self._to_edges:
                 continue
+            if self._order is not None:
+                self._order.add_edge(self.mut_name, node.mut_name)
 
             self._to_edges[node.mut_name] = DagEdge(
                 from_node=self.mut_name, to_node=node.mut_name, pipe=pipe
@@ -98,8 +149,35 @@ class FunctionalNode(IFunctionalNode, IDrawableNode):
             if node.mut_name in self._from:
                 continue
             self._from.add(node.mut_name)
-            node.precede(self, pipe=pipe)
+            # The edge is validated only by precede
+            try:
+                node.precede(self, pipe=pipe)
+            except BaseException:
+                self._from.discard(node.mut_name)
+                raise
+
+    def extend_successors(self, edges: Iterable[tuple[str, bool]]) -> None:
+        to_edges = self._to_edges
+        for to_node, pipe in edges:
+            if to_node not in to_edges:
+                to_edges[to_node] = DagEdge(self._mut_name, to_node, pipe)
+
+    def extend_predecessors(self, node_names: Iterable[str]) -> None:
+        self._from.update(node_names)
 
     def run(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
-        result = self._user_function(*self.__received, *args, **kwargs)
+        # Results spilled by a store are loaded just before running.
+        received = load_lazy(self.__received)
+        result = self._user_function(*received, *args, **kwargs)
+        return result
+
+    async def run_async(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Run user function and await its result if it is awaitable.
+
+        Coroutine functions are awaited on the running event loop.
+        Ordinary functions are called directly.
+        """
+        result = self.run(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
         return result
@@ -3,6 +3,8 @@ from dagstream.utils.errors import DagStreamNotReadyError
 
 
 class UnReadyNodeState(INodeState):
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -23,6 +25,8 @@ class UnReadyNodeState(INodeState):
 
 
 class ReadyNodeState(INodeState):
+    __slots__ = ("_n_predecessors",)
+
     def __init__(self, n_predecessors: int) -> None:
         self._n_predecessors = n_predecessors
 
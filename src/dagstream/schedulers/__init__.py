@@ -0,0 +1,4 @@
+from .critical_path_scheduler import CriticalPathScheduler  # NOQA
+from .fifo_scheduler import FifoScheduler  # NOQA
+from .interface import IScheduler  # NOQA
+from .resource_limiter import ResourceLimiter  # NOQA
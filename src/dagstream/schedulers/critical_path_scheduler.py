@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from dagstream.graph_components import FunctionalDag, IFunctionalNode
+
+from .interface import IScheduler
+
+
+class CriticalPathScheduler(IScheduler):
+    def __init__(
+        self,
+        costs: dict[str, float] | None = None,
+        default_cost: float = 1.0,
+        smoothing: float = 0.5,
+    ) -> None:
+        """Start ready nodes with the longest remaining path first.
+
+        Ready nodes are ranked by the upward rank, which is the cost
+        of the node plus the largest upward rank of its successors.
+        The node on the critical path starts first.
+
+        Costs of nodes are given by users or measured in earlier runs.
+        Measured elapsed times are blended into costs by
+        exponential moving average, and ranks are updated on the next run.
+
+        Parameters
+        ----------
+        costs : dict[str, float] | None, optional
+            Key is mut_name of node, value is its estimated cost.
+             by default None
+        default_cost : float, optional
+            Cost of nodes which are neither given nor measured.
+             by default 1.0
+        smoothing : float, optional
+            Weight of new measurements in the moving average.
+             1.0 means that only the last measurement is used.
+             0.0 means that measurements are ignored. by default 0.5
+
+        Raises
+        ------
+        ValueError
+            raise this error when smoothing is out of range [0, 1]
+        """
+        if not 0.0 <= smoothing <= 1.0:
+            raise ValueError(
+                f"smoothing must be in range [0, 1]. Input: {smoothing}"
+            )
+
+        self._costs: dict[str, float] = dict(costs or {})
+        self._default_cost = default_cost
+        self._smoothing = smoothing
+        self._ranks: dict[str, float] = {}
+
+    @property
+    def costs(self) -> dict[str, float]:
+        return self._costs
+
+    def get_rank(self, node: IFunctionalNode | str) -> float:
+        if isinstance(node, IFunctionalNode):
+            return self._ranks[node.mut_name]
+        return self._ranks[node]
+
+    def prepare(self, functional_dag: FunctionalDag) -> None:
+        nodes = list(functional_dag.get_functions())
+        name2node = {node.mut_name: node for node in nodes}
+        successors: dict[str, list[str]] = {
+            node.mut_name: [
+                edge.to_node
+                for edge in node.successors
+                if edge.to_node in name2node
+            ]
+            for node in nodes
+        }
+
+        # Kahn's algorithm to visit successors before predecessors
+        n_predecessors = dict.fromkeys(name2node, 0)
+        for names in successors.values():
+            for name in names:
+                n_predecessors[name] += 1
+        order = [name for name, n in n_predecessors.items() if n == 0]
+        for name in order:
+            for next_name in successors[name]:
+                n_predecessors[next_name] -= 1
+                if n_predecessors[next_name] == 0:
+                    order.append(next_name)
+
+        ranks: dict[str, float] = {}
+        for name in reversed(order):
+            ranks[name] = self._costs.get(name, self._default_cost) + max(
+                (ranks[next_name] for next_name in successors[name]),
+                default=0.0,
+            )
+        self._ranks = ranks
+
+    def order(self, nodes: Iterable[IFunctionalNode]) -> list[IFunctionalNode]:
+        # sorted() is stable, so ties are kept in FIFO order.
+        return sorted(
+            nodes, key=lambda node: -self._ranks.get(node.mut_name, 0.0)
+        )
+
+    def record(self, node_name: str, elapsed_time: float) -> None:
+        if node_name not in self._costs:
+            self._costs[node_name] = elapsed_time
+            return
+
+        self._costs[node_name] = (
+            self._smoothing * elapsed_time
+            + (1.0 - self._smoothing) * self._costs[node_name]
+        )
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from dagstream.graph_components import FunctionalDag, IFunctionalNode
+
+from .interface import IScheduler
+
+
+class FifoScheduler(IScheduler):
+    """Start ready nodes in the order they became ready."""
+
+    def prepare(self, functional_dag: FunctionalDag) -> None:
+        pass
+
+    def order(self, nodes: Iterable[IFunctionalNode]) -> list[IFunctionalNode]:
+        return list(nodes)
+
+    def record(self, node_name: str, elapsed_time: float) -> None:
+        pass
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import abc
+from collections.abc import Iterable
+
+from dagstream.graph_components import FunctionalDag, IFunctionalNode
+
+
+class IScheduler(metaclass=abc.ABCMeta):
+    """Policy to decide which ready node starts first."""
+
+    @abc.abstractmethod
+    def prepare(self, functional_dag: FunctionalDag) -> None:
+        """Called once before a run of functional_dag starts."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def order(self, nodes: Iterable[IFunctionalNode]) -> list[IFunctionalNode]:
+        """Sort ready nodes. The first node should start first."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def record(self, node_name: str, elapsed_time: float) -> None:
+        """Called when a node finishes with its elapsed time in seconds."""
+        raise NotImplementedError()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from dagstream.graph_components import IFunctionalNode
+
+
+class ResourceLimiter:
+    def __init__(self, capacities: dict[str, float] | None = None) -> None:
+        """Track resources used by running nodes.
+
+        A node can start only when every resource it requires is
+        available. Resources whose capacities are not declared
+        are regarded as unlimited.
+
+        Parameters
+        ----------
+        capacities : dict[str, float] | None, optional
+            Key is name of resource, value is its capacity,
+             such as {"cpu": 16, "mem_gb": 64, "license_server": 1}.
+             by default None
+        """
+        self._capacities: dict[str, float] = dict(capacities or {})
+        self._in_use: dict[str, float] = dict.fromkeys(self._capacities, 0.0)
+
+    @property
+    def in_use(self) -> dict[str, float]:
+        return self._in_use
+
+    def validate(self, nodes: Iterable[IFunctionalNode]) -> None:
+        """Check that every node can start when nothing else is running.
+
+        Raises
+        ------
+        ValueError
+            raise this error when a node requires more than capacity
+        """
+        for node in nodes:
+            for key, amount in node.resources.items():
+                if key not in self._capacities:
+                    continue
+                if amount > self._capacities[key]:
+                    raise ValueError(
+                        f"{node.mut_name} requires {key}={amount}, "
+                        f"but its capacity is {self._capacities[key]}."
+                    )
+
+    def acquire(self, node: IFunctionalNode) -> bool:
+        """Reserve resources for node if all of them are available.
+
+        Returns
+        -------
+        bool
+            True if resources are reserved.
+        """
+        required = self._get_limited(node)
+        for key, amount in required.items():
+            if self._in_use[key] + amount > self._capacities[key]:
+                return False
+
+        for key, amount in required.items():
+            self._in_use[key] += amount
+        return True
+
+    def release(self, node: IFunctionalNode) -> None:
+        for key, amount in self._get_limited(node).items():
+            self._in_use[key] -= amount
+
+    def _get_limited(self, node: IFunctionalNode) -> dict[str, float]:
+        return {
+            key: amount
+            for key, amount in node.resources.items()
+            if key in self._capacities
+        }
@@ -0,0 +1,13 @@
+from typing import TYPE_CHECKING
+
+from dagstream.utils.lazy_import import lazy_attributes
+
+from .interface import ILazyValue, IResultStore, load_lazy  # NOQA
+
+if TYPE_CHECKING:
+    from .spill_store import SpilledValue, SpillStore  # NOQA
+
+# SpillStore imports modules to handle files, such as tempfile and shutil
+__getattr__, __dir__ = lazy_attributes(
+    __name__, {"SpilledValue": ".spill_store", "SpillStore": ".spill_store"}
+)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import abc
+from collections.abc import Iterable
+from typing import Any
+
+
+class ILazyValue(metaclass=abc.ABCMeta):
+    """Handle of a value which is loaded when a consumer runs."""
+
+    @abc.abstractmethod
+    def load(self) -> Any:  # noqa: ANN401
+        raise NotImplementedError()
+
+
+class IResultStore(metaclass=abc.ABCMeta):
+    """Storage of results passed through pipe edges.
+
+    Methods are called by FunctionalDag in the thread which
+    updates its state.
+    """
+
+    @abc.abstractmethod
+    def put(self, value: Any, n_consumers: int) -> tuple[str, Any]:  # noqa: ANN401
+        """Store a result and return its key and an object
+        passed to consumers instead of it.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def release(self, key: str) -> None:
+        """Notify that one of consumers of a stored result finishes."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Release all stored results."""
+        raise NotImplementedError()
+
+
+def load_lazy(values: Iterable[Any]) -> list[Any]:
+    """Load values of ILazyValue and keep the others as they are."""
+    return [
+        value.load() if isinstance(value, ILazyValue) else value
+        for value in values
+    ]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import pickle
+import shutil
+import sys
+import tempfile
+import uuid
+import weakref
+from typing import Any
+
+from dagstream.utils import estimate_nbytes
+
+from .interface import ILazyValue, IResultStore
+
+
+class SpilledValue(ILazyValue):
+    """Handle of a pickled result written to a scratch directory."""
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __reduce__(self) -> tuple:
+        return (SpilledValue, (self.path,))
+
+    def __repr__(self) -> str:
+        return f"{SpilledValue.__name__}: {self.path}"
+
+    def load(self) -> Any:  # noqa: ANN401
+        with open(self.path, "rb") as f:
+            return pickle.load(f)
+
+
+class SpillStore(IResultStore):
+    def __init__(
+        self,
+        threshold_nbytes: int,
+        scratch_dir: str | os.PathLike | None = None,
+    ) -> None:
+        """Write piped results to disk when memory held by them
+        exceeds a threshold.
+
+        A result which would make the total size of results held in
+        memory larger than threshold_nbytes is written to scratch_dir.
+
+        - numpy.ndarray is saved as a .npy file, and successors receive
+          a read-only numpy.memmap of it.
+        - Other objects are pickled, and successors receive
+          a SpilledValue. It is loaded just before the successor runs.
+
+        Files are removed when all successors which receive them finish.
+        Spilled results can be read only on the same host.
+
+        Parameters
+        ----------
+        threshold_nbytes : int
+            The maximum number of bytes of results held in memory
+        scratch_dir : str | os.PathLike | None, optional
+            Directory to write results. If None, a temporary directory
+             is created and removed when this store is garbage collected.
+             by default None
+
+        Raises
+        ------
+        ValueError
+            raise this error when threshold_nbytes is negative
+        """
+        if threshold_nbytes < 0:
+            raise ValueError(
+                "threshold_nbytes must not be negative. "
+                f"Input: {threshold_nbytes}"
+            )
+        self._threshold_nbytes = threshold_nbytes
+
+        if scratch_dir is None:
+            self._scratch_dir = pathlib.Path(
+                tempfile.mkdtemp(prefix="dagstream_")
+            )
+            weakref.finalize(
+                self, shutil.rmtree, self._scratch_dir, ignore_errors=True
+            )
+        else:
+            self._scratch_dir = pathlib.Path(scratch_dir)
+            self._scratch_dir.mkdir(parents=True, exist_ok=True)
+
+        self._in_memory_nbytes = 0
+        # key -> [nbytes, number of consumers left, path or None]
+        self._entries: dict[str, list[Any]] = {}
+
+    @property
+    def scratch_dir(self) -> pathlib.Path:
+        return self._scratch_dir
+
+    @property
+    def in_memory_nbytes(self) -> int:
+        """The number of bytes of results held in memory"""
+        return self._in_memory_nbytes
+
+    @property
+    def n_spilled(self) -> int:
+        """The number of results currently written to disk"""
+        return sum(1 for entry in self._entries.values() if entry[2])
+
+    def put(self, value: Any, n_consumers: int) -> tuple[str, Any]:  # noqa: ANN401
+        key = uuid.uuid4().hex
+        if n_consumers <= 0:
+            return key, value
+
+        nbytes = estimate_nbytes(value)
+        if self._in_memory_nbytes + nbytes <= self._threshold_nbytes:
+            self._in_memory_nbytes += nbytes
+            self._entries[key] = [nbytes, n_consumers, None]
+            return key, value
+
+        path, stored = self._spill(key, value)
+        self._entries[key] = [nbytes, n_consumers, path]
+        return key, stored
+
+    def release(self, key: str) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._entries[key]
+            self._remove(entry)
+
+    def clear(self) -> None:
+        for entry in self._entries.values():
+            self._remove(entry)
+        self._entries.clear()
+
+    def _spill(self, key: str, value: Any) -> tuple[str, Any]:  # noqa: ANN401
+        np = sys.modules.get("numpy")
+        if (
+            np is not None
+            and isinstance(value, np.ndarray)
+            and not value.dtype.hasobject
+            and value.size > 0
+        ):
+            path = str(self._scratch_dir / f"{key}.npy")
+            np.save(path, value, allow_pickle=False)
+            return path, np.load(path, mmap_mode="r")
+
+        path = str(self._scratch_dir / f"{key}.pkl")
+        with open(path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path, SpilledValue(path)
+
+    def _remove(self, entry: list[Any]) -> None:
+        nbytes, _, path = entry
+        if path is None:
+            self._in_memory_nbytes -= nbytes
+            return
+
+        # Memory maps may still be open on some platforms.
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,13 @@
+from typing import TYPE_CHECKING
+
+from dagstream.utils.lazy_import import lazy_attributes
+
+from .interface import ITransport  # NOQA
+
+if TYPE_CHECKING:
+    from .shared_memory import SharedMemoryTransport  # NOQA
+
+# SharedMemoryTransport imports multiprocessing
+__getattr__, __dir__ = lazy_attributes(
+    __name__, {"SharedMemoryTransport": ".shared_memory"}
+)
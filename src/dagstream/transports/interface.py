@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import abc
+from typing import Any
+
+
+class ITransport(metaclass=abc.ABCMeta):
+    """Transport of results between processes.
+
+    Methods named `encode`, `decode` and `close` are called
+    in worker processes. The others are called in the parent process.
+    """
+
+    @abc.abstractmethod
+    def encode(self, value: Any) -> Any:  # noqa: ANN401
+        """Convert a result of a function to a transferable object."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def decode(self, value: Any) -> Any:  # noqa: ANN401
+        """Convert a transferable object to an input of a function."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Release resources used by decoded objects."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def materialize(self, value: Any) -> Any:  # noqa: ANN401
+        """Convert a transferable object to an object owned by the caller."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def register(self, value: Any, n_consumers: int) -> None:  # noqa: ANN401
+        """Start to manage lifetime of a transferable object."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def release(self, value: Any) -> None:  # noqa: ANN401
+        """Notify that one of consumers of a transferable object finishes."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def release_all(self) -> None:
+        """Release all transferable objects managed by this transport."""
+        raise NotImplementedError()
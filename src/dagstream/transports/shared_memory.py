@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+import uuid
+from collections.abc import Iterator
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+from .interface import ITransport
+
+
+class SharedArray:
+    """Descriptor of a numpy.ndarray placed in a shared memory block."""
+
+    __slots__ = ("name", "shape", "dtype")
+
+    def __init__(self, name: str, shape: tuple[int, ...], dtype: str) -> None:
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def __reduce__(self) -> tuple:
+        return (SharedArray, (self.name, self.shape, self.dtype))
+
+    def __repr__(self) -> str:
+        return f"{SharedArray.__name__}: {self.name} {self.dtype}{self.shape}"
+
+
+class SharedMemoryTransport(ITransport):
+    def __init__(self, min_nbytes: int = 64 * 1024) -> None:
+        """Transport numpy.ndarray through shared memory blocks.
+
+        Arrays in results are copied into shared memory blocks
+        in worker processes, and only small descriptors are sent
+        through queues. Successors attach the blocks without copy.
+        Arrays in tuple, list and dict are also transported.
+
+        Lifetime of blocks is as follows.
+
+        - A block is created by the worker process which returns the array,
+          and it is owned by the parent process after that.
+        - Successors receive a read-only view of the block.
+          The view is valid only while the function is running.
+        - The parent process unlinks the block when all successors
+          which receive it finish, or when the run finishes.
+        - Results returned from executors are copied to ordinary arrays.
+
+        Parameters
+        ----------
+        min_nbytes : int, optional
+            Arrays smaller than this are pickled as usual.
+             by default 64 KiB
+
+        Raises
+        ------
+        ImportError
+            raise this error when numpy is not installed
+        """
+        try:
+            import numpy  # NOQA
+        except ImportError as ex:
+            raise ImportError(
+                "numpy is required to use SharedMemoryTransport."
+            ) from ex
+
+        self._min_nbytes = min_nbytes
+        # Blocks attached in a worker process
+        self._attached: list[shared_memory.SharedMemory] = []
+        # Number of consumers left for each block, in the parent process
+        self._n_consumers: dict[str, int] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Handles are never shared between processes.
+        return {"_min_nbytes": self._min_nbytes}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._min_nbytes = state["_min_nbytes"]
+        self._attached = []
+        self._n_consumers = {}
+
+    def encode(self, value: Any) -> Any:  # noqa: ANN401
+        import numpy as np
+
+        if isinstance(value, np.ndarray):
+            if value.nbytes < self._min_nbytes or value.dtype.hasobject:
+                return value
+            return self._to_shared_array(value)
+
+        return _map_containers(value, self.encode)
+
+    def decode(self, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, SharedArray):
+            shm = _attach(value.name)
+            self._attached.append(shm)
+            array = _as_array(value, shm)
+            array.flags.writeable = False
+            return array
+
+        return _map_containers(value, self.decode)
+
+    def close(self) -> None:
+        remained: list[shared_memory.SharedMemory] = []
+        for shm in self._attached:
+            try:
+                shm.close()
+            except BufferError:
+                # Views are still referred by users. Retry later.
+                remained.append(shm)
+        self._attached = remained
+
+    def materialize(self, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, SharedArray):
+            shm = shared_memory.SharedMemory(name=value.name)
+            try:
+                array = _as_array(value, shm).copy()
+            finally:
+                shm.close()
+            return array
+
+        return _map_containers(value, self.materialize)
+
+    def register(self, value: Any, n_consumers: int) -> None:  # noqa: ANN401
+        for name in _collect_names(value):
+            # The parent process tracks blocks so that they are
+            # cleaned up even if it exits unexpectedly.
+            _track(name)
+            if n_consumers <= 0:
+                _unlink(name)
+                continue
+            self._n_consumers[name] = (
+                self._n_consumers.get(name, 0) + n_consumers
+            )
+
+    def release(self, value: Any) -> None:  # noqa: ANN401
+        for name in _collect_names(value):
+            if name not in self._n_consumers:
+                continue
+
+            self._n_consumers[name] -= 1
+            if self._n_consumers[name] <= 0:
+                del self._n_consumers[name]
+                _unlink(name)
+
+    def release_all(self) -> None:
+        for name in self._n_consumers:
+            _unlink(name)
+        self._n_consumers.clear()
+
+    def _to_shared_array(self, array: Any) -> SharedArray:  # noqa: ANN401
+        import numpy as np
+
+        # Short name is required by some platforms.
+        name = f"dgs_{uuid.uuid4().hex[:24]}"
+        shm = _create(name, max(array.nbytes, 1))
+        try:
+            descriptor = SharedArray(name, array.shape, array.dtype.str)
+            destination = np.ndarray(
+                array.shape, dtype=array.dtype, buffer=shm.buf
+            )
+            destination[...] = array
+            del destination
+        finally:
+            shm.close()
+        return descriptor
+
+
+def _as_array(descriptor: SharedArray, shm: shared_memory.SharedMemory) -> Any:  # noqa: ANN401
+    import numpy as np
+
+    return np.ndarray(descriptor.shape, dtype=descriptor.dtype, buffer=shm.buf)
+
+
+def _map_containers(value: Any, func: Any) -> Any:  # noqa: ANN401
+    if type(value) is tuple:
+        return tuple(func(v) for v in value)
+    if type(value) is list:
+        return [func(v) for v in value]
+    if type(value) is dict:
+        return {k: func(v) for k, v in value.items()}
+    return value
+
+
+def _collect_names(value: Any) -> list[str]:  # noqa: ANN401
+    if isinstance(value, SharedArray):
+        return [value.name]
+    if type(value) in (tuple, list):
+        return [name for v in value for name in _collect_names(v)]
+    if type(value) is dict:
+        return [name for v in value.values() for name in _collect_names(v)]
+    return []
+
+
+# NOTE: Before python 3.13, every SharedMemory object registers its block
+# to the resource tracker of the process, and the tracker unlinks
+# the block when the process exits. Worker processes may have their own
+# trackers, so only the parent process, which owns blocks, tracks them.
+
+
+@contextlib.contextmanager
+def _untracked() -> Iterator[None]:
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        yield
+    finally:
+        resource_tracker.register = register
+
+
+def _create(name: str, size: int) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(
+            name=name, create=True, size=size, track=False
+        )
+    with _untracked():
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    with _untracked():
+        return shared_memory.SharedMemory(name=name)
+
+
+def _track(name: str) -> None:
+    if os.name == "posix":
+        resource_tracker.register(f"/{name}", "shared_memory")
+
+
+def _unlink(name: str) -> None:
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    # This also unregisters the block from the resource tracker.
+    shm.unlink()
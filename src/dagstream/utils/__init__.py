@@ -1 +1,3 @@
+from .lazy_function import LazyFunction, get_import_path  # NOQA
+from .run_stats import RunStats, estimate_nbytes  # NOQA
 from .util import get_function_name
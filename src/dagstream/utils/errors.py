@@ -1,7 +1,16 @@
+from __future__ import annotations
+
+
 class DagStreamCycleError(ValueError):
-    """Subclass of ValueError raises if a cycle is found in graph."""
+    """Subclass of ValueError raises if a cycle is found in graph.
 
-    pass
+    `cycle` has names of nodes on the cycle. The first name is
+    repeated at the end, such as ["a", "b", "a"].
+    """
+
+    def __init__(self, message: str, cycle: list[str] | None = None) -> None:
+        super().__init__(message)
+        self.cycle: list[str] = [] if cycle is None else list(cycle)
 
 
 class DagStreamNotReadyError(ValueError):
@@ -11,3 +20,19 @@ class DagStreamNotReadyError(ValueError):
     """
 
     pass
+
+
+class DagStreamWorkerError(RuntimeError):
+    """Subclass of RuntimeError raises if a worker process
+    exits unexpectedly.
+    """
+
+    pass
+
+
+class DagStreamChannelError(RuntimeError):
+    """Subclass of RuntimeError raises in a consumer of chunks
+    if the node producing them fails.
+    """
+
+    pass
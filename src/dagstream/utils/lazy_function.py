@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def get_import_path(user_function: Callable) -> str:
+    """Get path to import function, such as "package.module:name".
+
+    Parameters
+    ----------
+    user_function : Callable
+        function defined at the top level of a module,
+         or a method of a class defined there
+
+    Returns
+    -------
+    str
+        module and qualified name joined by ":"
+
+    Raises
+    ------
+    ValueError
+        raise this error if function cannot be imported by its path,
+         such as lambdas and functions defined in functions
+    """
+    if isinstance(user_function, LazyFunction):
+        return user_function.path
+
+    module = getattr(user_function, "__module__", None)
+    qualname = getattr(user_function, "__qualname__", None)
+    if module is None or qualname is None or "<" in qualname:
+        raise ValueError(
+            f"{user_function!r} cannot be imported by its path. "
+            "Use functions defined at the top level of a module."
+        )
+    return f"{module}:{qualname}"
+
+
+class LazyFunction:
+    __slots__ = ("_path", "_function")
+
+    def __init__(self, path: str) -> None:
+        """Function which is imported when it is used first.
+
+        Parameters
+        ----------
+        path : str
+            path to import function, such as "package.module:name"
+
+        Raises
+        ------
+        ValueError
+            raise this error if path does not have ":"
+        """
+        if ":" not in path:
+            raise ValueError(
+                f"path must be like 'package.module:name'. Input: {path}"
+            )
+        self._path = path
+        self._function: Callable[..., Any] | None = None
+
+    def __repr__(self) -> str:
+        return f"{LazyFunction.__name__}: {self._path}"
+
+    def __reduce__(self) -> tuple[type[LazyFunction], tuple[str]]:
+        return LazyFunction, (self._path,)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._function is not None
+
+    def resolve(self) -> Callable[..., Any]:
+        """Import function if it is not imported yet.
+
+        Returns
+        -------
+        Callable[..., Any]
+            imported function
+        """
+        if self._function is None:
+            module_name, qualname = self._path.split(":", 1)
+            target: Any = importlib.import_module(module_name)
+            for attribute in qualname.split("."):
+                target = getattr(target, attribute)
+            self._function = target
+        return self._function
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        return self.resolve()(*args, **kwargs)
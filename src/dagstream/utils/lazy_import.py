@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_attributes(
+    package: str, name2module: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create __getattr__ and __dir__ of a package which imports
+    attributes from its submodules on first access.
+
+    Parameters
+    ----------
+    package : str
+        name of the package, that is, __name__ of its __init__
+    name2module : dict[str, str]
+        Key is name of attribute, value is name of module which
+         defines it. Names starting with "." are relative to package.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        functions to be assigned to __getattr__ and __dir__
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401
+        module_name = name2module.get(name)
+        if module_name is None:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            )
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, name)
+        # Later accesses do not call __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(name2module))
+
+    return __getattr__, __dir__
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable
+from typing import Any
+
+_SCALAR_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+
+def estimate_nbytes(value: Any) -> int:  # noqa: ANN401
+    """Estimate the number of bytes held by value.
+
+    `nbytes` is used for arrays and buffers. Contents of lists, tuples,
+    sets and dicts are counted recursively. sys.getsizeof is used
+    for other objects.
+
+    Parameters
+    ----------
+    value : Any
+        object to estimate
+
+    Returns
+    -------
+    int
+        estimated number of bytes
+    """
+    # Scalars are common results of small functions and hold no items.
+    if type(value) in _SCALAR_TYPES:
+        return sys.getsizeof(value)
+    return _estimate_nbytes(value, set())
+
+
+def _estimate_nbytes(value: Any, seen: set[int]) -> int:  # noqa: ANN401
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_nbytes(item, seen) for item in value)
+    elif isinstance(value, dict):
+        size += sum(
+            _estimate_nbytes(key, seen) + _estimate_nbytes(item, seen)
+            for key, item in value.items()
+        )
+    return size
+
+
+class RunStats:
+    def __init__(self) -> None:
+        """Statistics about results held by an executor during a run.
+
+        A result is live while a successor connected by a pipe edge
+        has not run yet, or while it is kept to be returned.
+        """
+        self._live_bytes = 0
+        self._peak_live_bytes = 0
+        self._pending: dict[str, tuple[int, set[str]]] = {}
+
+    @property
+    def live_bytes(self) -> int:
+        return self._live_bytes
+
+    @property
+    def peak_live_bytes(self) -> int:
+        """The maximum number of bytes of results held at the same time"""
+        return self._peak_live_bytes
+
+    def add(
+        self,
+        name: str,
+        value: Any,  # noqa: ANN401
+        consumers: Iterable[str],
+        keep: bool = False,
+    ) -> None:
+        """Register result of a node.
+
+        Parameters
+        ----------
+        name : str
+            name of node which returns value
+        value : Any
+            result of the node
+        consumers : Iterable[str]
+            names of nodes which receive value
+        keep : bool, optional
+            If True, value is held until the end of the run.
+             by default False
+        """
+        nbytes = estimate_nbytes(value)
+        self.add_nbytes(nbytes)
+
+        waiting = set(consumers)
+        if keep:
+            return
+        if len(waiting) == 0:
+            self.remove_nbytes(nbytes)
+            return
+        self._pending[name] = (nbytes, waiting)
+
+    def add_nbytes(self, nbytes: int) -> None:
+        """Count bytes which become live.
+
+        It is for callers which track consumers of results by
+        themselves, such as executors running compiled plans.
+        """
+        self._live_bytes += nbytes
+        if self._live_bytes > self._peak_live_bytes:
+            self._peak_live_bytes = self._live_bytes
+
+    def remove_nbytes(self, nbytes: int) -> None:
+        """Count bytes which are not live anymore."""
+        self._live_bytes -= nbytes
+
+    def release(self, consumer: str, producers: Iterable[str]) -> None:
+        """Notify that consumer has run and dropped its arguments.
+
+        Parameters
+        ----------
+        consumer : str
+            name of finished node
+        producers : Iterable[str]
+            names of predecessors of the finished node
+        """
+        for name in producers:
+            if name not in self._pending:
+                continue
+
+            nbytes, waiting = self._pending[name]
+            waiting.discard(consumer)
+            if len(waiting) == 0:
+                del self._pending[name]
+                self.remove_nbytes(nbytes)
@@ -1 +1,11 @@
-from .viewer import IDrawer, MermaidDrawer  # NOQA
+from typing import TYPE_CHECKING
+
+from dagstream.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from .viewer import IDrawer, MermaidDrawer  # NOQA
+
+# Drawers are needed only to output figures
+__getattr__, __dir__ = lazy_attributes(
+    __name__, {"IDrawer": ".viewer", "MermaidDrawer": ".viewer"}
+)
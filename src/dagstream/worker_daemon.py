@@ -0,0 +1,159 @@
+"""Worker daemon for StreamDistributedExecutor.
+
+Start a daemon on each host as below. The authentication key is read
+from the environment variable DAGSTREAM_AUTHKEY.
+
+.. code:: bash
+
+   DAGSTREAM_AUTHKEY=secret python -m dagstream.worker_daemon --port 6000
+
+Functions are sent by pickle, so that they must be importable on
+the hosts of daemons. Please use daemons only in trusted networks.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pickle
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any
+
+from dagstream.executor import _RemoteError
+from dagstream.stores import load_lazy
+
+
+class WorkerDaemon:
+    def __init__(self, address: tuple[str, int], authkey: bytes) -> None:
+        """Daemon which runs functions sent by StreamDistributedExecutor.
+
+        One daemon serves one executor at a time and runs one function
+        at a time. To use multiple cores, start multiple daemons.
+
+        Parameters
+        ----------
+        address : tuple[str, int]
+            host and port to listen. If port is 0, a free port is chosen.
+        authkey : bytes
+            key to authenticate executors
+        """
+        self._listener = Listener(address, authkey=authkey)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Address which this daemon actually listens."""
+        return self._listener.address
+
+    def serve_forever(self) -> None:
+        """Serve executors one by one until a shutdown request comes."""
+        try:
+            while True:
+                try:
+                    conn = self._listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    # failure of handshake should not stop the daemon
+                    continue
+
+                with conn:
+                    if not self._serve(conn):
+                        return
+        finally:
+            self._listener.close()
+
+    def _serve(self, conn: Connection) -> bool:
+        # Errors of one executor, such as functions which cannot be
+        # imported on this host, are sent back to it or close only
+        # its connection, so that the daemon keeps serving others.
+
+        # context of the current run: (run_id, functions, args, kwargs)
+        # or (run_id, error) if it cannot be loaded
+        context: tuple | None = None
+
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                # executor disconnects
+                return True
+            except Exception as ex:
+                # A task which cannot be unpickled on this host
+                self._send(conn, ("done", -1, -1, _RemoteError(ex)))
+                return True
+
+            command = message[0]
+            if command == "load":
+                _, run_id, payload = message
+                try:
+                    context = (run_id, *pickle.loads(payload))
+                except Exception as ex:
+                    context = (run_id, _RemoteError(ex))
+            elif command == "task":
+                _, run_id, node_id, received = message
+                result = self._run_task(context, run_id, node_id, received)
+                if not self._send(conn, ("done", run_id, node_id, result)):
+                    return True
+            elif command == "close":
+                return True
+            elif command == "shutdown":
+                return False
+            else:
+                # Executor of other versions
+                return True
+
+    def _run_task(
+        self,
+        context: tuple | None,
+        run_id: int,
+        node_id: int,
+        received: list[Any],
+    ) -> Any:  # noqa: ANN401
+        if context is None or context[0] != run_id:
+            return _RemoteError(
+                ValueError(f"Context of run {run_id} is not loaded.")
+            )
+        if isinstance(context[1], _RemoteError):
+            return context[1]
+
+        _, functions, args, kwargs = context
+        try:
+            return functions[node_id](*load_lazy(received), *args, **kwargs)
+        except Exception as ex:
+            return _RemoteError(ex)
+
+    def _send(self, conn: Connection, message: tuple) -> bool:
+        try:
+            conn.send(message)
+        except OSError:
+            return False
+        except Exception as ex:
+            # Result cannot be pickled
+            return self._send(conn, (*message[:3], _RemoteError(ex)))
+        return True
+
+
+def stop_worker_daemon(address: tuple[str, int], authkey: bytes) -> None:
+    """Request a worker daemon to exit."""
+    with Client(address, authkey=authkey) as conn:
+        conn.send(("shutdown",))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Worker daemon for StreamDistributedExecutor"
+    )
+    parser.add_argument("--host", type=str, default="localhost")
+    parser.add_argument("--port", type=int, default=6000)
+    args = parser.parse_args()
+
+    authkey = os.environ.get("DAGSTREAM_AUTHKEY")
+    if authkey is None:
+        raise ValueError("Environment variable DAGSTREAM_AUTHKEY is not set.")
+
+    daemon = WorkerDaemon((args.host, args.port), authkey.encode())
+    print(f"Listening on {daemon.address}", flush=True)
+    daemon.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
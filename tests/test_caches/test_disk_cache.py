@@ -0,0 +1,122 @@
+import multiprocessing as multi
+import pathlib
+import pickle
+import threading
+from collections.abc import Callable
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.caches import DiskCache
+from dagstream.executor import StreamExecutor
+
+
+@pytest.mark.parametrize("max_nbytes", [0, -1])
+def test__not_allowed_non_positive_max_nbytes(
+    max_nbytes: int, tmp_path: pathlib.Path
+):
+    with pytest.raises(ValueError):
+        _ = DiskCache(tmp_path, max_nbytes=max_nbytes)
+
+
+def test__get_after_put(tmp_path: pathlib.Path):
+    cache = DiskCache(tmp_path)
+
+    assert cache.get("abcd") == (False, None)
+    cache.put("abcd", {"value": [1, 2, 3]})
+    assert cache.get("abcd") == (True, {"value": [1, 2, 3]})
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.n_entries == 1
+
+
+def test__shared_between_instances(tmp_path: pathlib.Path):
+    DiskCache(tmp_path).put("abcd", 10)
+
+    assert DiskCache(tmp_path).get("abcd") == (True, 10)
+
+
+def test__picklable(tmp_path: pathlib.Path):
+    cache = DiskCache(tmp_path)
+    cache.put("abcd", 10)
+
+    restored = pickle.loads(pickle.dumps(cache))
+
+    assert restored.get("abcd") == (True, 10)
+
+
+def test__evict_least_recently_used(tmp_path: pathlib.Path):
+    value = b"x" * 1000
+    nbytes = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    cache = DiskCache(tmp_path, max_nbytes=nbytes * 2)
+    cache.put("aa", value)
+    cache.put("bb", value)
+    _ = cache.get("aa")
+
+    cache.put("cc", value)
+
+    assert cache.nbytes <= nbytes * 2
+    assert cache.get("bb") == (False, None)
+    assert cache.get("aa")[0]
+    assert cache.get("cc")[0]
+
+
+def test__not_store_unpicklable_value(tmp_path: pathlib.Path):
+    cache = DiskCache(tmp_path)
+
+    cache.put("abcd", threading.Lock())
+
+    assert cache.get("abcd") == (False, None)
+
+
+def test__clear(tmp_path: pathlib.Path):
+    cache = DiskCache(tmp_path)
+    cache.put("abcd", 10)
+
+    cache.clear()
+
+    assert cache.n_entries == 0
+    assert cache.get("abcd") == (False, None)
+
+
+def _put_many(cache: DiskCache, offset: int) -> None:
+    for i in range(20):
+        cache.put(f"{i:04d}", i)
+        cache.put(f"{offset}-{i:04d}", i)
+
+
+def test__put_from_multiple_processes(tmp_path: pathlib.Path):
+    cache = DiskCache(tmp_path)
+    processes = [
+        multi.Process(target=_put_many, args=(cache, offset))
+        for offset in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=30)
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert cache.n_entries == 20 + 20 * 3
+    for i in range(20):
+        assert cache.get(f"{i:04d}") == (True, i)
+
+
+def test__not_reuse_results_of_other_closures(tmp_path: pathlib.Path):
+    def make(value: int) -> Callable[[], int]:
+        def constant() -> int:
+            return value
+
+        return constant
+
+    for value in [2, 3, 2]:
+        stream = DagStream()
+        stream.emplace(make(value))
+        # A new instance reads entries written by previous runs
+        cache = DiskCache(tmp_path)
+        executor = StreamExecutor(stream.construct(), cache=cache)
+        assert executor.run() == {"constant": value}
+
+    assert cache.hits == 1
+    assert cache.n_entries == 2
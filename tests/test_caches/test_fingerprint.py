@@ -0,0 +1,142 @@
+import math
+import os
+import subprocess
+import sys
+import threading
+from collections.abc import Callable
+
+from dagstream.caches import make_cache_key
+from dagstream.caches.fingerprint import _get_function_identity
+
+
+def sample(*args: int) -> int:
+    return sum(args)
+
+
+def other(*args: int) -> int:
+    return sum(args) + 1
+
+
+def test__same_key_for_same_inputs():
+    key1 = make_cache_key(sample, [1, 2], (3,), {"a": 1, "b": 2})
+    key2 = make_cache_key(sample, [1, 2], (3,), {"b": 2, "a": 1})
+
+    assert key1 is not None
+    assert key1 == key2
+
+
+def test__different_key_for_different_inputs():
+    base = make_cache_key(sample, [1, 2], (), {})
+
+    assert make_cache_key(sample, [1, 3], (), {}) != base
+    assert make_cache_key(sample, [1, 2], (0,), {}) != base
+    assert make_cache_key(sample, [1, 2], (), {"a": 0}) != base
+    assert make_cache_key(other, [1, 2], (), {}) != base
+
+
+def test__different_key_when_function_is_redefined():
+    def redefined(value: int) -> int:
+        return value
+
+    key1 = make_cache_key(redefined, [1], (), {})
+
+    def redefined(value: int) -> int:  # noqa: F811
+        return value * 2
+
+    assert make_cache_key(redefined, [1], (), {}) != key1
+
+
+def test__none_for_unpicklable_inputs():
+    assert make_cache_key(sample, [threading.Lock()], (), {}) is None
+
+
+def _make_adder(offset: int) -> Callable[[int], int]:
+    def add(value: int) -> int:
+        return value + offset
+
+    return add
+
+
+def test__different_key_for_closures_of_same_factory():
+    key1 = make_cache_key(_make_adder(2), [1], (), {})
+    key2 = make_cache_key(_make_adder(3), [1], (), {})
+
+    assert key1 is not None
+    assert key1 != key2
+    assert make_cache_key(_make_adder(2), [1], (), {}) == key1
+
+
+def test__different_key_for_different_defaults():
+    def scale(value: int, factor: int = 2, *, shift: int = 0) -> int:
+        return value * factor + shift
+
+    key = make_cache_key(scale, [1], (), {})
+
+    scale.__defaults__ = (3,)
+    assert make_cache_key(scale, [1], (), {}) != key
+
+    scale.__defaults__ = (2,)
+    scale.__kwdefaults__ = {"shift": 1}
+    assert make_cache_key(scale, [1], (), {}) != key
+
+
+def test__none_for_unpicklable_closure_variables():
+    lock = threading.Lock()
+
+    def locked(value: int) -> int:
+        with lock:
+            return value
+
+    assert make_cache_key(locked, [1], (), {}) is None
+
+
+def test__identity_of_nested_code_has_no_address():
+    def nested(values: list[int]) -> list[int]:
+        return [value * 2 for value in values if (lambda v: v > 0)(value)]
+
+    # Addresses of nested code objects differ in other processes
+    assert b" at 0x" not in _get_function_identity(nested)
+    assert make_cache_key(nested, [[1]], (), {}) is not None
+
+
+def test__different_key_when_referred_names_change():
+    def rounded(value: float) -> int:
+        return math.floor(value)
+
+    key1 = make_cache_key(rounded, [1.5], (), {})
+
+    def rounded(value: float) -> int:  # noqa: F811
+        return math.ceil(value)
+
+    assert make_cache_key(rounded, [1.5], (), {}) != key1
+
+    def converted(value: str) -> str:
+        return value.lower()
+
+    key2 = make_cache_key(converted, ["A"], (), {})
+
+    def converted(value: str) -> str:  # noqa: F811
+        return value.upper()
+
+    assert make_cache_key(converted, ["A"], (), {}) != key2
+
+
+def test__same_key_with_set_constants_under_other_hash_seeds():
+    code = (
+        "from dagstream.caches import make_cache_key\n"
+        "def is_known(value):\n"
+        "    return value in {'alpha', 'beta', 'gamma', 'delta', 'eta'}\n"
+        "print(make_cache_key(is_known, ['alpha'], (), {}))\n"
+    )
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": str(seed)},
+        ).stdout
+        for seed in range(1, 5)
+    }
+
+    assert len(keys) == 1
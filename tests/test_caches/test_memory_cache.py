@@ -0,0 +1,74 @@
+import pytest
+
+from dagstream.caches import MemoryCache
+
+
+class _Buffer:
+    def __init__(self, nbytes: int) -> None:
+        self.nbytes = nbytes
+
+
+@pytest.mark.parametrize(
+    "max_entries, max_nbytes", [(0, None), (-1, None), (None, 0)]
+)
+def test__not_allowed_non_positive_limits(
+    max_entries: int | None, max_nbytes: int | None
+):
+    with pytest.raises(ValueError):
+        _ = MemoryCache(max_entries=max_entries, max_nbytes=max_nbytes)
+
+
+def test__count_hits_and_misses():
+    cache = MemoryCache()
+
+    assert cache.get("a") == (False, None)
+    cache.put("a", 1)
+    assert cache.get("a") == (True, 1)
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test__evict_least_recently_used_by_count():
+    cache = MemoryCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    _ = cache.get("a")
+
+    cache.put("c", 3)
+
+    assert cache.n_entries == 2
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+
+
+def test__evict_least_recently_used_by_bytes():
+    cache = MemoryCache(max_entries=None, max_nbytes=250)
+    cache.put("a", _Buffer(100))
+    cache.put("b", _Buffer(100))
+
+    cache.put("c", _Buffer(100))
+
+    assert cache.nbytes == 200
+    assert cache.get("a") == (False, None)
+
+
+def test__not_store_value_larger_than_max_nbytes():
+    cache = MemoryCache(max_nbytes=100)
+    cache.put("a", _Buffer(50))
+
+    cache.put("b", _Buffer(200))
+
+    assert cache.n_entries == 1
+    assert cache.get("a")[0]
+
+
+def test__clear():
+    cache = MemoryCache()
+    cache.put("a", _Buffer(50))
+
+    cache.clear()
+
+    assert cache.n_entries == 0
+    assert cache.nbytes == 0
@@ -0,0 +1,68 @@
+import threading
+
+import pytest
+
+from dagstream.channels import ChunkChannel
+from dagstream.utils.errors import DagStreamChannelError
+
+
+@pytest.mark.parametrize("maxsize", [0, -1])
+def test__not_allowed_non_positive_maxsize(maxsize: int):
+    with pytest.raises(ValueError):
+        _ = ChunkChannel(maxsize)
+
+
+def test__iterate_until_closed():
+    channel = ChunkChannel(maxsize=4)
+    for i in range(3):
+        assert channel.put(i)
+    channel.close()
+
+    assert list(channel) == [0, 1, 2]
+
+
+def test__producer_is_blocked_while_buffer_is_full():
+    channel = ChunkChannel(maxsize=2)
+    n_put: list[int] = []
+
+    def produce():
+        for i in range(10):
+            channel.put(i)
+            n_put.append(i)
+        channel.close()
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    thread.join(timeout=0.2)
+
+    assert thread.is_alive()
+    assert len(n_put) == 2
+
+    assert list(channel) == list(range(10))
+    thread.join()
+
+
+def test__put_returns_false_after_detached():
+    channel = ChunkChannel(maxsize=1)
+    assert channel.put(0)
+
+    result: list[bool] = []
+    thread = threading.Thread(target=lambda: result.append(channel.put(1)))
+    thread.start()
+    channel.detach()
+    thread.join(timeout=5.0)
+
+    assert result == [False]
+    assert channel.is_detached
+
+
+def test__raise_error_in_consumer_when_producer_fails():
+    channel = ChunkChannel()
+    channel.put(0)
+    channel.fail(KeyError("failed"))
+
+    chunks = iter(channel)
+    assert next(chunks) == 0
+    with pytest.raises(DagStreamChannelError) as ex:
+        next(chunks)
+    assert isinstance(ex.value.__cause__, KeyError)
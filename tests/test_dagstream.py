@@ -1,9 +1,15 @@
+import json
+import math
+import operator
+import pathlib
 from unittest import mock
 
 import pytest
 
 from dagstream import DagStream
+from dagstream.executor import StreamExecutor
 from dagstream.graph_components.nodes import FunctionalNode
+from dagstream.utils import LazyFunction
 from dagstream.utils.errors import DagStreamCycleError
 
 
@@ -101,22 +107,109 @@ def test__get_drawable_nodes(
 
 
 @pytest.mark.parametrize(
-    "relationship",
+    "relationship, cycle",
     [
-        ({"A": ["B"], "B": ["C"], "C": ["A"]}),
-        ({"A": ["B", "E"], "B": ["C"], "C": ["D"], "D": ["B", "F"]}),
-        ({"A": ["B"], "B": ["C", "D"], "C": ["E"], "E": ["F"], "F": ["C"]}),
+        ({"A": ["B"], "B": ["C"], "C": ["A"]}, ["C", "A", "B", "C"]),
+        (
+            {"A": ["B", "E"], "B": ["C"], "C": ["D"], "D": ["B", "F"]},
+            ["D", "B", "C", "D"],
+        ),
+        (
+            {"A": ["B"], "B": ["C", "D"], "C": ["E"], "E": ["F"], "F": ["C"]},
+            ["F", "C", "E", "F"],
+        ),
     ],
 )
 def test__detect_cycle(
     relationship: dict[str, list[str]],
+    cycle: list[str],
+    setup_dagstream: tuple[DagStream, dict[str, FunctionalNode]],
+):
+    _, name2node = setup_dagstream
+
+    with pytest.raises(DagStreamCycleError) as exc_info:
+        setup_nodes_relationship(relationship, name2node)
+
+    assert exc_info.value.cycle == cycle
+    assert " -> ".join(cycle) in str(exc_info.value)
+
+
+@pytest.mark.parametrize("use_succeed", [False, True])
+def test__keep_edges_when_cycle_is_rejected(
+    use_succeed: bool,
     setup_dagstream: tuple[DagStream, dict[str, FunctionalNode]],
 ):
     stream, name2node = setup_dagstream
-    setup_nodes_relationship(relationship, name2node)
+    setup_nodes_relationship({"A": ["B"], "B": ["C"]}, name2node)
 
     with pytest.raises(DagStreamCycleError):
-        stream.construct()
+        if use_succeed:
+            name2node["A"].succeed(name2node["C"])
+        else:
+            name2node["C"].precede(name2node["A"])
+
+    assert name2node["A"].n_predecessors == 0
+    assert name2node["C"].n_successors == 0
+    assert stream.construct().check_last("C")
+
+
+def test__add_edges_against_order_of_emplace(
+    setup_dagstream: tuple[DagStream, dict[str, FunctionalNode]],
+):
+    stream, name2node = setup_dagstream
+    setup_nodes_relationship(
+        {"F": ["E"], "E": ["D", "C"], "D": ["B"], "C": ["A"], "B": ["A"]},
+        name2node,
+    )
+
+    with pytest.raises(DagStreamCycleError) as exc_info:
+        name2node["A"].precede(name2node["F"])
+
+    assert exc_info.value.cycle[0] == "A"
+    assert exc_info.value.cycle[-1] == "A"
+    assert stream.construct().check_last("A")
+
+
+def test__no_cycle_when_diamond(
+    setup_dagstream: tuple[DagStream, dict[str, FunctionalNode]],
+):
+    stream, name2node = setup_dagstream
+    setup_nodes_relationship(
+        {"A": ["B", "C"], "B": ["D"], "C": ["D"], "D": ["E", "F"]}, name2node
+    )
+
+    functional_dag = stream.construct()
+
+    assert functional_dag.is_active
+
+
+def test__construct_long_chain():
+    def sample():
+        pass
+
+    stream = DagStream()
+    nodes = stream.emplace(*[sample for _ in range(5000)])
+    for upper, lower in zip(nodes[:-1], nodes[1:], strict=True):
+        upper.precede(lower)
+
+    functional_dag = stream.construct()
+
+    assert functional_dag.check_last(nodes[-1])
+
+
+def test__detect_cycle_in_long_chain():
+    def sample():
+        pass
+
+    stream = DagStream()
+    nodes = stream.emplace(*[sample for _ in range(5000)])
+    for upper, lower in zip(nodes[:-1], nodes[1:], strict=True):
+        upper.precede(lower)
+
+    with pytest.raises(DagStreamCycleError) as exc_info:
+        nodes[-1].precede(nodes[0])
+
+    assert len(exc_info.value.cycle) == 5001
 
 
 def test__call_count_when_construct(
@@ -282,3 +375,268 @@ def test__emplace_same_function_multiple_times(
     _ = stream.emplace(sample1)
 
     assert len(stream._name2node) == 3
+
+
+def test__add_edges(
+    setup_dagstream: tuple[DagStream, dict[str, FunctionalNode]],
+):
+    stream, name2node = setup_dagstream
+    stream.add_edges(
+        [
+            ("A", "B", True),
+            (name2node["B"], name2node["C"], False),
+            ("A", "B", False),
+            ("C", "D", True),
+        ]
+    )
+
+    assert name2node["B"].predecessors == {"A"}
+    assert [(e.to_node, e.is_pipe) for e in name2node["A"].successors] == [
+        ("B", True)
+    ]
+    assert [(e.to_node, e.is_pipe) for e in name2node["B"].successors] == [
+        ("C", False)
+    ]
+    assert name2node["D"].predecessors == {"C"}
+
+
+def test__update_order_by_add_edges(
+    setup_dagstream: tuple[DagStream, dict[str, FunctionalNode]],
+):
+    stream, name2node = setup_dagstream
+    stream.add_edges([("F", "E", True), ("E", "A", True)])
+
+    with pytest.raises(DagStreamCycleError) as exc_info:
+        name2node["A"].precede(name2node["F"])
+
+    assert exc_info.value.cycle == ["A", "F", "E", "A"]
+
+
+def test__reject_all_edges_when_cycle(
+    setup_dagstream: tuple[DagStream, dict[str, FunctionalNode]],
+):
+    stream, name2node = setup_dagstream
+    name2node["A"].precede(name2node["B"])
+
+    with pytest.raises(DagStreamCycleError) as exc_info:
+        stream.add_edges(
+            [("C", "D", False), ("B", "C", False), ("C", "A", False)]
+        )
+
+    cycle = exc_info.value.cycle
+    assert cycle[0] == cycle[-1]
+    assert sorted(cycle[:-1]) == ["A", "B", "C"]
+    assert name2node["C"].n_predecessors == 0
+    assert name2node["C"].n_successors == 0
+    assert name2node["D"].n_predecessors == 0
+
+
+@pytest.mark.parametrize(
+    "edges",
+    [[("A", "G", False)], [("A", FunctionalNode(lambda: None), False)]],
+)
+def test__add_edges_to_unknown_node(
+    edges: list[tuple],
+    setup_dagstream: tuple[DagStream, dict[str, FunctionalNode]],
+):
+    stream, _ = setup_dagstream
+
+    with pytest.raises(ValueError):
+        stream.add_edges(edges)
+
+
+def test__from_adjacency():
+    def first(value: int) -> int:
+        return value + 1
+
+    def second(value: int) -> int:
+        return value * 2
+
+    stream = DagStream.from_adjacency(
+        {"inc": first, "double": second, "inc_again": first},
+        {"inc": ["double"], "double": ["inc_again"]},
+        pipe=True,
+    )
+
+    assert {node.mut_name for node in stream.get_functions()} == {
+        "inc",
+        "double",
+        "inc_again",
+    }
+    executor = StreamExecutor(stream.construct())
+    assert executor.run(first_args=(1,)) == {"inc_again": 5}
+
+
+def test__from_adjacency_with_cycle():
+    def sample():
+        pass
+
+    with pytest.raises(DagStreamCycleError):
+        _ = DagStream.from_adjacency(
+            {"a": sample, "b": sample}, {"a": ["b"], "b": ["a"]}
+        )
+
+
+def test__construct_rejects_cycle_added_without_search():
+    stream = DagStream()
+    nodes = stream.emplace(*[operator.neg for _ in range(5000)])
+    # Every edge goes against the order in which nodes are emplaced
+    for i in range(1, len(nodes)):
+        nodes[i].precede(nodes[i - 1])
+    nodes[0].precede(nodes[-1])
+
+    with pytest.raises(DagStreamCycleError):
+        _ = stream.construct()
+
+
+def test__save_and_load(tmp_path: pathlib.Path):
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(abs, operator.neg, dict)
+    node1.precede(node2, pipe=True)
+    node1.precede(node3)
+    node2.resources = {"cpu": 2}
+    node3.display_name = "empty"
+
+    path = tmp_path / "topology.json"
+    stream.save(path)
+    loaded = DagStream.load(path)
+
+    name2node = {node.mut_name: node for node in loaded.get_functions()}
+    assert list(name2node) == [node.mut_name for node in (node1, node2, node3)]
+    loaded1, loaded2, loaded3 = name2node.values()
+    assert [(e.to_node, e.is_pipe) for e in loaded1.successors] == [
+        (loaded2.mut_name, True),
+        (loaded3.mut_name, False),
+    ]
+    assert loaded2.predecessors == {loaded1.mut_name}
+    assert loaded2.resources == {"cpu": 2}
+    assert loaded3.display_name == "empty"
+    assert isinstance(loaded1.get_user_function(), LazyFunction)
+
+    executor = StreamExecutor(loaded.construct())
+    assert executor.run(first_args=(-3,)) == {
+        loaded2.mut_name: -3,
+        loaded3.mut_name: {},
+    }
+
+
+def test__save_functional_dag_and_load(tmp_path: pathlib.Path):
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(abs, operator.neg, math.floor)
+    node3.precede(node1)
+    node1.precede(node2, pipe=True)
+
+    path = tmp_path / "topology.json"
+    stream.construct(mandatory_nodes={node1}).save(path)
+    loaded = DagStream.load(path)
+
+    loaded3, loaded1 = loaded.get_functions()
+    assert loaded3.mut_name == node3.mut_name
+    assert loaded1.mut_name == node1.mut_name
+    # Cycles are still rejected after loading
+    with pytest.raises(DagStreamCycleError):
+        loaded3.succeed(loaded1)
+
+
+def test__emplace_after_load(tmp_path: pathlib.Path):
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(abs, abs, operator.neg)
+    node2.precede(node3, pipe=True)
+
+    path = tmp_path / "topology.json"
+    stream.save(path)
+    loaded = DagStream.load(path)
+    loaded1, loaded2, loaded3 = loaded.get_functions()
+
+    (node4,) = loaded.emplace(abs)
+
+    assert node4.mut_name not in {node1.mut_name, node2.mut_name}
+    assert list(loaded.get_functions()) == [loaded1, loaded2, loaded3, node4]
+    assert loaded3.predecessors == {loaded2.mut_name}
+    executor = StreamExecutor(loaded.construct())
+    assert executor.run(first_args=(-3,)) == {
+        loaded1.mut_name: 3,
+        loaded3.mut_name: -3,
+        node4.mut_name: 3,
+    }
+
+
+@pytest.mark.parametrize(
+    "edges",
+    [
+        [0, 1, 1, 1, 0, 1],
+        [0, 0, 0],
+        [-1, 1, 0],
+        [0, 2, 0],
+        [0, 1, 2],
+        [0, 1],
+    ],
+)
+def test__cannot_load_invalid_edges(edges: list[int], tmp_path: pathlib.Path):
+    nodes = [
+        {"name": name, "display_name": name, "function": "builtins:abs"}
+        for name in ["a", "b"]
+    ]
+    path = tmp_path / "topology.json"
+    path.write_text(
+        json.dumps(
+            {
+                "format": "dagstream.topology",
+                "version": 1,
+                "nodes": nodes,
+                "edges": edges,
+            }
+        )
+    )
+
+    with pytest.raises(ValueError):
+        _ = DagStream.load(path)
+
+
+def test__cannot_load_duplicated_names(tmp_path: pathlib.Path):
+    node = {"name": "abs", "display_name": "abs", "function": "builtins:abs"}
+    path = tmp_path / "topology.json"
+    path.write_text(
+        json.dumps(
+            {
+                "format": "dagstream.topology",
+                "version": 1,
+                "nodes": [node, node],
+                "edges": [],
+            }
+        )
+    )
+
+    with pytest.raises(ValueError):
+        _ = DagStream.load(path)
+
+
+def test__cannot_save_local_functions(tmp_path: pathlib.Path):
+    def sample():
+        pass
+
+    stream = DagStream()
+    _ = stream.emplace(sample)
+
+    with pytest.raises(ValueError):
+        stream.save(tmp_path / "topology.json")
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        {"format": "other", "version": 1, "nodes": [], "edges": []},
+        {
+            "format": "dagstream.topology",
+            "version": 0,
+            "nodes": [],
+            "edges": [],
+        },
+    ],
+)
+def test__cannot_load_unknown_file(content: dict, tmp_path: pathlib.Path):
+    path = tmp_path / "topology.json"
+    path.write_text(json.dumps(content))
+
+    with pytest.raises(ValueError):
+        _ = DagStream.load(path)
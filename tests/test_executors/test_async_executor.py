@@ -0,0 +1,232 @@
+import asyncio
+import time
+from collections.abc import Iterable, Iterator
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.caches import MemoryCache
+from dagstream.executor import AsyncStreamExecutor, StreamExecutor
+from dagstream.graph_components import IFunctionalNode
+
+
+async def sample1(*args: int) -> int:
+    await asyncio.sleep(0.01)
+    return 1
+
+
+async def sample2(args: int) -> int:
+    await asyncio.sleep(0.01)
+    return args + 2
+
+
+def sample3(*args: int) -> int:
+    return sum(args)
+
+
+async def sample4(*args: int) -> int:
+    return 4
+
+
+def sample5(args: int) -> int:
+    return args + 5
+
+
+async def sample6(*args: int) -> int:
+    return sum(args) + 6
+
+
+@pytest.fixture
+def construct_stream() -> tuple[DagStream, dict[str, IFunctionalNode]]:
+    stream = DagStream()
+    node1, node2, node3, node4, node5, node6 = stream.emplace(
+        sample1, sample2, sample3, sample4, sample5, sample6
+    )
+
+    """
+    Relationship
+
+    node1 --> node2 -->   node3
+      |                     ^
+      ----------------------|
+                            |
+    node4 --> node5         |
+              | --> node6---|
+    """
+    node1.precede(node2, node3, pipe=True)
+    node3.succeed(node1, node2, node6, pipe=True)
+    node4.precede(node5, pipe=True)
+    node5.precede(node6, pipe=True)
+
+    name2node = {
+        node.mut_name: node
+        for node in [node1, node2, node3, node4, node5, node6]
+    }
+    return stream, name2node
+
+
+def test__cannot_initialize_before_calling_construct(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+
+    with pytest.raises(ValueError):
+        _ = AsyncStreamExecutor(stream)
+
+
+@pytest.mark.parametrize(
+    "mandatory_names, expected",
+    [
+        (["sample5"], {"sample5": 9}),
+        (["sample3", "sample6"], {"sample3": 19}),
+        (None, {"sample3": 19}),
+    ],
+)
+def test__run_async(
+    mandatory_names: list[str] | None,
+    expected: dict[str, int],
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, name2node = construct_stream
+
+    if mandatory_names is None:
+        mandatory_nodes = None
+    else:
+        mandatory_nodes = [name2node[name] for name in mandatory_names]
+
+    executor = AsyncStreamExecutor(
+        stream.construct(mandatory_nodes=mandatory_nodes)
+    )
+    actual = asyncio.run(executor.run_async())
+
+    assert actual == expected
+
+
+def test__run_is_same_as_run_async(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+
+    expected = asyncio.run(
+        AsyncStreamExecutor(stream.construct()).run_async(save_all_state=True)
+    )
+    actual = AsyncStreamExecutor(stream.construct()).run(save_all_state=True)
+
+    assert actual == expected
+    assert len(actual) == 6
+
+
+def test__pass_first_args_and_common_args():
+    async def first(x: int, y: int, *, z: int) -> int:
+        return x + y + z
+
+    async def second(x: int, y: int, *, z: int) -> int:
+        return x * y * z
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(first, second)
+    node1.precede(node2, pipe=True)
+
+    result = AsyncStreamExecutor(stream.construct()).run(
+        2, first_args=(1,), z=3
+    )
+
+    assert result == {"second": 36}
+
+
+def test__coroutines_run_concurrently():
+    async def wait():
+        await asyncio.sleep(0.2)
+
+    stream = DagStream()
+    stream.emplace(*[wait for _ in range(50)])
+
+    start = time.perf_counter()
+    AsyncStreamExecutor(stream.construct()).run()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+
+
+def test__sync_executor_returns_coroutine():
+    # StreamExecutor does not await coroutine functions.
+    async def sample() -> int:
+        return 1
+
+    stream = DagStream()
+    stream.emplace(sample)
+
+    result = StreamExecutor(stream.construct()).run()
+    coroutine = result["sample"]
+
+    assert asyncio.iscoroutine(coroutine)
+    assert asyncio.run(coroutine) == 1
+
+
+def test__cancel_running_tasks_when_error():
+    cancelled: list[str] = []
+
+    async def failed():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("failed")
+
+    async def slow():
+        try:
+            await asyncio.sleep(5.0)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    stream = DagStream()
+    stream.emplace(failed, slow)
+
+    with pytest.raises(RuntimeError):
+        AsyncStreamExecutor(stream.construct()).run()
+
+    assert cancelled == ["slow"]
+
+
+_CALLED: list[str] = []
+
+
+def test__reuse_cached_results():
+    # Values of closure variables are part of keys, so that
+    #  calls are recorded in a global variable.
+    _CALLED.clear()
+
+    async def first(x: int) -> int:
+        _CALLED.append("first")
+        return x + 1
+
+    async def second(x: int) -> int:
+        _CALLED.append("second")
+        return x * 2
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(first, second)
+    node1.precede(node2, pipe=True)
+
+    cache = MemoryCache()
+    for x, expected in [(1, 4), (1, 4), (2, 6)]:
+        executor = AsyncStreamExecutor(stream.construct(), cache=cache)
+        assert executor.run(first_args=(x,)) == {"second": expected}
+
+    assert _CALLED == ["first", "second", "first", "second"]
+
+
+def test__every_consumer_receives_all_chunks():
+    def produce() -> Iterator[int]:
+        yield from range(5)
+
+    async def total(chunks: Iterable[int]) -> int:
+        return sum(chunks)
+
+    async def count(chunks: Iterable[int]) -> int:
+        return len(list(chunks))
+
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(produce, total, count)
+    node1.precede(node2, node3, pipe=True)
+
+    executor = AsyncStreamExecutor(stream.construct())
+    assert executor.run() == {"total": 10, "count": 5}
@@ -0,0 +1,301 @@
+import multiprocessing as multi
+import os
+import pathlib
+import sys
+import threading
+from collections.abc import Iterator
+from multiprocessing.connection import Client
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.executor import StreamDistributedExecutor, StreamExecutor
+from dagstream.graph_components import IFunctionalNode
+from dagstream.utils.errors import DagStreamWorkerError
+from dagstream.worker_daemon import WorkerDaemon, stop_worker_daemon
+
+AUTHKEY = b"dagstream-test"
+
+
+def sample1(*args: int) -> int:
+    return 1
+
+
+def sample2(args: int) -> int:
+    return args + 2
+
+
+def sample3(*args: int) -> int:
+    return sum(args)
+
+
+def sample4(*args: int) -> int:
+    return 4
+
+
+def sample5(args: int) -> int:
+    return args + 5
+
+
+def sample6(*args: int) -> int:
+    return sum(args) + 6
+
+
+def get_pid(*args: int) -> int:
+    return os.getpid()
+
+
+def failed(*args: int) -> int:
+    raise RuntimeError("failed in worker daemon")
+
+
+def exit_process(*args: int) -> int:
+    os._exit(1)
+
+
+def return_lock(*args: int) -> threading.Lock:
+    return threading.Lock()
+
+
+def _start_daemon(address_queue: multi.Queue) -> None:
+    daemon = WorkerDaemon(("localhost", 0), AUTHKEY)
+    address_queue.put(daemon.address)
+    daemon.serve_forever()
+
+
+@pytest.fixture
+def worker_addresses() -> Iterator[list[tuple[str, int]]]:
+    address_queue: multi.Queue = multi.Queue()
+    processes = [
+        multi.Process(target=_start_daemon, args=(address_queue,))
+        for _ in range(3)
+    ]
+    for process in processes:
+        process.start()
+    addresses = [address_queue.get(timeout=10) for _ in processes]
+
+    yield addresses
+
+    for address, process in zip(addresses, processes, strict=True):
+        if process.is_alive():
+            try:
+                stop_worker_daemon(address, AUTHKEY)
+            except (OSError, EOFError):
+                # the daemon is exiting because of the test
+                pass
+        process.join(timeout=10)
+        if process.is_alive():
+            process.terminate()
+
+
+@pytest.fixture
+def construct_stream() -> tuple[DagStream, dict[str, IFunctionalNode]]:
+    stream = DagStream()
+    node1, node2, node3, node4, node5, node6 = stream.emplace(
+        sample1, sample2, sample3, sample4, sample5, sample6
+    )
+
+    """
+    Relationship
+
+    node1 --> node2 -->   node3
+      |                     ^
+      ----------------------|
+                            |
+    node4 --> node5         |
+              | --> node6---|
+    """
+    node1.precede(node2, node3, pipe=True)
+    node3.succeed(node1, node2, node6, pipe=True)
+    node4.precede(node5, pipe=True)
+    node5.precede(node6, pipe=True)
+
+    name2node = {
+        node.mut_name: node
+        for node in [node1, node2, node3, node4, node5, node6]
+    }
+    return stream, name2node
+
+
+def test__cannot_initialize_before_calling_construct(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+
+    with pytest.raises(ValueError):
+        _ = StreamDistributedExecutor(stream, [("localhost", 0)], AUTHKEY)
+
+
+def test__not_allowed_empty_addresses(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+
+    with pytest.raises(ValueError):
+        _ = StreamDistributedExecutor(stream.construct(), [], AUTHKEY)
+
+
+@pytest.mark.parametrize(
+    "mandatory_names, save_all_state",
+    [
+        (["sample5"], False),
+        (["sample3", "sample6"], False),
+        (None, True),
+    ],
+)
+def test__same_results_as_single_executor(
+    mandatory_names: list[str] | None,
+    save_all_state: bool,
+    worker_addresses: list[tuple[str, int]],
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, name2node = construct_stream
+
+    if mandatory_names is None:
+        mandatory_nodes = None
+    else:
+        mandatory_nodes = [name2node[name] for name in mandatory_names]
+
+    expected = StreamExecutor(
+        stream.construct(mandatory_nodes=mandatory_nodes)
+    ).run(save_all_state=save_all_state)
+
+    executor = StreamDistributedExecutor(
+        stream.construct(mandatory_nodes=mandatory_nodes),
+        worker_addresses,
+        AUTHKEY,
+    )
+    actual = executor.run(save_all_state=save_all_state)
+
+    assert actual == expected
+
+
+def test__run_on_multiple_workers(worker_addresses: list[tuple[str, int]]):
+    stream = DagStream()
+    stream.emplace(*[get_pid for _ in range(30)])
+
+    executor = StreamDistributedExecutor(
+        stream.construct(), worker_addresses, AUTHKEY
+    )
+    result = executor.run()
+
+    assert len(result) == 30
+    assert os.getpid() not in set(result.values())
+    assert len(set(result.values())) > 1
+
+
+def test__workers_are_reusable_after_error(
+    worker_addresses: list[tuple[str, int]],
+):
+    stream = DagStream()
+    node1, node2 = stream.emplace(failed, sample2)
+    node1.precede(node2, pipe=True)
+
+    executor = StreamDistributedExecutor(
+        stream.construct(), worker_addresses, AUTHKEY
+    )
+    with pytest.raises(RuntimeError, match="failed in worker daemon"):
+        executor.run()
+
+    other_stream = DagStream()
+    other_stream.emplace(sample2)
+    result = StreamDistributedExecutor(
+        other_stream.construct(), worker_addresses, AUTHKEY
+    ).run(first_args=(1,))
+
+    assert result == {"sample2": 3}
+
+
+def test__raise_error_when_worker_exits(
+    worker_addresses: list[tuple[str, int]],
+):
+    stream = DagStream()
+    stream.emplace(exit_process)
+
+    executor = StreamDistributedExecutor(
+        stream.construct(), worker_addresses[:1], AUTHKEY
+    )
+    with pytest.raises(DagStreamWorkerError):
+        executor.run()
+
+
+def test__reject_wrong_authkey(worker_addresses: list[tuple[str, int]]):
+    stream = DagStream()
+    stream.emplace(sample1)
+
+    executor = StreamDistributedExecutor(
+        stream.construct(), worker_addresses, b"wrong"
+    )
+    with pytest.raises(multi.AuthenticationError):
+        executor.run()
+
+    # daemons keep serving after failure of authentication
+    result = StreamDistributedExecutor(
+        stream.construct(), worker_addresses, AUTHKEY
+    ).run()
+    assert result == {"sample1": 1}
+
+
+def test__daemons_keep_serving_when_functions_cannot_be_imported(
+    worker_addresses: list[tuple[str, int]],
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # The module is importable only in this process, not in daemons
+    (tmp_path / "_dagstream_local_module.py").write_text(
+        "def local_function(*args):\n    return 0\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "_dagstream_local_module", raising=False)
+    from _dagstream_local_module import local_function
+
+    stream = DagStream()
+    stream.emplace(local_function)
+    executor = StreamDistributedExecutor(
+        stream.construct(), worker_addresses, AUTHKEY
+    )
+    with pytest.raises(ModuleNotFoundError):
+        executor.run()
+
+    other_stream = DagStream()
+    other_stream.emplace(sample2)
+    result = StreamDistributedExecutor(
+        other_stream.construct(), worker_addresses, AUTHKEY
+    ).run(first_args=(1,))
+    assert result == {"sample2": 3}
+
+
+def test__daemons_keep_serving_after_unknown_command(
+    worker_addresses: list[tuple[str, int]],
+):
+    with Client(worker_addresses[0], authkey=AUTHKEY) as conn:
+        conn.send(("unknown",))
+        with pytest.raises(EOFError):
+            conn.recv()
+
+    stream = DagStream()
+    stream.emplace(sample1)
+    result = StreamDistributedExecutor(
+        stream.construct(), worker_addresses[:1], AUTHKEY
+    ).run()
+    assert result == {"sample1": 1}
+
+
+def test__raise_error_when_result_cannot_be_pickled(
+    worker_addresses: list[tuple[str, int]],
+):
+    stream = DagStream()
+    stream.emplace(return_lock)
+
+    executor = StreamDistributedExecutor(
+        stream.construct(), worker_addresses[:1], AUTHKEY
+    )
+    with pytest.raises(TypeError):
+        executor.run()
+
+    other_stream = DagStream()
+    other_stream.emplace(sample1)
+    result = StreamDistributedExecutor(
+        other_stream.construct(), worker_addresses[:1], AUTHKEY
+    ).run()
+    assert result == {"sample1": 1}
@@ -0,0 +1,160 @@
+from collections.abc import Iterator
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.executor import StreamExecutor, StreamIncrementalExecutor
+from dagstream.graph_components import IFunctionalNode
+
+
+@pytest.fixture
+def construct_stream() -> tuple[DagStream, dict[str, IFunctionalNode], list]:
+    called: list[str] = []
+    params = {"scale": 1}
+
+    def load() -> int:
+        called.append("load")
+        return 10
+
+    def scale(value: int) -> int:
+        called.append("scale")
+        return value * params["scale"]
+
+    def offset(value: int) -> int:
+        called.append("offset")
+        return value + 1
+
+    def total(*values: int) -> int:
+        called.append("total")
+        return sum(values)
+
+    stream = DagStream()
+    node1, node2, node3, node4 = stream.emplace(load, scale, offset, total)
+
+    """
+    Relationship
+
+    load --> scale --> total
+      |                  ^
+      ----> offset ------|
+    """
+    node1.precede(node2, node3, pipe=True)
+    node4.succeed(node2, node3, pipe=True)
+
+    name2node = {node.mut_name: node for node in [node1, node2, node3, node4]}
+    return stream, name2node, [called, params]
+
+
+def test__cannot_initialize_before_calling_construct(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode], list],
+):
+    stream, _, _ = construct_stream
+
+    with pytest.raises(ValueError):
+        _ = StreamIncrementalExecutor(stream)
+
+
+def test__first_run_is_same_as_single_executor(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode], list],
+):
+    stream, _, _ = construct_stream
+
+    expected = StreamExecutor(stream.construct()).run(save_all_state=True)
+    actual = StreamIncrementalExecutor(stream.construct()).run(
+        save_all_state=True
+    )
+
+    assert actual == expected
+
+
+def test__rerun_only_invalidated_cone(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode], list],
+):
+    stream, name2node, (called, params) = construct_stream
+    executor = StreamIncrementalExecutor(stream.construct())
+
+    assert executor.run() == {"total": 21}
+    called.clear()
+
+    params["scale"] = 3
+    dirty = executor.invalidate(name2node["scale"])
+
+    assert dirty == {"scale", "total"}
+    assert executor.run() == {"total": 41}
+    assert called == ["scale", "total"]
+
+
+def test__reuse_all_results_when_nothing_is_invalidated(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode], list],
+):
+    stream, _, (called, _) = construct_stream
+    executor = StreamIncrementalExecutor(stream.construct())
+    _ = executor.run()
+    called.clear()
+
+    assert executor.dirty_nodes == set()
+    assert executor.run(save_all_state=True) == {
+        "load": 10,
+        "scale": 10,
+        "offset": 11,
+        "total": 21,
+    }
+    assert called == []
+
+
+def test__invalidate_by_name(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode], list],
+):
+    stream, _, _ = construct_stream
+    executor = StreamIncrementalExecutor(stream.construct())
+    _ = executor.run()
+
+    assert executor.invalidate("load") == {"load", "scale", "offset", "total"}
+
+
+def test__not_allowed_to_invalidate_unknown_node(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode], list],
+):
+    stream, _, _ = construct_stream
+    executor = StreamIncrementalExecutor(stream.construct())
+
+    with pytest.raises(ValueError):
+        executor.invalidate("unknown")
+
+
+def test__generator_is_always_run_again():
+    def produce() -> Iterator[int]:
+        yield from range(3)
+
+    def consume(chunks: Iterator[int]) -> int:
+        return sum(chunks)
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(produce, consume)
+    node1.precede(node2, pipe=True)
+
+    executor = StreamIncrementalExecutor(stream.construct())
+    assert executor.run() == {"consume": 3}
+
+    assert executor.invalidate(node2) == {"produce", "consume"}
+    assert executor.run() == {"consume": 3}
+
+
+def test__every_consumer_receives_all_chunks():
+    def produce() -> Iterator[int]:
+        yield from range(5)
+
+    def total(chunks: Iterator[int]) -> int:
+        return sum(chunks)
+
+    def count(chunks: Iterator[int]) -> int:
+        return len(list(chunks))
+
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(produce, total, count)
+    node1.precede(node2, node3, pipe=True)
+
+    executor = StreamIncrementalExecutor(stream.construct())
+    assert executor.run() == {"total": 10, "count": 5}
+    executor.invalidate(node2)
+    assert executor.run() == {"total": 10, "count": 5}
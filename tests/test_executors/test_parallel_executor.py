@@ -1,10 +1,18 @@
 import multiprocessing as multi
 import os
+import pathlib
+import pickle
+from unittest import mock
 
 import pytest
 
 from dagstream import DagStream
-from dagstream.executor import StreamParallelExecutor, _worker
+from dagstream.caches import DiskCache
+from dagstream.executor import (
+    StreamParallelExecutor,
+    StreamWorkerPool,
+    _worker,
+)
 from dagstream.graph_components.nodes import FunctionalNode
 
 
@@ -119,25 +127,92 @@ def test__n_results_when_parallel_executor(
 @pytest.mark.parametrize(
     "inputs, expected",
     [
-        ([(sample1, (2,), {})], [3]),
-        ([(sample1, (4,), {}), (sample2, (5,), {})], [5, 7]),
+        ([(0, (2,))], [3]),
+        ([(0, (4,)), (1, (5,))], [5, 7]),
     ],
 )
 def test__worker(inputs: tuple, expected: list):
     input_queue = multi.Queue()
     done_queue = multi.Queue()
+    context_queue = multi.Queue()
 
-    for argvs in inputs:
-        func, arg, kwards = argvs
-        input_queue.put((FunctionalNode(func), arg, kwards))
+    context_queue.put((0, (sample1, sample2), (), {}, None, None))
+    for node_id, received in inputs:
+        input_queue.put((0, node_id, list(received)))
     input_queue.put("STOP")
 
-    _worker(input_queue, done_queue)
+    _worker(input_queue, done_queue, context_queue)
 
     assert done_queue.qsize() == len(inputs)
 
     idx = 0
     while not done_queue.empty():
-        func, result = done_queue.get()
+        run_id, node_id, payload = done_queue.get()
+        result = pickle.loads(payload)
+        assert run_id == 0
+        assert node_id == inputs[idx][0]
         assert result == expected[idx]
         idx += 1
+
+
+def test__worker_skips_old_contexts():
+    input_queue = multi.Queue()
+    done_queue = multi.Queue()
+    context_queue = multi.Queue()
+
+    context_queue.put((0, (sample1,), (), {}, None, None))
+    context_queue.put((1, (sample2,), (), {}, None, None))
+    input_queue.put((1, 0, [1]))
+    input_queue.put("STOP")
+
+    _worker(input_queue, done_queue, context_queue)
+
+    run_id, node_id, payload = done_queue.get()
+    assert (run_id, node_id, pickle.loads(payload)) == (1, 0, 3)
+
+
+def test__send_only_node_id_and_received_args():
+    stream = DagStream()
+    node1, node2 = stream.emplace(sample1, sample2)
+    node1.precede(node2, pipe=True)
+
+    with StreamWorkerPool(1) as pool:
+        with mock.patch.object(
+            pool, "submit", wraps=pool.submit
+        ) as mocked_submit:
+            executor = StreamParallelExecutor(stream.construct(), pool=pool)
+            result = executor.run(first_args=(1,))
+
+    assert result == {"sample2": 4}
+    assert mocked_submit.call_count == 2
+    for call in mocked_submit.call_args_list:
+        run_id, node_id, received = call.args
+        assert isinstance(node_id, int)
+        assert isinstance(received, list)
+
+
+def record_call(value: int, *, log_path: str) -> int:
+    with open(log_path, "a") as f:
+        f.write(f"{value}\n")
+    return value + 1
+
+
+def test__workers_share_disk_cache(tmp_path: pathlib.Path):
+    log_path = str(tmp_path / "calls.log")
+    cache = DiskCache(tmp_path / "cache")
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(record_call, record_call)
+    node1.precede(node2, pipe=True)
+
+    with StreamWorkerPool(2) as pool:
+        for _ in range(2):
+            executor = StreamParallelExecutor(
+                stream.construct(), pool=pool, cache=cache
+            )
+            result = executor.run(first_args=(1,), log_path=log_path)
+            assert result == {node2.mut_name: 3}
+
+    with open(log_path) as f:
+        assert f.read().split() == ["1", "2"]
+    assert cache.n_entries == 2
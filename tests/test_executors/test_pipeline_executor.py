@@ -0,0 +1,204 @@
+import threading
+import time
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.executor import StreamExecutor, StreamPipelineExecutor
+
+
+def add_one(x: int) -> int:
+    return x + 1
+
+
+def double(x: int) -> int:
+    return x * 2
+
+
+def add(*args: int) -> int:
+    return sum(args)
+
+
+@pytest.fixture
+def construct_stream() -> DagStream:
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(add_one, double, add)
+
+    """
+    Relationship
+
+    add_one --> double --> add
+      |                     ^
+      ----------------------|
+    """
+    node1.precede(node2, node3, pipe=True)
+    node3.succeed(node2, pipe=True)
+    return stream
+
+
+def test__cannot_initialize_before_calling_construct(
+    construct_stream: DagStream,
+):
+    with pytest.raises(ValueError):
+        _ = StreamPipelineExecutor(construct_stream)
+
+
+@pytest.mark.parametrize(
+    "n_threads, max_in_flight", [(0, 1), (-1, 1), (1, 0), (None, -1)]
+)
+def test__not_allowed_non_positive_values(
+    n_threads: int | None, max_in_flight: int, construct_stream: DagStream
+):
+    with pytest.raises(ValueError):
+        _ = StreamPipelineExecutor(
+            construct_stream.construct(),
+            n_threads=n_threads,
+            max_in_flight=max_in_flight,
+        )
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 3, 10])
+def test__same_results_as_single_executor(
+    max_in_flight: int, construct_stream: DagStream
+):
+    inputs = list(range(20))
+    expected = [
+        StreamExecutor(construct_stream.construct()).run(first_args=(x,))
+        for x in inputs
+    ]
+
+    executor = StreamPipelineExecutor(
+        construct_stream.construct(), n_threads=4, max_in_flight=max_in_flight
+    )
+    actual = list(executor.run_iter(inputs))
+
+    assert [index for index, _ in actual] == list(range(20))
+    assert [result for _, result in actual] == expected
+
+
+def test__save_all_state_and_common_args():
+    def first(x: int, y: int) -> int:
+        return x + y
+
+    def second(x: int, y: int) -> int:
+        return x * y
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(first, second)
+    node1.precede(node2, pipe=True)
+
+    executor = StreamPipelineExecutor(stream.construct())
+    actual = dict(executor.run_iter([1, 2], 10, save_all_state=True))
+
+    assert actual == {
+        0: {"first": 11, "second": 110},
+        1: {"first": 12, "second": 120},
+    }
+
+
+def test__unordered_results():
+    def wait(x: float) -> float:
+        time.sleep(x)
+        return x
+
+    stream = DagStream()
+    stream.emplace(wait)
+
+    executor = StreamPipelineExecutor(stream.construct(), n_threads=3)
+    ordered = list(executor.run_iter([0.2, 0.1, 0.0]))
+    unordered = list(executor.run_iter([0.2, 0.1, 0.0], ordered=False))
+
+    assert [index for index, _ in ordered] == [0, 1, 2]
+    assert [index for index, _ in unordered] == [2, 1, 0]
+    assert unordered[0][1] == {"wait": 0.0}
+
+
+def test__inputs_overlap_between_stages():
+    def stage(x: int) -> int:
+        time.sleep(0.1)
+        return x
+
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(stage, stage, stage)
+    node1.precede(node2, pipe=True)
+    node2.precede(node3, pipe=True)
+
+    executor = StreamPipelineExecutor(
+        stream.construct(), n_threads=3, max_in_flight=3
+    )
+    start = time.perf_counter()
+    results = list(executor.run_iter(range(5)))
+    elapsed = time.perf_counter() - start
+
+    assert [r["stage_2"] for _, r in results] == list(range(5))
+    # sequential: 1.5 sec, pipelined: about 0.7 sec
+    assert elapsed < 1.1
+
+
+def test__number_of_inputs_in_flight_is_limited():
+    lock = threading.Lock()
+    active: set[int] = set()
+    max_active = 0
+
+    def enter(x: int) -> int:
+        nonlocal max_active
+        with lock:
+            active.add(x)
+            max_active = max(max_active, len(active))
+        time.sleep(0.01)
+        return x
+
+    def leave(x: int) -> int:
+        with lock:
+            active.discard(x)
+        return x
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(enter, leave)
+    node1.precede(node2, pipe=True)
+
+    executor = StreamPipelineExecutor(
+        stream.construct(), n_threads=8, max_in_flight=2
+    )
+    results = list(executor.run_iter(range(10)))
+
+    assert len(results) == 10
+    assert max_active <= 2
+
+
+def test__inputs_are_consumed_lazily(construct_stream: DagStream):
+    consumed: list[int] = []
+
+    def generate():
+        for x in range(100):
+            consumed.append(x)
+            yield x
+
+    executor = StreamPipelineExecutor(
+        construct_stream.construct(), max_in_flight=2
+    )
+    iterator = executor.run_iter(generate())
+    next(iterator)
+    iterator.close()
+
+    assert len(consumed) < 10
+
+
+def test__raise_error_in_function():
+    def failed(x: int) -> int:
+        if x == 3:
+            raise RuntimeError("failed")
+        return x
+
+    stream = DagStream()
+    stream.emplace(failed)
+
+    executor = StreamPipelineExecutor(stream.construct(), max_in_flight=1)
+    iterator = executor.run_iter(range(5))
+    assert [next(iterator) for _ in range(3)] == [
+        (0, {"failed": 0}),
+        (1, {"failed": 1}),
+        (2, {"failed": 2}),
+    ]
+    with pytest.raises(RuntimeError):
+        next(iterator)
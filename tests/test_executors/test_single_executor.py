@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import weakref
+from collections.abc import Callable, Iterable, Iterator
 from typing import TypeVar
 
 import pytest
 
 from dagstream import DagStream
+from dagstream.caches import MemoryCache
 from dagstream.executor import StreamExecutor
 from dagstream.graph_components import IFunctionalNode
 
@@ -157,3 +160,209 @@ def test__pass_common_args(
     for v in result.values():
         assert v[0] == args
         assert v[1] == kwards
+
+
+class _Payload:
+    def __init__(self, nbytes: int) -> None:
+        self.nbytes = nbytes
+
+
+def test__release_intermediate_results():
+    payloads: list[weakref.ref] = []
+
+    def first() -> _Payload:
+        payload = _Payload(1000)
+        payloads.append(weakref.ref(payload))
+        return payload
+
+    def second(payload: _Payload) -> _Payload:
+        return _Payload(1000)
+
+    def third(payload: _Payload) -> bool:
+        return payloads[0]() is None
+
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(first, second, third)
+    node1.precede(node2, pipe=True)
+    node2.precede(node3, pipe=True)
+
+    executor = StreamExecutor(stream.construct(), track_memory=True)
+    result = executor.run()
+
+    assert result == {"third": True}
+    # first and second results are held at the same time
+    assert executor.stats.peak_live_bytes == 2000
+    assert executor.stats.live_bytes < 1000
+
+
+def test__keep_all_results_when_save_all_state():
+    def first() -> _Payload:
+        return _Payload(1000)
+
+    def second(payload: _Payload) -> _Payload:
+        return _Payload(1000)
+
+    def third(payload: _Payload) -> _Payload:
+        return _Payload(1000)
+
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(first, second, third)
+    node1.precede(node2, pipe=True)
+    node2.precede(node3, pipe=True)
+
+    executor = StreamExecutor(stream.construct(), track_memory=True)
+    _ = executor.run(save_all_state=True)
+
+    assert executor.stats.peak_live_bytes == 3000
+
+
+@pytest.mark.parametrize("compile", [False, True])
+def test__not_count_bytes_by_default(compile: bool):
+    def first() -> _Payload:
+        return _Payload(1000)
+
+    def second(payload: _Payload) -> bool:
+        return True
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(first, second)
+    node1.precede(node2, pipe=True)
+
+    executor = StreamExecutor(stream.construct(compile=compile))
+    assert executor.run() == {"second": True}
+    assert executor.stats.peak_live_bytes == 0
+
+
+_CALLED: list[str] = []
+
+
+def test__reuse_cached_results():
+    # Values of closure variables are part of keys, so that
+    #  calls are recorded in a global variable.
+    _CALLED.clear()
+
+    def first(value: int) -> int:
+        _CALLED.append("first")
+        return value + 1
+
+    def second(value: int) -> int:
+        _CALLED.append("second")
+        return value * 2
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(first, second)
+    node1.precede(node2, pipe=True)
+
+    cache = MemoryCache()
+    for _ in range(2):
+        executor = StreamExecutor(stream.construct(), cache=cache)
+        assert executor.run(first_args=(1,)) == {"second": 4}
+
+    assert _CALLED == ["first", "second"]
+    assert cache.hits == 2
+
+
+def test__not_reuse_results_of_other_closures():
+    def make(value: int) -> Callable[[], int]:
+        def constant() -> int:
+            return value
+
+        return constant
+
+    cache = MemoryCache()
+    for value in [2, 3]:
+        stream = DagStream()
+        stream.emplace(make(value))
+        executor = StreamExecutor(stream.construct(), cache=cache)
+        assert executor.run() == {"constant": value}
+
+    assert cache.hits == 0
+
+
+def test__run_same_dag_many_times(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+    executor = StreamExecutor(stream.construct())
+
+    expected = executor.run(1, save_all_state=True)
+    for _ in range(3):
+        assert executor.run(1, save_all_state=True) == expected
+
+
+@pytest.mark.parametrize(
+    "mandatory_names, first_args, save_all_state",
+    [
+        (None, (1,), True),
+        (None, None, False),
+        (["sample3"], (10, 20), True),
+        (["sample5"], None, True),
+    ],
+)
+def test__compiled_plan_returns_same_results(
+    mandatory_names: list[str] | None,
+    first_args: tuple[int] | None,
+    save_all_state: bool,
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, name2node = construct_stream
+
+    if mandatory_names is None:
+        mandatory_nodes = None
+    else:
+        mandatory_nodes = {name2node[name] for name in mandatory_names}
+
+    results = []
+    for compile in [False, True]:
+        functional_dag = stream.construct(
+            mandatory_nodes=mandatory_nodes, compile=compile
+        )
+        executor = StreamExecutor(functional_dag)
+        results.append(
+            executor.run(
+                3, first_args=first_args, save_all_state=save_all_state, a=1
+            )
+        )
+
+    assert results[0] == results[1]
+
+
+def test__release_intermediate_results_with_compiled_plan():
+    def first() -> _Payload:
+        return _Payload(1000)
+
+    def second(payload: _Payload) -> _Payload:
+        return _Payload(1000)
+
+    def third(payload: _Payload) -> bool:
+        return True
+
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(first, second, third)
+    node1.precede(node2, pipe=True)
+    node2.precede(node3, pipe=True)
+
+    executor = StreamExecutor(stream.construct(compile=True), track_memory=True)
+    for _ in range(2):
+        assert executor.run() == {"third": True}
+        assert executor.stats.peak_live_bytes == 2000
+        assert executor.stats.live_bytes < 1000
+
+
+@pytest.mark.parametrize("compile", [False, True])
+def test__every_consumer_receives_all_chunks(compile: bool):
+    def produce() -> Iterator[int]:
+        yield from range(5)
+
+    def total(chunks: Iterable[int]) -> int:
+        return sum(chunks)
+
+    def count(chunks: Iterable[int]) -> int:
+        return len(list(chunks))
+
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(produce, total, count)
+    node1.precede(node2, node3, pipe=True)
+
+    executor = StreamExecutor(stream.construct(compile=compile))
+    assert executor.run() == {"total": 10, "count": 5}
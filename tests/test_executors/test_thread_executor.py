@@ -0,0 +1,432 @@
+import threading
+import time
+from collections.abc import Iterable, Iterator
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.caches import MemoryCache
+from dagstream.executor import StreamExecutor, StreamThreadExecutor
+from dagstream.graph_components import IFunctionalNode
+from dagstream.schedulers import CriticalPathScheduler
+from dagstream.utils.errors import DagStreamChannelError
+
+
+def sample1(*args: int) -> int:
+    return 1
+
+
+def sample2(args: int) -> int:
+    return args + 2
+
+
+def sample3(*args: int) -> int:
+    return sum(args)
+
+
+def sample4(*args: int) -> int:
+    return 4
+
+
+def sample5(args: int) -> int:
+    return args + 5
+
+
+def sample6(*args: int) -> int:
+    return sum(args) + 6
+
+
+@pytest.fixture
+def construct_stream() -> tuple[DagStream, dict[str, IFunctionalNode]]:
+    stream = DagStream()
+    node1, node2, node3, node4, node5, node6 = stream.emplace(
+        sample1, sample2, sample3, sample4, sample5, sample6
+    )
+
+    """
+    Relationship
+
+    node1 --> node2 -->   node3
+      |                     ^
+      ----------------------|
+                            |
+    node4 --> node5         |
+              | --> node6---|
+    """
+    node1.precede(node2, node3, pipe=True)
+    node3.succeed(node1, node2, node6, pipe=True)
+    node4.precede(node5, pipe=True)
+    node5.precede(node6, pipe=True)
+
+    name2node = {
+        node.mut_name: node
+        for node in [node1, node2, node3, node4, node5, node6]
+    }
+    return stream, name2node
+
+
+def test__cannot_initialize_before_calling_construct(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+
+    with pytest.raises(ValueError):
+        _ = StreamThreadExecutor(stream)
+
+
+@pytest.mark.parametrize("n_threads", [-1, 0, -100])
+def test__not_allowed_non_positive_n_threads(
+    n_threads: int,
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+
+    with pytest.raises(ValueError):
+        _ = StreamThreadExecutor(stream.construct(), n_threads=n_threads)
+
+
+@pytest.mark.parametrize(
+    "mandatory_names, save_all_state",
+    [
+        (["sample5"], False),
+        (["sample5"], True),
+        (["sample3", "sample6"], False),
+        (None, True),
+    ],
+)
+@pytest.mark.parametrize("n_threads", [1, 4])
+def test__same_results_as_single_executor(
+    mandatory_names: list[str] | None,
+    save_all_state: bool,
+    n_threads: int,
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, name2node = construct_stream
+
+    if mandatory_names is None:
+        mandatory_nodes = None
+    else:
+        mandatory_nodes = [name2node[name] for name in mandatory_names]
+
+    expected = StreamExecutor(
+        stream.construct(mandatory_nodes=mandatory_nodes)
+    ).run(save_all_state=save_all_state)
+
+    executor = StreamThreadExecutor(
+        stream.construct(mandatory_nodes=mandatory_nodes), n_threads=n_threads
+    )
+    actual = executor.run(save_all_state=save_all_state)
+
+    assert actual == expected
+
+
+def test__pass_first_args():
+    stream = DagStream()
+    node1, node2 = stream.emplace(sample2, sample5)
+    node1.precede(node2, pipe=True)
+
+    executor = StreamThreadExecutor(stream.construct())
+    result = executor.run(first_args=(10,))
+
+    assert result == {"sample5": 17}
+
+
+def test__successor_starts_before_unrelated_node_finishes():
+    # fast --> after_fast is dispatched while slow is still running
+    events: list[str] = []
+    slow_finished = threading.Event()
+
+    def slow():
+        slow_finished.wait(timeout=5.0)
+        events.append("slow")
+
+    def fast():
+        events.append("fast")
+
+    def after_fast():
+        events.append("after_fast")
+        slow_finished.set()
+
+    stream = DagStream()
+    node_slow, node_fast, node_after = stream.emplace(slow, fast, after_fast)
+    node_fast.precede(node_after)
+
+    executor = StreamThreadExecutor(stream.construct(), n_threads=2)
+    executor.run()
+
+    assert events == ["fast", "after_fast", "slow"]
+
+
+def test__io_bound_functions_overlap():
+    def wait():
+        time.sleep(0.2)
+
+    stream = DagStream()
+    stream.emplace(*[wait for _ in range(4)])
+
+    start = time.perf_counter()
+    StreamThreadExecutor(stream.construct(), n_threads=4).run()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6
+
+
+def test__raise_error_in_function():
+    def failed():
+        raise RuntimeError("failed")
+
+    called: list[str] = []
+
+    def never_called():
+        called.append("never_called")
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(failed, never_called)
+    node1.precede(node2)
+
+    executor = StreamThreadExecutor(stream.construct())
+    with pytest.raises(RuntimeError):
+        executor.run()
+
+    assert called == []
+
+
+@pytest.mark.parametrize("chunk_buffer_size", [-1, 0])
+def test__not_allowed_non_positive_chunk_buffer_size(
+    chunk_buffer_size: int,
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+
+    with pytest.raises(ValueError):
+        _ = StreamThreadExecutor(
+            stream.construct(), chunk_buffer_size=chunk_buffer_size
+        )
+
+
+def test__consumer_starts_before_generator_finishes():
+    events: list[str] = []
+
+    def produce() -> Iterator[int]:
+        for i in range(5):
+            events.append(f"put {i}")
+            yield i
+
+    def consume(chunks: Iterable[int]) -> int:
+        total = 0
+        for chunk in chunks:
+            events.append(f"get {chunk}")
+            total += chunk
+        return total
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(produce, consume)
+    node1.precede(node2, pipe=True)
+
+    executor = StreamThreadExecutor(
+        stream.construct(), n_threads=1, chunk_buffer_size=1
+    )
+    result = executor.run()
+
+    assert result == {"consume": 10}
+    assert events.index("get 0") < events.index("put 4")
+
+
+def test__collect_chunks_when_no_consumer():
+    def produce() -> Iterator[int]:
+        yield from range(3)
+
+    stream = DagStream()
+    stream.emplace(produce)
+
+    result = StreamThreadExecutor(stream.construct()).run()
+
+    assert result == {"produce": [0, 1, 2]}
+
+
+def test__every_consumer_receives_all_chunks():
+    def produce() -> Iterator[int]:
+        yield from range(100)
+
+    def consume_sum(chunks: Iterable[int]) -> int:
+        return sum(chunks)
+
+    def consume_len(chunks: Iterable[int]) -> int:
+        return len(list(chunks))
+
+    def square(chunks: Iterable[int]) -> Iterator[int]:
+        for chunk in chunks:
+            yield chunk * chunk
+
+    stream = DagStream()
+    node1, node2, node3, node4, node5 = stream.emplace(
+        produce, consume_sum, consume_len, square, consume_sum
+    )
+    node1.precede(node2, node3, node4, pipe=True)
+    node4.precede(node5, pipe=True)
+
+    executor = StreamThreadExecutor(
+        stream.construct(), n_threads=1, chunk_buffer_size=2
+    )
+    result = executor.run()
+
+    assert result == {
+        node2.mut_name: 4950,
+        "consume_len": 100,
+        node5.mut_name: sum(i * i for i in range(100)),
+    }
+
+
+def test__non_pipe_successor_waits_until_generator_finishes():
+    events: list[str] = []
+
+    def produce() -> Iterator[int]:
+        yield 1
+        events.append("produce finished")
+
+    def after_produce():
+        events.append("after_produce")
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(produce, after_produce)
+    node1.precede(node2)
+
+    StreamThreadExecutor(stream.construct()).run()
+
+    assert events == ["produce finished", "after_produce"]
+
+
+def test__generator_stops_when_consumer_stops_reading():
+    closed = threading.Event()
+
+    def produce() -> Iterator[int]:
+        try:
+            yield from range(1_000_000)
+        finally:
+            closed.set()
+
+    def consume_first(chunks: Iterable[int]) -> int:
+        return next(iter(chunks))
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(produce, consume_first)
+    node1.precede(node2, pipe=True)
+
+    result = StreamThreadExecutor(stream.construct(), chunk_buffer_size=1).run()
+
+    assert result == {"consume_first": 0}
+    assert closed.is_set()
+
+
+def test__raise_error_in_generator():
+    def produce() -> Iterator[int]:
+        yield 1
+        raise KeyError("failed")
+
+    def consume(chunks: Iterable[int]) -> int:
+        return sum(chunks)
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(produce, consume)
+    node1.precede(node2, pipe=True)
+
+    executor = StreamThreadExecutor(stream.construct())
+    with pytest.raises((KeyError, DagStreamChannelError)):
+        executor.run()
+
+
+def test__reuse_cached_results(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+    cache = MemoryCache()
+
+    expected = StreamThreadExecutor(stream.construct(), cache=cache).run(
+        save_all_state=True
+    )
+    actual = StreamThreadExecutor(stream.construct(), cache=cache).run(
+        save_all_state=True
+    )
+
+    assert actual == expected
+    assert cache.hits == 6
+    assert cache.misses == 6
+
+
+def test__cache_hits_are_not_recorded_by_scheduler(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+    cache = MemoryCache()
+    scheduler = CriticalPathScheduler()
+
+    StreamThreadExecutor(
+        stream.construct(), scheduler=scheduler, cache=cache
+    ).run()
+    expected = dict(scheduler.costs)
+    StreamThreadExecutor(
+        stream.construct(), scheduler=scheduler, cache=cache
+    ).run()
+
+    assert cache.hits == 6
+    assert scheduler.costs == expected
+
+
+def test__run_same_dag_many_times(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+    executor = StreamThreadExecutor(stream.construct(), n_threads=2)
+
+    expected = StreamExecutor(stream.construct()).run(save_all_state=True)
+    for _ in range(3):
+        assert executor.run(save_all_state=True) == expected
+
+
+def test__collect_chunks_for_consumer_waiting_for_descendant():
+    def produce() -> Iterator[int]:
+        yield from range(50)
+
+    def after_produce() -> int:
+        return 1
+
+    def consume(chunks: Iterable[int], offset: int) -> int:
+        return sum(chunks) + offset
+
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(produce, after_produce, consume)
+    node1.precede(node3, pipe=True)
+    node1.precede(node2)
+    node2.precede(node3, pipe=True)
+
+    executor = StreamThreadExecutor(stream.construct(), chunk_buffer_size=4)
+    result = executor.run()
+
+    assert result == {"consume": sum(range(50)) + 1}
+
+
+def test__stream_and_collect_chunks_of_same_generator():
+    def produce() -> Iterator[int]:
+        yield from range(50)
+
+    def consume_len(chunks: Iterable[int]) -> int:
+        return len(list(chunks))
+
+    def after_produce() -> int:
+        return 1
+
+    def consume(chunks: Iterable[int], offset: int) -> int:
+        return sum(chunks) + offset
+
+    stream = DagStream()
+    node1, node2, node3, node4 = stream.emplace(
+        produce, consume_len, after_produce, consume
+    )
+    node1.precede(node2, node4, pipe=True)
+    node1.precede(node3)
+    node3.precede(node4, pipe=True)
+
+    executor = StreamThreadExecutor(stream.construct(), chunk_buffer_size=4)
+    result = executor.run()
+
+    assert result == {"consume_len": 50, "consume": sum(range(50)) + 1}
@@ -0,0 +1,217 @@
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.executor import StreamParallelExecutor, StreamWorkerPool
+from dagstream.utils.errors import DagStreamWorkerError
+
+
+def get_pid(*args: int) -> int:
+    return os.getpid()
+
+
+def add_one(args: int) -> int:
+    return args + 1
+
+
+def multiply(*args: int) -> int:
+    result = 1
+    for v in args:
+        result *= v
+    return result
+
+
+def failed(*args: int) -> int:
+    raise RuntimeError("failed in worker")
+
+
+def sleep(*args: int) -> None:
+    time.sleep(0.3)
+
+
+def exit_process(*args: int) -> None:
+    os._exit(1)
+
+
+def return_lock(*args: int) -> threading.Lock:
+    return threading.Lock()
+
+
+@pytest.fixture
+def construct_stream() -> DagStream:
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(add_one, add_one, multiply)
+
+    """
+    Relationship
+
+    add_one --> add_one_1 --> multiply
+      |                         ^
+      --------------------------|
+    """
+    node1.precede(node2, node3, pipe=True)
+    node3.succeed(node2, pipe=True)
+    return stream
+
+
+@pytest.mark.parametrize("n_process", [-1, 0, -100])
+def test__not_allowed_non_positive_n_process(n_process: int):
+    with pytest.raises(ValueError):
+        _ = StreamWorkerPool(n_process)
+
+
+def test__start_and_close():
+    pool = StreamWorkerPool(2)
+    assert not pool.is_alive
+
+    pool.start()
+    assert pool.is_alive
+    processes = list(pool._processes)
+
+    pool.close()
+    assert not pool.is_alive
+    assert all(not p.is_alive() for p in processes)
+
+    # closing twice is allowed
+    pool.close()
+
+
+def test__cannot_access_queue_before_start():
+    pool = StreamWorkerPool(1)
+    with pytest.raises(ValueError):
+        _ = pool.task_queue
+
+
+def test__reuse_workers_among_runs():
+    stream = DagStream()
+    stream.emplace(get_pid)
+
+    with StreamWorkerPool(1) as pool:
+        pids = set()
+        for _ in range(3):
+            executor = StreamParallelExecutor(stream.construct(), pool=pool)
+            result = executor.run()
+            pids.add(result["get_pid"])
+        assert pool.is_alive
+
+    assert len(pids) == 1
+    assert os.getpid() not in pids
+
+
+def test__serve_different_functional_dags(construct_stream: DagStream):
+    other_stream = DagStream()
+    other_stream.emplace(add_one)
+
+    with StreamWorkerPool(2) as pool:
+        for i in range(3):
+            result = StreamParallelExecutor(
+                construct_stream.construct(), pool=pool
+            ).run(first_args=(i,))
+            assert result == {"multiply": (i + 1) * (i + 2)}
+
+            result = StreamParallelExecutor(
+                other_stream.construct(), pool=pool
+            ).run(first_args=(i,))
+            assert result == {"add_one": i + 1}
+
+
+def test__temporary_pool_is_closed_after_run(construct_stream: DagStream):
+    executor = StreamParallelExecutor(construct_stream.construct())
+    result = executor.run(first_args=(1,))
+
+    assert result == {"multiply": 6}
+    assert executor._pool is None
+
+
+def test__pool_is_reusable_after_error():
+    stream = DagStream()
+    node1, node2 = stream.emplace(failed, add_one)
+    node1.precede(node2, pipe=True)
+
+    with StreamWorkerPool(1) as pool:
+        executor = StreamParallelExecutor(stream.construct(), pool=pool)
+        with pytest.raises(RuntimeError, match="failed in worker"):
+            executor.run()
+
+        other_stream = DagStream()
+        other_stream.emplace(add_one)
+        result = StreamParallelExecutor(
+            other_stream.construct(), pool=pool
+        ).run(first_args=(1,))
+
+    assert result == {"add_one": 2}
+
+
+def test__raise_error_when_result_cannot_be_pickled():
+    stream = DagStream()
+    stream.emplace(return_lock)
+
+    with StreamWorkerPool(1) as pool:
+        pool._liveness_interval = 0.1
+        executor = StreamParallelExecutor(stream.construct(), pool=pool)
+        with pytest.raises(TypeError):
+            executor.run()
+
+        other_stream = DagStream()
+        other_stream.emplace(add_one)
+        result = StreamParallelExecutor(
+            other_stream.construct(), pool=pool
+        ).run(first_args=(1,))
+
+    assert result == {"add_one": 2}
+
+
+def test__parent_does_not_consume_cpu_while_waiting():
+    stream = DagStream()
+    node1, node2 = stream.emplace(sleep, sleep)
+    node1.precede(node2)
+
+    with StreamWorkerPool(1) as pool:
+        executor = StreamParallelExecutor(stream.construct(), pool=pool)
+
+        start = time.process_time()
+        executor.run()
+        elapsed = time.process_time() - start
+
+    # Busy polling consumes cpu time as long as workers run (0.6 sec).
+    assert elapsed < 0.2
+
+
+def test__raise_error_when_worker_exits():
+    stream = DagStream()
+    stream.emplace(exit_process)
+
+    with StreamWorkerPool(1) as pool:
+        pool._liveness_interval = 0.1
+        executor = StreamParallelExecutor(stream.construct(), pool=pool)
+        with pytest.raises(DagStreamWorkerError):
+            executor.run()
+
+
+@pytest.mark.parametrize("statement", ["pass", "del pool"])
+def test__unclosed_pool_does_not_block_exit(statement: str):
+    code = textwrap.dedent(
+        f"""
+        from dagstream import DagStream
+        from dagstream.executor import StreamParallelExecutor, StreamWorkerPool
+
+        if __name__ == "__main__":
+            pool = StreamWorkerPool(2)
+            stream = DagStream()
+            stream.emplace(int)
+            executor = StreamParallelExecutor(stream.construct(), pool=pool)
+            assert list(executor.run().values()) == [0]
+            {statement}
+        """
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, timeout=60
+    )
+
+    assert completed.returncode == 0, completed.stderr
@@ -0,0 +1,99 @@
+import pytest
+
+from dagstream import DagStream
+from dagstream.graph_components import AncestorIndex, TopologicalOrder
+from dagstream.graph_components.nodes import FunctionalNode
+
+
+def sample():
+    pass
+
+
+@pytest.fixture
+def create_index() -> tuple[AncestorIndex, list[FunctionalNode]]:
+    name2node: dict[str, FunctionalNode] = {}
+    order = TopologicalOrder(name2node)
+    nodes = []
+    for i in range(5):
+        node = FunctionalNode(sample, mut_node_name=f"node{i}", order=order)
+        name2node[node.mut_name] = node
+        order.add_node(node.mut_name)
+        nodes.append(node)
+
+    """
+    Relationship
+
+    node0 --> node1 --> node3
+                          ^
+    node2 ----------------|
+
+    node4
+    """
+    nodes[0].precede(nodes[1])
+    nodes[1].precede(nodes[3])
+    nodes[2].precede(nodes[3])
+    return AncestorIndex(name2node, order), nodes
+
+
+@pytest.mark.parametrize(
+    "node_names, expected",
+    [
+        (["node0"], ["node0"]),
+        (["node1"], ["node0", "node1"]),
+        (["node3"], ["node0", "node1", "node2", "node3"]),
+        (["node4", "node1"], ["node0", "node1", "node4"]),
+    ],
+)
+def test__extract(
+    node_names: list[str],
+    expected: list[str],
+    create_index: tuple[AncestorIndex, list[FunctionalNode]],
+):
+    index, _ = create_index
+
+    assert list(index.extract(node_names)) == expected
+
+
+def test__reuse_cached_ancestors(
+    create_index: tuple[AncestorIndex, list[FunctionalNode]],
+):
+    index, _ = create_index
+
+    _ = index.extract(["node3"])
+    assert index.n_cached == 1
+
+    _ = index.extract(["node3"])
+    assert index.n_cached == 1
+
+    _ = index.extract(["node3", "node4"])
+    assert index.n_cached == 2
+
+
+def test__invalidate_when_edge_is_added(
+    create_index: tuple[AncestorIndex, list[FunctionalNode]],
+):
+    index, nodes = create_index
+    assert list(index.extract(["node3"])) == [
+        "node0",
+        "node1",
+        "node2",
+        "node3",
+    ]
+
+    nodes[4].precede(nodes[0])
+
+    assert len(index.extract(["node3"])) == 5
+    assert index.n_cached == 1
+
+
+def test__extract_after_emplace():
+    stream = DagStream()
+    (node1,) = stream.emplace(sample)
+    assert len(stream.construct({node1})._name2nodes) == 1
+
+    (node2,) = stream.emplace(sample)
+    node1.precede(node2)
+
+    functional_dag = stream.construct({node2})
+    assert functional_dag.check_exists(node1)
+    assert functional_dag.check_exists(node2)
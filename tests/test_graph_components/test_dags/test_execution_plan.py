@@ -0,0 +1,79 @@
+import pytest
+
+from dagstream.graph_components import ExecutionPlan, FunctionalDag
+from dagstream.graph_components.nodes import FunctionalNode
+
+
+@pytest.fixture
+def create_functional_nodes() -> dict[str, FunctionalNode]:
+    def sample1():
+        pass
+
+    def sample2():
+        pass
+
+    def sample3():
+        pass
+
+    node1 = FunctionalNode(sample1)
+    node2 = FunctionalNode(sample2)
+    node3 = FunctionalNode(sample3)
+
+    """
+    Relationship
+
+    node1 ==> node2 --> node3
+      |                   ^
+      --------------------|
+    """
+    node1.precede(node2, pipe=True)
+    node1.precede(node3)
+    node2.precede(node3)
+    nodes = [node1, node2, node3]
+
+    return {node.mut_name: node for node in nodes}
+
+
+def test__csr_arrays(create_functional_nodes: dict[str, FunctionalNode]):
+    plan = ExecutionPlan(create_functional_nodes)
+
+    assert plan.n_nodes == 3
+    assert list(plan.offsets) == [0, 2, 3, 3]
+    assert list(plan.targets) == [1, 2, 2]
+    assert list(plan.pipe_mask) == [1, 0, 0]
+    assert list(plan.in_degrees) == [0, 1, 2]
+    assert list(plan.sources) == [0]
+    assert list(plan.is_last) == [0, 0, 1]
+
+
+def test__pipe_predecessors(
+    create_functional_nodes: dict[str, FunctionalNode],
+):
+    plan = ExecutionPlan(create_functional_nodes)
+
+    assert list(plan.pipe_offsets) == [0, 0, 1, 1]
+    assert list(plan.pipe_sources) == [0]
+    assert list(plan.n_pipe_successors) == [1, 0, 0]
+
+
+def test__ignore_edges_to_outside(
+    create_functional_nodes: dict[str, FunctionalNode],
+):
+    names = list(create_functional_nodes.keys())
+    sub_nodes = {name: create_functional_nodes[name] for name in names[:2]}
+    plan = ExecutionPlan(sub_nodes)
+
+    assert list(plan.targets) == [1]
+    assert list(plan.is_last) == [0, 1]
+    assert plan.get_index(names[1]) == 1
+
+
+def test__compile_once(create_functional_nodes: dict[str, FunctionalNode]):
+    functional_dag = FunctionalDag(create_functional_nodes)
+    assert functional_dag.plan is None
+
+    plan = functional_dag.compile()
+
+    assert functional_dag.compile() is plan
+    assert functional_dag.plan is plan
+    assert functional_dag.clone().plan is plan
@@ -92,3 +92,139 @@ def test__check_last(create_functional_nodes: dict[str, FunctionalNode]):
 
     assert dag.check_last("sample3")
     assert not dag.check_last("sample2")
+
+
+def test__clone_has_own_state(
+    create_functional_nodes: dict[str, FunctionalNode],
+):
+    dag = FunctionalDag(create_functional_nodes)
+    cloned = dag.clone()
+
+    for node in dag.get_ready():
+        node.receive_args(1)
+        dag.done(node.mut_name)
+
+    assert [n.display_name for n in cloned.get_ready()] == ["sample1"]
+    for node in cloned.get_functions():
+        assert node.get_received_args() == []
+        assert node is not create_functional_nodes[node.mut_name]
+
+
+def test__clone_shares_topology_and_plan():
+    def sample1():
+        pass
+
+    def sample2():
+        pass
+
+    node1 = FunctionalNode(sample1)
+    node2 = FunctionalNode(sample2)
+    node1.precede(node2, pipe=True)
+    dag = FunctionalDag({node.mut_name: node for node in (node1, node2)})
+    plan = dag.compile()
+
+    cloned = dag.clone()
+
+    assert cloned.plan is plan
+    assert cloned._successors is dag._successors
+    (cloned_node2,) = cloned.get_pipe_successors(node1.mut_name)
+    assert cloned_node2 is not node2
+
+    (cloned_node1,) = cloned.get_ready()
+    assert cloned_node1 is not node1
+    cloned.send(node1.mut_name, 1)
+    cloned.done(node1.mut_name)
+    assert cloned.get_ready() == (cloned_node2,)
+    assert cloned_node2.get_received_args() == [1]
+    assert node2.get_received_args() == []
+
+
+def test__open_stream_releases_pipe_successors():
+    def sample1():
+        pass
+
+    def sample2():
+        pass
+
+    def sample3():
+        pass
+
+    node1 = FunctionalNode(sample1)
+    node2 = FunctionalNode(sample2)
+    node3 = FunctionalNode(sample3)
+    node1.precede(node2, pipe=True)
+    node1.precede(node3)
+    dag = FunctionalDag({node.mut_name: node for node in [node1, node2, node3]})
+
+    (node,) = dag.get_ready()
+    consumers = dag.open_stream(node.mut_name)
+
+    assert consumers == (node2,)
+    assert dag.get_ready() == (node2,)
+
+    dag.done(node1.mut_name)
+    assert dag.get_ready() == (node3,)
+
+
+def test__release_received_args_when_done(
+    create_functional_nodes: dict[str, FunctionalNode],
+):
+    dag = FunctionalDag(create_functional_nodes)
+    (node,) = dag.get_ready()
+    node.receive_args(1)
+
+    dag.done(node.mut_name)
+
+    assert node.get_received_args() == []
+
+
+def test__get_descendants(create_functional_nodes: dict[str, FunctionalNode]):
+    dag = FunctionalDag(create_functional_nodes)
+
+    assert dag.get_descendants("sample2") == {"sample2", "sample3"}
+    assert dag.get_descendants("sample1") == {"sample1", "sample2", "sample3"}
+    assert dag.get_descendants("sample3", "unknown") == {"sample3"}
+
+
+def test__reset(create_functional_nodes: dict[str, FunctionalNode]):
+    dag = FunctionalDag(create_functional_nodes)
+    while dag.is_active:
+        for node in dag.get_ready():
+            node.receive_args(1)
+            dag.done(node.mut_name)
+
+    dag.reset()
+
+    assert dag.is_active
+    assert dag._n_finished == 0
+    assert [n.display_name for n in dag.get_ready()] == ["sample1"]
+    for node in dag.get_functions():
+        assert node.get_received_args() == []
+
+
+def test__open_stream_skips_successor_waiting_for_descendant():
+    def sample1():
+        pass
+
+    def sample2():
+        pass
+
+    def sample3():
+        pass
+
+    node1 = FunctionalNode(sample1)
+    node2 = FunctionalNode(sample2)
+    node3 = FunctionalNode(sample3)
+    node1.precede(node3, pipe=True)
+    node1.precede(node2)
+    node2.precede(node3, pipe=True)
+    dag = FunctionalDag({node.mut_name: node for node in [node1, node2, node3]})
+
+    (node,) = dag.get_ready()
+    assert dag.open_stream(node.mut_name) == ()
+    assert dag.get_ready() == ()
+
+    dag.send(node1.mut_name, [1])
+    dag.done(node1.mut_name)
+    assert dag.get_ready() == (node2,)
+    assert node3.get_received_args() == [[1]]
@@ -0,0 +1,165 @@
+import random
+
+import pytest
+
+from dagstream.graph_components import TopologicalOrder
+from dagstream.graph_components.nodes import FunctionalNode
+from dagstream.utils.errors import DagStreamCycleError
+
+
+def sample():
+    pass
+
+
+def create_nodes(
+    n_nodes: int,
+) -> tuple[TopologicalOrder, list[FunctionalNode]]:
+    name2node: dict[str, FunctionalNode] = {}
+    order = TopologicalOrder(name2node)
+    nodes = []
+    for i in range(n_nodes):
+        node = FunctionalNode(sample, mut_node_name=f"node{i}", order=order)
+        name2node[node.mut_name] = node
+        order.add_node(node.mut_name)
+        nodes.append(node)
+    return order, nodes
+
+
+def check_order(order: TopologicalOrder, nodes: list[FunctionalNode]) -> None:
+    for node in nodes:
+        for edge in node.successors:
+            assert order.get_position(node.mut_name) < order.get_position(
+                edge.to_node
+            )
+
+
+def test__keep_positions_when_edge_follows_order():
+    order, nodes = create_nodes(3)
+    nodes[0].precede(nodes[1])
+    nodes[1].precede(nodes[2])
+
+    assert order.get_order() == ["node0", "node1", "node2"]
+
+
+def test__reorder_when_edge_goes_back():
+    order, nodes = create_nodes(4)
+    nodes[3].precede(nodes[2])
+    nodes[2].precede(nodes[0])
+    nodes[1].precede(nodes[3])
+
+    check_order(order, nodes)
+    assert order.get_order().index("node1") < order.get_order().index("node0")
+
+
+def test__reject_self_loop():
+    _, nodes = create_nodes(1)
+
+    with pytest.raises(DagStreamCycleError) as exc_info:
+        nodes[0].precede(nodes[0])
+
+    assert exc_info.value.cycle == ["node0", "node0"]
+
+
+def test__ignore_nodes_outside_of_order():
+    order, nodes = create_nodes(1)
+    outside = FunctionalNode(sample, mut_node_name="outside")
+
+    nodes[0].precede(outside)
+    outside.precede(nodes[0])
+
+    assert order.get_order() == ["node0"]
+
+
+def test__keep_order_with_random_edges():
+    rng = random.Random(0)
+    order, nodes = create_nodes(50)
+    # Edges are added in random order but never make a cycle
+    ranks = list(range(50))
+    rng.shuffle(ranks)
+    for _ in range(300):
+        i, j = rng.sample(range(50), 2)
+        if ranks[i] > ranks[j]:
+            i, j = j, i
+        nodes[i].precede(nodes[j])
+
+    check_order(order, nodes)
+
+
+def test__add_edges_at_once():
+    order, nodes = create_nodes(4)
+    order.add_edges({"node3": ["node1"], "node1": ["node0"]})
+    for from_node, to_node in [(3, 1), (1, 0)]:
+        nodes[to_node].extend_predecessors([nodes[from_node].mut_name])
+        nodes[from_node].extend_successors([(nodes[to_node].mut_name, False)])
+
+    check_order(order, nodes)
+
+
+def test__find_cycle_with_successors_out_of_cycle():
+    order, nodes = create_nodes(3)
+    nodes[0].precede(nodes[1])
+
+    with pytest.raises(DagStreamCycleError) as exc_info:
+        order.add_edges({"node1": ["node0", "node2"]})
+
+    assert exc_info.value.cycle in (
+        ["node0", "node1", "node0"],
+        ["node1", "node0", "node1"],
+    )
+    assert order.get_order() == ["node0", "node1", "node2"]
+
+
+def _add_reversed_chain(nodes: list[FunctionalNode]) -> None:
+    # Every edge goes back, so that each search visits the whole chain
+    for i in range(1, len(nodes)):
+        nodes[i].precede(nodes[i - 1])
+
+
+def test__sort_once_when_searches_exceed_budget():
+    order, nodes = create_nodes(5000)
+    _add_reversed_chain(nodes)
+
+    assert order.is_dirty
+    check_order(order, nodes)
+    assert not order.is_dirty
+
+
+def test__find_cycle_by_validate_when_order_is_dirty():
+    order, nodes = create_nodes(5000)
+    _add_reversed_chain(nodes)
+    assert order.is_dirty
+
+    # Not searched when added
+    nodes[0].precede(nodes[-1])
+
+    with pytest.raises(DagStreamCycleError) as ex:
+        order.validate()
+    assert ex.value.cycle[0] == ex.value.cycle[-1]
+    assert len(ex.value.cycle) == 5001
+
+
+def test__validate_edge_once_for_each_edge(monkeypatch: pytest.MonkeyPatch):
+    order, nodes = create_nodes(2)
+    called: list[tuple[str, str]] = []
+    original = TopologicalOrder.add_edge
+
+    def add_edge(self: TopologicalOrder, from_node: str, to_node: str) -> None:
+        called.append((from_node, to_node))
+        original(self, from_node, to_node)
+
+    monkeypatch.setattr(TopologicalOrder, "add_edge", add_edge)
+    nodes[0].precede(nodes[1])
+    nodes[1].succeed(nodes[0])
+
+    assert called == [("node0", "node1")]
+    assert nodes[1].predecessors == {"node0"}
+
+
+def test__not_register_predecessor_of_rejected_edge():
+    _, nodes = create_nodes(2)
+    nodes[0].precede(nodes[1])
+
+    with pytest.raises(DagStreamCycleError):
+        nodes[0].succeed(nodes[1])
+
+    assert nodes[0].predecessors == set()
@@ -21,3 +21,9 @@ def test__to_node(from_node: str, to_node: str, is_pipe: bool):
     edge = DagEdge(from_node, to_node, is_pipe)
 
     assert edge.to_node == to_node
+
+
+def test__has_no_instance_dict():
+    edge = DagEdge("node1", "node2", True)
+
+    assert not hasattr(edge, "__dict__")
@@ -1,3 +1,7 @@
+import asyncio
+import copy
+import sys
+from collections.abc import Iterator
 from typing import Any
 from unittest import mock
 
@@ -158,3 +162,65 @@ def test__get_received_args(args: Any):  # noqa: ANN401
         node1.receive_args(arg)
 
     assert node1.get_received_args() == list(args)
+
+
+def test__run_async():
+    async def sample1(x: int) -> int:
+        return x + 1
+
+    def sample2(x: int) -> int:
+        return x + 2
+
+    node1 = FunctionalNode(sample1)
+    node2 = FunctionalNode(sample2)
+
+    assert asyncio.run(node1.run_async(1)) == 2
+    assert asyncio.run(node2.run_async(1)) == 3
+
+
+def test__is_generator():
+    def sample() -> int:
+        return 1
+
+    def sample_chunks() -> Iterator[int]:
+        yield 1
+
+    assert not FunctionalNode(sample).is_generator
+    assert FunctionalNode(sample_chunks).is_generator
+
+
+def test__has_no_instance_dict():
+    def sample() -> int:
+        return 1
+
+    node = FunctionalNode(sample)
+
+    assert not hasattr(node, "__dict__")
+    assert not hasattr(node.prepare(), "__dict__")
+
+
+def test__intern_names():
+    def sample1():
+        pass
+
+    name = "".join(["sam", "ple", "_name"])
+    node = FunctionalNode(sample1, mut_node_name=name)
+    node.display_name = "".join(["dis", "play"])
+
+    assert node.mut_name is sys.intern("sample_name")
+    assert node.display_name is sys.intern("display")
+
+
+def test__copy_keeps_attributes():
+    def sample(x: int) -> int:
+        return x + 1
+
+    node = FunctionalNode(sample)
+    node.resources = {"cpu": 2}
+    node.receive_args(1)
+
+    copied = copy.copy(node)
+
+    assert copied.mut_name == node.mut_name
+    assert copied.resources == {"cpu": 2}
+    assert copied.run() == 2
@@ -0,0 +1,74 @@
+import subprocess
+import sys
+
+import pytest
+
+import dagstream
+
+
+def _imported_modules(statement: str, modules: list[str]) -> list[str]:
+    code = (
+        "import sys\n"
+        f"{statement}\n"
+        f"print(','.join(m for m in {modules!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [m for m in completed.stdout.strip().split(",") if m]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    ["import dagstream", "from dagstream import DagStream"],
+)
+def test__import_does_not_load_heavy_modules(statement: str):
+    heavy = [
+        "asyncio",
+        "multiprocessing",
+        "sqlite3",
+        "importlib.metadata",
+        "dagstream.executor",
+        "dagstream.viewers",
+    ]
+    assert _imported_modules(statement, heavy) == []
+
+
+def test__import_executor_does_not_load_multiprocessing():
+    heavy = ["asyncio", "multiprocessing", "sqlite3"]
+    statement = "from dagstream import StreamExecutor"
+    assert _imported_modules(statement, heavy) == []
+
+
+def test__lazy_attributes_are_accessible():
+    from dagstream import DagStream, StreamExecutor, __version__
+    from dagstream.dagstream import DagStream as _DagStream
+    from dagstream.executor import StreamExecutor as _StreamExecutor
+
+    assert DagStream is _DagStream
+    assert StreamExecutor is _StreamExecutor
+    assert isinstance(__version__, str)
+    assert {"DagStream", "StreamExecutor", "__version__"} <= set(dir(dagstream))
+
+
+def test__lazy_attributes_of_subpackages():
+    from dagstream.caches import DiskCache
+    from dagstream.stores import SpilledValue, SpillStore
+    from dagstream.transports import SharedMemoryTransport
+    from dagstream.viewers import IDrawer, MermaidDrawer
+
+    assert DiskCache.__module__ == "dagstream.caches.disk_cache"
+    assert SpillStore.__module__ == "dagstream.stores.spill_store"
+    assert SpilledValue.__module__ == "dagstream.stores.spill_store"
+    assert (
+        SharedMemoryTransport.__module__ == "dagstream.transports.shared_memory"
+    )
+    assert issubclass(MermaidDrawer, IDrawer)
+
+
+def test__unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="no attribute 'NotExist'"):
+        _ = dagstream.NotExist
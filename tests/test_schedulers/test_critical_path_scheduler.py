@@ -0,0 +1,187 @@
+import time
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.executor import (
+    StreamExecutor,
+    StreamParallelExecutor,
+    StreamThreadExecutor,
+)
+from dagstream.graph_components import IFunctionalNode
+from dagstream.schedulers import CriticalPathScheduler, FifoScheduler
+
+
+def sample1():
+    pass
+
+
+def sample2():
+    pass
+
+
+def sample3():
+    pass
+
+
+def sample4():
+    pass
+
+
+@pytest.fixture
+def construct_stream() -> tuple[DagStream, dict[str, IFunctionalNode]]:
+    stream = DagStream()
+    node1, node2, node3, node4 = stream.emplace(
+        sample1, sample2, sample3, sample4
+    )
+
+    """
+    Relationship
+
+    node1
+
+    node2 --> node3 --> node4
+    """
+    node2.precede(node3)
+    node3.precede(node4)
+
+    name2node = {node.mut_name: node for node in [node1, node2, node3, node4]}
+    return stream, name2node
+
+
+@pytest.mark.parametrize("smoothing", [-0.1, 1.1])
+def test__not_allowed_smoothing_out_of_range(smoothing: float):
+    with pytest.raises(ValueError):
+        _ = CriticalPathScheduler(smoothing=smoothing)
+
+
+@pytest.mark.parametrize(
+    "costs, expected",
+    [
+        (
+            None,
+            {"sample1": 1.0, "sample2": 3.0, "sample3": 2.0, "sample4": 1.0},
+        ),
+        (
+            {"sample1": 10.0, "sample3": 0.5},
+            {"sample1": 10.0, "sample2": 2.5, "sample3": 1.5, "sample4": 1.0},
+        ),
+    ],
+)
+def test__upward_rank(
+    costs: dict[str, float] | None,
+    expected: dict[str, float],
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, _ = construct_stream
+    scheduler = CriticalPathScheduler(costs=costs)
+    scheduler.prepare(stream.construct())
+
+    for name, rank in expected.items():
+        assert scheduler.get_rank(name) == pytest.approx(rank)
+
+
+def test__upward_rank_in_subdag(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, name2node = construct_stream
+    scheduler = CriticalPathScheduler()
+    scheduler.prepare(stream.construct(mandatory_nodes=[name2node["sample3"]]))
+
+    assert scheduler.get_rank("sample2") == pytest.approx(2.0)
+    assert scheduler.get_rank(name2node["sample3"]) == pytest.approx(1.0)
+
+
+def test__order_by_rank(
+    construct_stream: tuple[DagStream, dict[str, IFunctionalNode]],
+):
+    stream, name2node = construct_stream
+    dag = stream.construct()
+
+    scheduler = CriticalPathScheduler()
+    scheduler.prepare(dag)
+    ordered = scheduler.order(dag.get_ready())
+
+    assert [node.mut_name for node in ordered] == ["sample2", "sample1"]
+
+    fifo_ordered = FifoScheduler().order(
+        [name2node["sample1"], name2node["sample2"]]
+    )
+    assert [node.mut_name for node in fifo_ordered] == ["sample1", "sample2"]
+
+
+def test__record_elapsed_time():
+    scheduler = CriticalPathScheduler(costs={"a": 1.0}, smoothing=0.25)
+
+    scheduler.record("a", 3.0)
+    scheduler.record("b", 2.0)
+
+    assert scheduler.costs["a"] == pytest.approx(1.5)
+    assert scheduler.costs["b"] == pytest.approx(2.0)
+
+
+def test__measure_costs_in_executor():
+    def slow():
+        time.sleep(0.05)
+
+    def fast():
+        pass
+
+    stream = DagStream()
+    stream.emplace(fast, slow)
+
+    scheduler = CriticalPathScheduler(smoothing=1.0)
+    StreamExecutor(stream.construct(), scheduler=scheduler).run()
+    assert scheduler.costs["slow"] > scheduler.costs["fast"]
+
+    # ranks are updated by measurements on the next run
+    executed: list[str] = []
+    scheduler.prepare(stream.construct())
+    assert scheduler.get_rank("slow") > scheduler.get_rank("fast")
+    for node in scheduler.order(stream.construct().get_ready()):
+        executed.append(node.mut_name)
+    assert executed == ["slow", "fast"]
+
+
+def test__critical_path_first_shortens_makespan():
+    def wait():
+        time.sleep(0.1)
+
+    stream = DagStream()
+    # three independent nodes and a chain of three nodes
+    *_, chain1, chain2, chain3 = stream.emplace(*[wait for _ in range(6)])
+    chain1.precede(chain2)
+    chain2.precede(chain3)
+
+    elapsed: dict[str, float] = {}
+    for name, scheduler in [
+        ("fifo", FifoScheduler()),
+        ("critical_path", CriticalPathScheduler()),
+    ]:
+        executor = StreamThreadExecutor(
+            stream.construct(), n_threads=2, scheduler=scheduler
+        )
+        start = time.perf_counter()
+        executor.run()
+        elapsed[name] = time.perf_counter() - start
+
+    # fifo: 0.4 sec, critical path: 0.3 sec
+    assert elapsed["critical_path"] < 0.35
+    assert elapsed["fifo"] > 0.35
+
+
+def started_at() -> float:
+    return time.monotonic()
+
+
+def test__parallel_executor_starts_critical_path_first():
+    stream = DagStream()
+    single, chain1, chain2 = stream.emplace(started_at, started_at, started_at)
+    chain1.precede(chain2)
+
+    executor = StreamParallelExecutor(
+        stream.construct(), n_process=1, scheduler=CriticalPathScheduler()
+    )
+    result = executor.run(save_all_state=True)
+
+    assert result[chain1.mut_name] < result[single.mut_name]
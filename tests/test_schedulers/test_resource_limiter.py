@@ -0,0 +1,221 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.executor import (
+    AsyncStreamExecutor,
+    StreamParallelExecutor,
+    StreamPipelineExecutor,
+    StreamThreadExecutor,
+)
+from dagstream.graph_components.nodes import FunctionalNode
+from dagstream.schedulers import ResourceLimiter
+
+
+def sample():
+    pass
+
+
+def create_node(**resources: float) -> FunctionalNode:
+    node = FunctionalNode(sample)
+    node.resources = resources
+    return node
+
+
+def test__acquire_and_release():
+    limiter = ResourceLimiter({"cpu": 4, "mem_gb": 16})
+    node1 = create_node(cpu=2, mem_gb=8)
+    node2 = create_node(cpu=2, mem_gb=10)
+
+    assert limiter.acquire(node1)
+    assert not limiter.acquire(node2)
+    assert limiter.in_use == {"cpu": 2, "mem_gb": 8}
+
+    limiter.release(node1)
+    assert limiter.acquire(node2)
+    assert limiter.in_use == {"cpu": 2, "mem_gb": 10}
+
+
+def test__undeclared_resources_are_unlimited():
+    limiter = ResourceLimiter({"cpu": 1})
+    node = create_node(gpu=100)
+
+    assert limiter.acquire(node)
+    assert limiter.acquire(node)
+
+
+def test__validate():
+    limiter = ResourceLimiter({"license_server": 1})
+
+    limiter.validate([create_node(license_server=1)])
+    with pytest.raises(ValueError):
+        limiter.validate([create_node(license_server=2)])
+
+
+def test__not_allowed_negative_resources():
+    node = FunctionalNode(sample)
+    with pytest.raises(ValueError):
+        node.resources = {"cpu": -1}
+
+
+def test__emplace_with_resources():
+    def sample1():
+        pass
+
+    def sample2():
+        pass
+
+    def sample3():
+        pass
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(sample1, sample2, resources={"mem_gb": 16})
+    (node3,) = stream.emplace(sample3)
+
+    assert node1.resources == {"mem_gb": 16}
+    assert node3.resources == {}
+
+    node1.resources = {"mem_gb": 8}
+    assert node2.resources == {"mem_gb": 16}
+
+
+def test__thread_executor_respects_capacities():
+    lock = threading.Lock()
+    n_running = 0
+    max_running = 0
+
+    def heavy():
+        nonlocal n_running, max_running
+        with lock:
+            n_running += 1
+            max_running = max(max_running, n_running)
+        time.sleep(0.05)
+        with lock:
+            n_running -= 1
+
+    stream = DagStream()
+    stream.emplace(*[heavy for _ in range(4)], resources={"mem_gb": 16})
+
+    executor = StreamThreadExecutor(
+        stream.construct(), n_threads=4, capacities={"mem_gb": 32}
+    )
+    executor.run()
+
+    assert max_running == 2
+
+
+def test__async_executor_respects_capacities():
+    n_running = 0
+    max_running = 0
+
+    async def heavy():
+        nonlocal n_running, max_running
+        n_running += 1
+        max_running = max(max_running, n_running)
+        await asyncio.sleep(0.05)
+        n_running -= 1
+
+    stream = DagStream()
+    stream.emplace(*[heavy for _ in range(4)], resources={"mem_gb": 16})
+
+    executor = AsyncStreamExecutor(
+        stream.construct(), capacities={"mem_gb": 32}
+    )
+    executor.run()
+
+    assert max_running == 2
+
+
+def test__pipeline_executor_shares_capacities_among_inputs():
+    lock = threading.Lock()
+    n_running = 0
+    max_running = 0
+
+    def heavy(item: int) -> int:
+        nonlocal n_running, max_running
+        with lock:
+            n_running += 1
+            max_running = max(max_running, n_running)
+        time.sleep(0.05)
+        with lock:
+            n_running -= 1
+        return item
+
+    stream = DagStream()
+    (node,) = stream.emplace(heavy, resources={"gpu": 1})
+
+    executor = StreamPipelineExecutor(
+        stream.construct(), n_threads=4, max_in_flight=4, capacities={"gpu": 1}
+    )
+    results = list(executor.run_iter(range(4)))
+
+    assert results == [(i, {node.mut_name: i}) for i in range(4)]
+    assert max_running == 1
+
+
+def test__small_nodes_run_while_large_node_waits():
+    events: list[str] = []
+
+    def large():
+        events.append("large")
+
+    def small():
+        time.sleep(0.05)
+        events.append("small")
+
+    def first():
+        time.sleep(0.1)
+        events.append("first")
+
+    stream = DagStream()
+    (first_node,) = stream.emplace(first, resources={"cpu": 3})
+    (large_node,) = stream.emplace(large, resources={"cpu": 2})
+    stream.emplace(small, resources={"cpu": 1})
+
+    executor = StreamThreadExecutor(
+        stream.construct(), n_threads=3, capacities={"cpu": 4}
+    )
+    executor.run()
+
+    # large cannot start until first finishes, but small can
+    assert events == ["small", "first", "large"]
+
+
+def test__raise_error_when_exceeding_capacity():
+    stream = DagStream()
+    stream.emplace(sample, resources={"cpu": 8})
+
+    executor = StreamThreadExecutor(stream.construct(), capacities={"cpu": 4})
+    with pytest.raises(ValueError):
+        executor.run()
+
+    with pytest.raises(ValueError):
+        AsyncStreamExecutor(stream.construct(), capacities={"cpu": 4}).run()
+
+    pipeline = StreamPipelineExecutor(stream.construct(), capacities={"cpu": 4})
+    with pytest.raises(ValueError):
+        list(pipeline.run_iter([0]))
+
+
+def started_and_finished() -> tuple[float, float]:
+    start = time.monotonic()
+    time.sleep(0.1)
+    return start, time.monotonic()
+
+
+def test__parallel_executor_respects_capacities():
+    stream = DagStream()
+    node1, node2 = stream.emplace(
+        started_and_finished, started_and_finished, resources={"gpu": 1}
+    )
+
+    executor = StreamParallelExecutor(
+        stream.construct(), n_process=2, capacities={"gpu": 1}
+    )
+    result = executor.run(save_all_state=True)
+
+    (start1, end1), (start2, end2) = sorted(result.values())
+    assert end1 <= start2
@@ -0,0 +1,126 @@
+import pathlib
+import pickle
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.executor import StreamExecutor, StreamThreadExecutor
+from dagstream.stores import SpilledValue, SpillStore, load_lazy
+
+
+class _Buffer:
+    def __init__(self, nbytes: int) -> None:
+        self.nbytes = nbytes
+
+
+def test__not_allowed_negative_threshold():
+    with pytest.raises(ValueError):
+        _ = SpillStore(-1)
+
+
+def test__keep_in_memory_under_threshold(tmp_path: pathlib.Path):
+    store = SpillStore(100, scratch_dir=tmp_path)
+    value = _Buffer(100)
+
+    key, stored = store.put(value, n_consumers=1)
+
+    assert stored is value
+    assert store.in_memory_nbytes == 100
+    assert list(tmp_path.iterdir()) == []
+
+    store.release(key)
+    assert store.in_memory_nbytes == 0
+
+
+def test__spill_over_threshold(tmp_path: pathlib.Path):
+    store = SpillStore(100, scratch_dir=tmp_path)
+    _ = store.put(_Buffer(100), n_consumers=1)
+
+    key, stored = store.put({"a": 1}, n_consumers=2)
+
+    assert isinstance(stored, SpilledValue)
+    assert stored.load() == {"a": 1}
+    assert store.n_spilled == 1
+
+    store.release(key)
+    assert len(list(tmp_path.iterdir())) == 1
+    store.release(key)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test__spilled_value_is_picklable(tmp_path: pathlib.Path):
+    store = SpillStore(0, scratch_dir=tmp_path)
+    _, stored = store.put([1, 2, 3], n_consumers=1)
+
+    restored = pickle.loads(pickle.dumps(stored))
+
+    assert restored.load() == [1, 2, 3]
+
+
+def test__load_lazy(tmp_path: pathlib.Path):
+    store = SpillStore(0, scratch_dir=tmp_path)
+    _, stored = store.put("spilled", n_consumers=1)
+
+    assert load_lazy([stored, "kept"]) == ["spilled", "kept"]
+
+
+def test__clear_removes_files(tmp_path: pathlib.Path):
+    store = SpillStore(0, scratch_dir=tmp_path)
+    _ = store.put([1], n_consumers=1)
+    _ = store.put([2], n_consumers=1)
+
+    store.clear()
+
+    assert list(tmp_path.iterdir()) == []
+    assert store.n_spilled == 0
+
+
+def test__remove_temporary_directory_when_collected():
+    store = SpillStore(0)
+    scratch_dir = store.scratch_dir
+    assert scratch_dir.exists()
+
+    del store
+
+    assert not scratch_dir.exists()
+
+
+def test__spill_numpy_array_as_memmap(tmp_path: pathlib.Path):
+    np = pytest.importorskip("numpy")
+    store = SpillStore(0, scratch_dir=tmp_path)
+    array = np.arange(1000, dtype=np.float64)
+
+    _, stored = store.put(array, n_consumers=1)
+
+    assert isinstance(stored, np.memmap)
+    assert not stored.flags.writeable
+    np.testing.assert_array_equal(stored, array)
+
+
+@pytest.mark.parametrize(
+    "executor_class", [StreamExecutor, StreamThreadExecutor]
+)
+def test__run_with_spill_store(
+    executor_class: type[StreamExecutor] | type[StreamThreadExecutor],
+    tmp_path: pathlib.Path,
+):
+    def first() -> list[int]:
+        return list(range(100))
+
+    def second(values: list[int]) -> list[int]:
+        return [v * 2 for v in values]
+
+    def third(values: list[int], doubled: list[int]) -> int:
+        return sum(values) + sum(doubled)
+
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(first, second, third)
+    node1.precede(node2, node3, pipe=True)
+    node2.precede(node3, pipe=True)
+
+    store = SpillStore(0, scratch_dir=tmp_path)
+    result = executor_class(stream.construct(store=store)).run()
+
+    assert result == {"third": 4950 * 3}
+    # All files are removed after consumers finish.
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,173 @@
+import os
+import pathlib
+
+import pytest
+
+from dagstream import DagStream
+from dagstream.executor import StreamParallelExecutor, StreamWorkerPool
+from dagstream.transports import SharedMemoryTransport
+from dagstream.transports.shared_memory import SharedArray
+
+np = pytest.importorskip("numpy")
+
+
+def _list_blocks() -> set[str]:
+    shm_dir = pathlib.Path("/dev/shm")
+    if not shm_dir.exists():
+        pytest.skip("/dev/shm is not available.")
+    return {p.name for p in shm_dir.glob("dgs_*")}
+
+
+def create_array(n: int) -> "np.ndarray":
+    return np.arange(n, dtype=np.float64)
+
+
+def double(array: "np.ndarray") -> "np.ndarray":
+    assert not array.flags.writeable
+    return array * 2
+
+
+def add(*arrays: "np.ndarray") -> "np.ndarray":
+    return sum(arrays)
+
+
+def split(array: "np.ndarray") -> tuple:
+    return array[: len(array) // 2], {"rest": array[len(array) // 2 :]}
+
+
+def concat(values: tuple) -> "np.ndarray":
+    first, others = values
+    return np.concatenate([first, others["rest"]])
+
+
+def failed(array: "np.ndarray") -> None:
+    raise RuntimeError("failed")
+
+
+def test__encode_and_decode():
+    transport = SharedMemoryTransport(min_nbytes=0)
+    array = np.arange(10, dtype=np.int32)
+
+    encoded = transport.encode((array, [array], {"a": array}, 1))
+    assert isinstance(encoded[0], SharedArray)
+    assert isinstance(encoded[1][0], SharedArray)
+    assert isinstance(encoded[2]["a"], SharedArray)
+    assert encoded[3] == 1
+
+    decoded = transport.decode(encoded)
+    np.testing.assert_array_equal(decoded[0], array)
+    np.testing.assert_array_equal(decoded[2]["a"], array)
+    del decoded
+    transport.close()
+
+    materialized = transport.materialize(encoded)
+    np.testing.assert_array_equal(materialized[1][0], array)
+
+    transport.register(encoded, 0)
+    assert _list_blocks().isdisjoint(
+        {encoded[0].name, encoded[1][0].name, encoded[2]["a"].name}
+    )
+
+
+def test__small_arrays_are_not_shared():
+    transport = SharedMemoryTransport(min_nbytes=1024)
+    array = np.arange(10, dtype=np.int32)
+
+    assert transport.encode(array) is array
+
+
+def test__unlink_when_all_consumers_finish():
+    transport = SharedMemoryTransport(min_nbytes=0)
+    encoded = transport.encode(np.arange(10))
+
+    transport.register(encoded, 2)
+    transport.release(encoded)
+    assert encoded.name in _list_blocks()
+
+    transport.release(encoded)
+    assert encoded.name not in _list_blocks()
+
+
+def test__pickled_transport_has_no_handles():
+    import pickle
+
+    transport = SharedMemoryTransport(min_nbytes=0)
+    encoded = transport.encode(np.arange(10))
+    transport.register(encoded, 1)
+
+    restored = pickle.loads(pickle.dumps(transport))
+    assert restored._n_consumers == {}
+
+    transport.release_all()
+    assert encoded.name not in _list_blocks()
+
+
+def test__run_with_shared_memory_transport():
+    before = _list_blocks()
+
+    stream = DagStream()
+    node1, node2, node3, node4 = stream.emplace(
+        create_array, double, double, add
+    )
+    node1.precede(node2, node3, pipe=True)
+    node4.succeed(node1, node2, node3, pipe=True)
+
+    with StreamWorkerPool(2) as pool:
+        executor = StreamParallelExecutor(
+            stream.construct(),
+            pool=pool,
+            transport=SharedMemoryTransport(min_nbytes=0),
+        )
+        result = executor.run(first_args=(1000,), save_all_state=True)
+
+    expected = np.arange(1000, dtype=np.float64) * 5
+    np.testing.assert_array_equal(result["add"], expected)
+    np.testing.assert_array_equal(result["create_array"], np.arange(1000))
+    assert result["add"].flags.writeable
+    assert _list_blocks() == before
+
+
+def test__run_with_nested_results():
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(create_array, split, concat)
+    node1.precede(node2, pipe=True)
+    node2.precede(node3, pipe=True)
+
+    executor = StreamParallelExecutor(
+        stream.construct(), transport=SharedMemoryTransport(min_nbytes=0)
+    )
+    result = executor.run(first_args=(11,))
+
+    np.testing.assert_array_equal(result["concat"], np.arange(11))
+
+
+def test__release_blocks_when_error():
+    before = _list_blocks()
+
+    stream = DagStream()
+    node1, node2, node3 = stream.emplace(create_array, failed, double)
+    node1.precede(node2, node3, pipe=True)
+
+    executor = StreamParallelExecutor(
+        stream.construct(),
+        n_process=1,
+        transport=SharedMemoryTransport(min_nbytes=0),
+    )
+    with pytest.raises(RuntimeError):
+        executor.run(first_args=(100,))
+
+    assert _list_blocks() == before
+
+
+@pytest.mark.skipif(os.name != "posix", reason="depends on /dev/shm")
+def test__no_blocks_without_transport():
+    before = _list_blocks()
+
+    stream = DagStream()
+    node1, node2 = stream.emplace(create_array, add)
+    node1.precede(node2, pipe=True)
+
+    result = StreamParallelExecutor(stream.construct()).run(first_args=(10,))
+
+    np.testing.assert_array_equal(result["add"], np.arange(10))
+    assert _list_blocks() == before
@@ -0,0 +1,47 @@
+import json
+import math
+import pickle
+
+import pytest
+
+from dagstream.utils import LazyFunction, get_import_path
+
+
+def test__get_import_path():
+    assert get_import_path(math.sqrt) == "math:sqrt"
+    assert (
+        get_import_path(json.JSONEncoder.encode)
+        == "json.encoder:JSONEncoder.encode"
+    )
+    assert get_import_path(LazyFunction("math:sqrt")) == "math:sqrt"
+
+
+def test__cannot_get_import_path_of_local_function():
+    def sample():
+        pass
+
+    with pytest.raises(ValueError):
+        _ = get_import_path(sample)
+    with pytest.raises(ValueError):
+        _ = get_import_path(lambda: None)
+
+
+def test__resolve_when_called():
+    function = LazyFunction("math:sqrt")
+    assert not function.is_resolved
+
+    assert function(4) == 2.0
+    assert function.is_resolved
+    assert function.resolve() is math.sqrt
+
+
+def test__pickle_by_path():
+    function = pickle.loads(pickle.dumps(LazyFunction("math:sqrt")))
+
+    assert function.path == "math:sqrt"
+    assert not function.is_resolved
+
+
+def test__invalid_path():
+    with pytest.raises(ValueError):
+        _ = LazyFunction("math.sqrt")
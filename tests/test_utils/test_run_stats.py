@@ -0,0 +1,64 @@
+import sys
+
+import pytest
+
+from dagstream.utils import RunStats, estimate_nbytes
+
+
+class _Buffer:
+    def __init__(self, nbytes: int) -> None:
+        self.nbytes = nbytes
+
+
+def test__estimate_nbytes_uses_nbytes():
+    assert estimate_nbytes(_Buffer(100)) == 100
+
+
+def test__estimate_nbytes_of_containers():
+    values = [_Buffer(100), {"key": _Buffer(200)}]
+
+    expected = (
+        sys.getsizeof(values)
+        + 100
+        + sys.getsizeof(values[1])
+        + sys.getsizeof("key")
+        + 200
+    )
+    assert estimate_nbytes(values) == expected
+
+
+def test__estimate_nbytes_counts_shared_object_once():
+    buffer = _Buffer(100)
+
+    assert estimate_nbytes((buffer, buffer)) == sys.getsizeof((1, 2)) + 100
+
+
+def test__release_after_all_consumers():
+    stats = RunStats()
+    stats.add("a", _Buffer(100), ["b", "c"])
+    assert stats.live_bytes == 100
+
+    stats.release("b", ["a"])
+    assert stats.live_bytes == 100
+
+    stats.release("c", ["a"])
+    assert stats.live_bytes == 0
+    assert stats.peak_live_bytes == 100
+
+
+@pytest.mark.parametrize("keep, expected", [(True, 100), (False, 0)])
+def test__result_without_consumers(keep: bool, expected: int):
+    stats = RunStats()
+    stats.add("a", _Buffer(100), [], keep=keep)
+
+    assert stats.live_bytes == expected
+    assert stats.peak_live_bytes == 100
+
+
+def test__ignore_non_pipe_predecessors():
+    stats = RunStats()
+    stats.add("a", _Buffer(100), ["b"])
+
+    stats.release("c", ["a"])
+
+    assert stats.live_bytes == 100